@@ -69,6 +69,9 @@ class Config:
         # Application
         self.app = AppConfig(name, run_date)
 
+        # Database
+        self.database = DatabaseConfig()
+
     def get_config_class(self, class_name: str, default: Any) -> Any:
         """Get class.
 
@@ -181,14 +184,78 @@ class DatabaseConfig:
 
                 # Oracle - TNS
                 self.tns = to_bool(environ.get("DATABASE_TNS", default="true"))
-                self.tns_path = to_path(environ.get("DATABASE_TNS_PATH", default="/app/input/database/tns"))
+                self.tns_path = to_path(environ.get("DATABASE_TNS_PATH", default="/app/input/database/tns"), exists=False)
                 self.tns_alias = environ.get("DATABASE_TNS_ALIAS", default="")
 
+                # Oracle - Session pool
+                self.pool = to_bool(environ.get("DATABASE_POOL", default="false"))
+                self.pool_min = to_int(environ.get("DATABASE_POOL_MIN", default="1"))
+                self.pool_max = to_int(environ.get("DATABASE_POOL_MAX", default="4"))
+                self.pool_increment = to_int(environ.get("DATABASE_POOL_INCREMENT", default="1"))
+                # Seconds after which idle connections above the minimum are closed, 0 to keep them
+                self.pool_timeout = to_int(environ.get("DATABASE_POOL_TIMEOUT", default="0"))
+                # Seconds a connection can stay idle before being pinged on acquire, negative to disable
+                self.pool_ping_interval = to_int(environ.get("DATABASE_POOL_PING_INTERVAL", default="60"))
+                # SQL statements separated by semicolons, run once on every new session
+                self.pool_session_init = environ.get("DATABASE_POOL_SESSION_INIT", default="")
+
+                # Oracle - Scripts, maximum number of statements sent per round trip
+                self.script_batch_size = to_int(environ.get("DATABASE_SCRIPT_BATCH_SIZE", default="100"))
+
+                # Oracle - Statement cache, number of parsed statements kept per connection
+                self.stmt_cache_size = to_int(environ.get("DATABASE_STMT_CACHE_SIZE", default="20"))
+
+                # Oracle - Fetch sizing, target size of a fetch round trip expressed in bytes, then default number of rows per fetch round trip
+                # and returned with the execute round trip, adapted per query up to DATABASE_BATCH_SIZE rows
+                self.fetch_target_size = to_int(environ.get("DATABASE_FETCH_TARGET_SIZE", default="1048576"))
+                self.arraysize = to_int(environ.get("DATABASE_ARRAYSIZE", default="100"))
+                self.prefetchrows = to_int(environ.get("DATABASE_PREFETCHROWS", default="2"))
+
+                # Oracle - LOBs, fetched whole with the rows as str or bytes whatever their size, unless fetched as locators, one round trip per
+                # read, then read whole up to a size expressed in bytes for BLOBs and characters for CLOBs, and streamed above it
+                self.fetch_lobs = to_bool(environ.get("DATABASE_FETCH_LOBS", default="false"))
+                self.lob_inline_size = to_int(environ.get("DATABASE_LOB_INLINE_SIZE", default="1048576"))
+
+                # Oracle - DataFrame writes, memory budget of a chunk sent at once expressed in bytes, then direct path load in thin mode
+                self.write_buffer_size = to_int(environ.get("DATABASE_WRITE_BUFFER_SIZE", default="67108864"))
+                self.direct_path = to_bool(environ.get("DATABASE_DIRECT_PATH", default="true"))
+
             case "postgres":
                 self.name = environ.get("DATABASE_NAME", default="")
                 self.host = environ.get("DATABASE_HOST", default="")
                 self.port = to_int(environ.get("DATABASE_PORT", default="5432"))
 
+        # Deadline of a call, expressed in milliseconds, 0 to disable, applied as statement_timeout on PostgreSQL
+        self.call_timeout = to_int(environ.get("DATABASE_CALL_TIMEOUT", default="0"))
+
+        # Batch logic, number of rows per fetch or array DML round trip
+        self.batch_size = to_int(environ.get("DATABASE_BATCH_SIZE", default="10000"))
+
+        # Instrumentation, duration above which a query is logged as slow, expressed in milliseconds, 0 to disable
+        self.slow_query_threshold = to_int(environ.get("DATABASE_SLOW_QUERY_THRESHOLD", default="5000"))
+
+        # Parallel extraction, default number of partitions
+        self.parallel_partitions = to_int(environ.get("DATABASE_PARALLEL_PARTITIONS", default="4"))
+
+        # Export, Parquet row group size and Parquet or Arrow IPC compression codec
+        self.export_row_group_size = to_int(environ.get("DATABASE_EXPORT_ROW_GROUP_SIZE", default="100000"))
+        self.export_compression = environ.get("DATABASE_EXPORT_COMPRESSION", default="zstd")
+
+        # Query cache, in memory and optionally on disk
+        self.cache = to_bool(environ.get("DATABASE_CACHE", default="false"))
+        self.cache_disk = to_bool(environ.get("DATABASE_CACHE_DISK", default="true"))
+        self.cache_path = to_path(path, exists=False) if (path := environ.get("DATABASE_CACHE_PATH", default="")) else None
+        # Maximum size of the memory tier, expressed in bytes
+        self.cache_max_size = to_int(environ.get("DATABASE_CACHE_MAX_SIZE", default="268435456"))
+        # Maximum size of the disk tier, expressed in bytes, oldest results deleted first
+        self.cache_disk_max_size = to_int(environ.get("DATABASE_CACHE_DISK_MAX_SIZE", default="1073741824"))
+        # Time to live of a cached result, expressed in seconds
+        self.cache_ttl = to_int(environ.get("DATABASE_CACHE_TTL", default="3600"))
+
+        # Incremental extraction, watermarks stored under the output directory unless configured otherwise, ignored on full refresh
+        self.state_path = to_path(path, exists=False) if (path := environ.get("DATABASE_STATE_PATH", default="")) else None
+        self.full_refresh = to_bool(environ.get("DATABASE_FULL_REFRESH", default="false"))
+
         # Error logic
         self.stop_on_error = to_bool(environ.get("DATABASE_STOP_ON_ERROR", default="true"))
 
@@ -236,7 +303,7 @@ class LogConfig:
 
         # Extra fields
         general_fields = {"user_id", "csv", "wait"}
-        database_fields = {"database_type", "database_mode", "table", "record"}
+        database_fields = {"database_type", "database_mode", "table", "record", "sql_hash", "rows"}
 
         self.extra_fields = general_fields | database_fields
 
@@ -276,6 +343,37 @@ class AMQPConfig:
         # Circuit breaker pattern
         self.max_failed_messages = to_int(environ.get("AMQP_MAX_FAILED_MESSAGES", default="10"))
 
+        # Asynchronous publishing, from a background thread draining a bounded buffer
+        self.asynchronous = to_bool(environ.get("AMQP_ASYNC", default="false"))
+        self.queue_size = to_int(environ.get("AMQP_QUEUE_SIZE", default="10000"))
+        # Options: drop_oldest, drop_lowest, block
+        self.overflow_policy = environ.get("AMQP_OVERFLOW_POLICY", default="drop_oldest")
+        # Seconds given to the publisher thread to flush buffered messages on close
+        self.close_timeout = to_int(environ.get("AMQP_CLOSE_TIMEOUT", default="10"))
+
+        # Batching, several log messages per AMQP message, flushed by count, size or linger time expressed in milliseconds
+        # Options: none, ndjson, cloudevents. Batching publishes from the background thread, as in asynchronous mode
+        self.batch_format = environ.get("AMQP_BATCH_FORMAT", default="none")
+        self.batch_max_count = to_int(environ.get("AMQP_BATCH_MAX_COUNT", default="100"))
+        self.batch_max_bytes = to_int(environ.get("AMQP_BATCH_MAX_BYTES", default="1048576"))
+        self.batch_linger = to_int(environ.get("AMQP_BATCH_LINGER", default="200"))
+
+        # Publisher confirms, tracked asynchronously with at most a window of unconfirmed messages in flight, nacked or returned messages
+        # re-published up to a number of retries, waiting a number of seconds for confirms when the window is full and on close
+        self.confirm = to_bool(environ.get("AMQP_CONFIRM", default="false"))
+        self.confirm_window = to_int(environ.get("AMQP_CONFIRM_WINDOW", default="1000"))
+        self.confirm_retries = to_int(environ.get("AMQP_CONFIRM_RETRIES", default="3"))
+        self.confirm_timeout = to_int(environ.get("AMQP_CONFIRM_TIMEOUT", default="30"))
+
+        # Spool, unsent messages appended to segment files of a maximum size expressed in bytes, up to a maximum spool size, then replayed
+        # in order once the broker is reachable, at a maximum number of messages per second
+        self.spool = to_bool(environ.get("AMQP_SPOOL", default="false"))
+        if self.spool:
+            self.spool_path = to_path(environ.get("AMQP_SPOOL_PATH", default="/app/spool"), exists=False)
+        self.spool_max_size = to_int(environ.get("AMQP_SPOOL_MAX_SIZE", default="104857600"))
+        self.spool_segment_size = to_int(environ.get("AMQP_SPOOL_SEGMENT_SIZE", default="4194304"))
+        self.spool_replay_rate = to_int(environ.get("AMQP_SPOOL_REPLAY_RATE", default="100"))
+
 
 # ---------------------------------------------------------------------------- #
 #               ------- CloudEvents Config ------
@@ -0,0 +1,321 @@
+"""Module used to cache query results in memory and on disk.
+
+Typical usage example:
+    cache = QueryCache(max_size=256 * 1024**2, ttl=3600, path=Path("/app/output/cache"), max_disk_size=1024**3)
+    key = cache.key(query, parameters)
+    if (data := cache.get(key)) is None:
+        data = run(query, parameters)
+        cache.put(key, data, to_table_names(query))
+    cache.invalidate("schema.table")
+"""
+
+# Standard Library
+from collections import OrderedDict
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from re import IGNORECASE, findall
+from tempfile import NamedTemporaryFile
+from threading import RLock
+from time import monotonic, time
+from typing import Any
+
+# Third-party
+import polars as pl
+
+# Local Application
+from app_name.event.logger.log import log
+
+TABLE_PATTERN = r"\b(?:from|join|into|update)\s+([\w$#.\"]+)"
+
+
+def to_table_names(query: str) -> set[str]:
+    """Extract the table names a SQL query reads from or writes to.
+
+    Only plain FROM, JOIN, INTO and UPDATE clauses are detected, pass table names explicitly for anything more complex.
+
+    Args:
+        query (str): SQL query.
+
+    Returns:
+        set[str]: lower-cased table names, schema included when present.
+    """
+    return {name.replace('"', "").lower() for name in findall(TABLE_PATTERN, query, IGNORECASE)}
+
+
+class QueryCache:
+    """Two-tier query result cache: in-process LRU bounded in size and age, backed by Parquet files.
+
+    Entries are keyed by a hash of the SQL text and its bind parameters. Each entry remembers the tables it depends on, so that writing to a
+    table can invalidate every cached result built from it. An entry expires ttl seconds after it was first cached, in both tiers: storing
+    it again or reading it back from disk does not extend its life. Expired files are deleted from the disk tier when it is loaded and on
+    every store, then the oldest ones beyond its maximum size.
+    """
+
+    def __init__(self, max_size: int, ttl: int, path: Path | None = None, max_disk_size: int = 1024**3) -> None:
+        """Initialize class.
+
+        Args:
+            max_size (int): maximum size of the memory tier, expressed in bytes.
+            ttl (int): time to live of an entry, expressed in seconds.
+            path (Path | None, optional): directory of the disk tier, disabled if None. Defaults to None.
+            max_disk_size (int, optional): maximum size of the disk tier, expressed in bytes. Defaults to 1 GiB.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.max_disk_size = max_disk_size
+        self._lock = RLock()
+
+        # Memory tier: key -> (monotonic expiry, size, data), least recently used first
+        self._entries: OrderedDict[str, tuple[float, int, pl.DataFrame]] = OrderedDict()
+        self._size = 0
+
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+        self.evictions = 0
+
+        # Entries of both tiers: key -> tables, wall clock expiry and file size, saved as the disk tier index, oldest first
+        self._index: dict[str, dict[str, Any]] = {}
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._index = self._load_index()
+            self._prune()
+            self._save_index()
+
+    @staticmethod
+    def key(query: str, parameters: list | tuple | dict | None = None) -> str:
+        """Compute the cache key of a query.
+
+        Args:
+            query (str): SQL query.
+            parameters (list | tuple | dict | None, optional): bind parameters. Defaults to None.
+
+        Returns:
+            str: SHA-256 hex digest of the SQL text and bind parameters.
+        """
+        payload = dumps([query, parameters], sort_keys=True, default=str)
+        return sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        """Get a cached result, from memory first then from disk.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            pl.DataFrame | None: cached result, None on miss or expiry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expiry, _, data = entry
+                if expiry > monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits["memory"] += 1
+                    return data
+                self._remove(key)
+
+            data = self._read(key)
+            if data is not None:
+                self.hits["disk"] += 1
+                self._store(key, data, self._index[key]["expiry"])
+                return data
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, data: pl.DataFrame, tables: set[str]) -> None:
+        """Cache a result in both tiers, keeping the expiry of the entry it replaces if still live.
+
+        Args:
+            key (str): cache key.
+            data (pl.DataFrame): query result.
+            tables (set[str]): tables the result depends on.
+        """
+        with self._lock:
+            now = time()
+            entry = self._index.get(key)
+            expiry = entry["expiry"] if entry is not None and entry["expiry"] > now else now + self.ttl
+            self._store(key, data, expiry)
+            if key in self._entries or self.path is not None:
+                self._index[key] = {"tables": sorted(table.lower() for table in tables), "expiry": expiry, "size": 0}
+            if self.path is not None:
+                self._index[key]["size"] = self._write(key, data)
+                self._prune()
+                self._save_index()
+
+    def invalidate(self, table: str) -> int:
+        """Drop every cached result depending on a table.
+
+        Args:
+            table (str): table name, schema included if used in queries.
+
+        Returns:
+            int: number of entries dropped.
+        """
+        table = table.lower()
+        with self._lock:
+            keys = [key for key, entry in self._index.items() if table in entry["tables"]]
+            for key in keys:
+                self._delete(key)
+            if keys and self.path is not None:
+                self._save_index()
+        log().logger.debug("Invalidated %s cached results.", len(keys), extra={"table": table})
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            if self.path is not None:
+                for key in self._index:
+                    self._file(key).unlink(missing_ok=True)
+            self._index.clear()
+            if self.path is not None:
+                self._save_index()
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            dict[str, Any]: hits per tier, misses, evictions and memory tier usage.
+        """
+        with self._lock:
+            return {
+                "memory_hits": self.hits["memory"],
+                "disk_hits": self.hits["disk"],
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size": self._size,
+            }
+
+    def _store(self, key: str, data: pl.DataFrame, expiry: float) -> None:
+        """Store a result in the memory tier, evicting least recently used entries beyond the maximum size.
+
+        Args:
+            key (str): cache key.
+            data (pl.DataFrame): query result.
+            expiry (float): wall clock time the entry expires at.
+        """
+        size = int(data.estimated_size())
+        if size > self.max_size:
+            return
+
+        self._remove(key)
+        self._entries[key] = (monotonic() + expiry - time(), size, data)
+        self._size += size
+        while self._size > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Remove a result from the memory tier, and its dependencies if there is no disk tier.
+
+        Args:
+            key (str): cache key.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+        if self.path is None:
+            self._index.pop(key, None)
+
+    def _delete(self, key: str) -> None:
+        """Remove a result from both tiers.
+
+        Args:
+            key (str): cache key.
+        """
+        self._remove(key)
+        self._index.pop(key, None)
+        if self.path is not None:
+            self._file(key).unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Delete expired results from the disk tier, then the oldest ones beyond its maximum size."""
+        now = time()
+        for key in [key for key, entry in self._index.items() if entry["expiry"] <= now]:
+            self._delete(key)
+
+        size = sum(entry["size"] for entry in self._index.values())
+        for key in list(self._index):
+            if size <= self.max_disk_size:
+                break
+            size -= self._index[key]["size"]
+            self._delete(key)
+            self.evictions += 1
+
+    def _file(self, key: str) -> Path:
+        """Get the Parquet file path of a cache key.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            Path: Parquet file path.
+        """
+        return self.path.joinpath(f"{key}.parquet")
+
+    def _read(self, key: str) -> pl.DataFrame | None:
+        """Read a result from the disk tier, if present and not expired.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            pl.DataFrame | None: cached result, None on miss or expiry.
+        """
+        if self.path is None or key not in self._index:
+            return None
+
+        if self._index[key]["expiry"] <= time():
+            self._delete(key)
+            self._save_index()
+            return None
+
+        file = self._file(key)
+        try:
+            return pl.read_parquet(file)
+        except (OSError, pl.exceptions.ComputeError) as err:
+            log().logger.warning("Error reading cached result %s: %s", file.name, err)
+            self._delete(key)
+        return None
+
+    def _write(self, key: str, data: pl.DataFrame) -> int:
+        """Write a result to the disk tier atomically, so that readers never see a partial file.
+
+        Args:
+            key (str): cache key.
+            data (pl.DataFrame): query result.
+
+        Returns:
+            int: file size, expressed in bytes.
+        """
+        with NamedTemporaryFile("wb", dir=self.path, suffix=".tmp", delete=False) as file:
+            data.write_parquet(file)
+        return Path(file.name).replace(self._file(key)).stat().st_size
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """Load the disk tier index.
+
+        Returns:
+            dict[str, dict[str, Any]]: cache keys, the tables they depend on, their expiry and their file size.
+        """
+        file = self.path.joinpath("index.json")
+        try:
+            return loads(file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, JSONDecodeError) as err:
+            log().logger.warning("Error reading cache index, starting empty: %s", err)
+            return {}
+
+    def _save_index(self) -> None:
+        """Save the disk tier index atomically."""
+        with NamedTemporaryFile("w", encoding="utf-8", dir=self.path, suffix=".tmp", delete=False) as file:
+            file.write(dumps(self._index))
+        Path(file.name).replace(self.path.joinpath("index.json"))
@@ -0,0 +1,150 @@
+"""Module used to track in-flight database calls, to cancel them on deadline or interrupt.
+
+Typical usage example:
+    active_calls().add(connection)
+    active_calls().label(connection, query)
+    cursor.execute(query)
+    active_calls().remove(connection)
+
+    # From a watchdog thread, or from a signal handler in thin mode
+    cancel_calls()
+
+In thick mode a call blocks in the Oracle Client library without releasing control to the interpreter, so a Python signal handler only
+runs once that call has returned, and cancel_calls() from the SIGINT handler has nothing left to cancel. Bound calls with
+DATABASE_CALL_TIMEOUT there, or call cancel_calls() from a watchdog thread, which runs while the main thread waits on the database.
+"""
+
+# Standard Library
+from threading import RLock
+from typing import Any
+
+# Third-party
+from oracledb import Error
+
+# Local Application
+from app_name.database.stats import to_sql_hash
+from app_name.event.logger.log import log
+
+# Error codes raised by a call interrupted by Connection.cancel() or by its call timeout
+CANCEL_ERRORS = {"ORA-01013", "DPY-4024"}
+
+
+def is_cancelled(err: Exception) -> bool:
+    """Whether a database error was raised by a cancelled or timed out call.
+
+    Args:
+        err (Exception): database error.
+
+    Returns:
+        bool: True if the call was cancelled.
+    """
+    return bool(err.args) and getattr(err.args[0], "full_code", None) in CANCEL_ERRORS
+
+
+class ActiveCalls:
+    """Class tracking the connections running a call, and the statement they run."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        # Connection and statement, per connection identity
+        self.calls: dict[int, tuple[Any, str | None]] = {}
+        # Reentrant, so that a signal handler interrupting the main thread while it registers a call can still take it
+        self.lock = RLock()
+
+    def add(self, connection: Any) -> None:
+        """Register a connection starting a call.
+
+        Args:
+            connection (Any): database connection.
+        """
+        with self.lock:
+            self.calls[id(connection)] = (connection, None)
+
+    def label(self, connection: Any, query: str) -> None:
+        """Record the statement run by a connection.
+
+        Args:
+            connection (Any): database connection.
+            query (str): SQL statement.
+        """
+        with self.lock:
+            if id(connection) in self.calls:
+                self.calls[id(connection)] = (connection, query)
+
+    def query(self, connection: Any) -> str | None:
+        """Get the statement run by a connection.
+
+        Args:
+            connection (Any): database connection.
+
+        Returns:
+            str | None: SQL statement, None if unknown.
+        """
+        with self.lock:
+            return self.calls.get(id(connection), (None, None))[1]
+
+    def remove(self, connection: Any) -> None:
+        """Unregister a connection once its call is over.
+
+        Args:
+            connection (Any): database connection.
+        """
+        with self.lock:
+            self.calls.pop(id(connection), None)
+
+    def cancel(self) -> int:
+        """Cancel the calls in flight, they fail with ORA-01013.
+
+        The calls are copied under the lock, then cancelled outside of it, so that the cancel round trips do not block registrations. Safe to
+        call from a signal handler or from another thread, see the module docstring for thick mode.
+
+        Returns:
+            int: number of calls cancelled.
+        """
+        with self.lock:
+            calls = list(self.calls.values())
+        for connection, query in calls:
+            sql_hash = to_sql_hash(query or "")
+            log().logger.warning("Cancelling query %s...", sql_hash, extra={"sql_hash": sql_hash})
+            try:
+                connection.cancel()
+            except Error as err:
+                log().logger.error("Error cancelling query %s: %s", sql_hash, err, extra={"sql_hash": sql_hash})
+        return len(calls)
+
+
+# Global
+_active_calls_instance = None
+
+
+def set_active_calls(instance: ActiveCalls) -> None:
+    """Set global instance.
+
+    Args:
+        instance (ActiveCalls): active calls instance.
+    """
+    global _active_calls_instance
+    _active_calls_instance = instance
+
+
+def active_calls() -> ActiveCalls:
+    """Get global instance, instantiate it if None.
+
+    Returns:
+        ActiveCalls: active calls instance.
+    """
+    global _active_calls_instance
+    if _active_calls_instance is None:
+        _active_calls_instance = ActiveCalls()
+    return _active_calls_instance
+
+
+def cancel_calls() -> int:
+    """Cancel the database calls in flight, if any.
+
+    Returns:
+        int: number of calls cancelled.
+    """
+    if _active_calls_instance is None:
+        return 0
+    return _active_calls_instance.cancel()
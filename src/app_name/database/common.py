@@ -0,0 +1,195 @@
+"""Module providing helpers shared by the database backends: bind parameters, DML statements and streamed exports.
+
+Typical usage example:
+    binds = to_bind_parameters({"id": 1}, name="A")
+    statement = to_insert_statement("orders", ["id", "name"], paramstyle="format")
+    data = to_lazy_frame(database.select_df_iter(query))
+    sink_frame(data, to_export_path("orders.parquet", "parquet"), "parquet", "zstd", 100000)
+"""
+
+# Standard Library
+from collections.abc import Iterator
+from itertools import chain
+from pathlib import Path
+
+# Third-party
+import polars as pl
+from polars.io.plugins import register_io_source
+
+# Local Application
+from app_name.common.config import get_config_value
+
+# Bind placeholders of the DB-API paramstyles used by the drivers: oracledb numeric (:1) and psycopg format (%s)
+PARAMSTYLES = {"numeric", "format"}
+
+# File formats of streamed exports
+EXPORT_FORMATS = {"parquet", "ipc", "csv"}
+
+# Compression codecs supported per export format, CSV files being written uncompressed whatever the codec
+EXPORT_COMPRESSIONS = {"parquet": {"uncompressed", "snappy", "lz4", "zstd"}, "ipc": {"uncompressed", "lz4", "zstd"}}
+
+
+class ScriptError(Exception):
+    """Custom exception for SQL script statements failing with DATABASE_STOP_ON_ERROR enabled, raised once the script is rolled back."""
+
+
+def to_bind_parameters(parameters: list | tuple | dict | None = None, **params) -> list | tuple | dict | None:  # noqa: ANN003
+    """Merge positional or named bind parameters with keyword bind parameters.
+
+    [1, 'A'] -> [1, 'A'] for :1, :2 placeholders
+    {"id": 1}, name='A' -> {"id": 1, "name": 'A'} for :id, :name placeholders
+
+    Args:
+        parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+        **params: named bind parameters.
+
+    Returns:
+        list | tuple | dict | None: bind parameters ready for Cursor.execute(), None if there is none.
+
+    Raises:
+        TypeError: if positional and keyword bind parameters are mixed.
+    """
+    if not params:
+        return parameters
+    if parameters is None:
+        return params
+    if isinstance(parameters, dict):
+        return parameters | params
+
+    message = "Cannot mix positional and keyword bind parameters."
+    raise TypeError(message)
+
+
+def to_bind_marker(position: int, paramstyle: str = "numeric") -> str:
+    """Build a positional bind placeholder.
+
+    Args:
+        position (int): bind position, starting at 1.
+        paramstyle (str, optional): DB-API paramstyle: numeric (:1) or format (%s). Defaults to "numeric".
+
+    Returns:
+        str: bind placeholder.
+
+    Raises:
+        ValueError: if the paramstyle is not supported.
+    """
+    match paramstyle:
+        case "numeric":
+            return f":{position}"
+        case "format":
+            return "%s"
+        case _:
+            message = f"Unsupported paramstyle: {paramstyle}"
+            raise ValueError(message)
+
+
+def to_insert_statement(table: str, columns: list[str], paramstyle: str = "numeric") -> str:
+    """Build an INSERT statement with one positional bind per column.
+
+    Args:
+        table (str): target table name.
+        columns (list[str]): inserted column names.
+        paramstyle (str, optional): bind placeholder style, see to_bind_marker(). Defaults to "numeric".
+
+    Returns:
+        str: INSERT statement, bound in columns order.
+    """
+    binds = ", ".join(to_bind_marker(i, paramstyle) for i in range(1, len(columns) + 1))
+    return f"insert into {table} ({', '.join(columns)}) values ({binds})"  # noqa: S608
+
+
+def to_update_statement(table: str, columns: list[str], keys: list[str], paramstyle: str = "numeric") -> str:
+    """Build an UPDATE statement with one positional bind per updated and key column.
+
+    Args:
+        table (str): target table name.
+        columns (list[str]): updated column names.
+        keys (list[str]): key column names identifying the rows to update.
+        paramstyle (str, optional): bind placeholder style, see to_bind_marker(). Defaults to "numeric".
+
+    Returns:
+        str: UPDATE statement, bound in columns then keys order.
+    """
+    assignments = ", ".join(f"{column} = {to_bind_marker(i, paramstyle)}" for i, column in enumerate(columns, start=1))
+    conditions = " and ".join(f"{key} = {to_bind_marker(i, paramstyle)}" for i, key in enumerate(keys, start=len(columns) + 1))
+    return f"update {table} set {assignments} where {conditions}"  # noqa: S608
+
+
+def to_lazy_frame(batches: Iterator[pl.DataFrame]) -> pl.LazyFrame | None:
+    """Wrap a stream of DataFrame batches into a LazyFrame, so that Polars sinks can write it without collecting it.
+
+    The LazyFrame reads the stream, so it can only be collected or sunk once.
+
+    Args:
+        batches (Iterator[pl.DataFrame]): DataFrame batches sharing the same schema.
+
+    Returns:
+        pl.LazyFrame | None: lazy frame over the batches, None if there is none.
+    """
+    first = next(batches, None)
+    if first is None:
+        return None
+
+    def source(with_columns: list[str] | None, predicate: pl.Expr | None, n_rows: int | None, batch_size: int | None) -> Iterator[pl.DataFrame]:  # noqa: ARG001
+        """Yield batches, applying the projection, filter and row limit pushed down by Polars."""
+        remaining = n_rows
+        for batch in chain([first], batches):
+            data = batch if with_columns is None else batch.select(with_columns)
+            data = data if predicate is None else data.filter(predicate)
+            if remaining is not None:
+                data = data.head(remaining)
+                remaining -= data.height
+            yield data
+            if remaining == 0:
+                return
+
+    return register_io_source(source, schema=first.schema)
+
+
+def to_export_path(path: Path | str, file_format: str) -> Path:
+    """Resolve the output file of an export, creating its parent directories.
+
+    Args:
+        path (Path | str): output file path, relative to the output directory unless absolute.
+        file_format (str): file format: parquet, ipc or csv.
+
+    Returns:
+        Path: output file path.
+
+    Raises:
+        ValueError: if the file format is not supported.
+    """
+    if file_format not in EXPORT_FORMATS:
+        message = f"Unsupported export format: {file_format}"
+        raise ValueError(message)
+
+    file_path = get_config_value("app", "output_path").joinpath(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    return file_path
+
+
+def sink_frame(data: pl.LazyFrame, file_path: Path, file_format: str, compression: str, row_group_size: int) -> None:
+    """Write a lazy frame to a Parquet, Arrow IPC or CSV file, batch by batch.
+
+    Args:
+        data (pl.LazyFrame): lazy frame, see to_lazy_frame().
+        file_path (Path): output file path.
+        file_format (str): file format: parquet, ipc or csv.
+        compression (str): Parquet or Arrow IPC compression codec, ignored for CSV.
+        row_group_size (int): number of rows per Parquet row group.
+
+    Raises:
+        ValueError: if the compression codec is not supported by the file format.
+    """
+    if file_format in EXPORT_COMPRESSIONS and compression not in EXPORT_COMPRESSIONS[file_format]:
+        supported = ", ".join(sorted(EXPORT_COMPRESSIONS[file_format]))
+        message = f"Unsupported {file_format} export compression: {compression}, expected one of {supported}"
+        raise ValueError(message)
+
+    match file_format:
+        case "parquet":
+            data.sink_parquet(file_path, compression=compression, row_group_size=row_group_size)
+        case "ipc":
+            data.sink_ipc(file_path, compression=compression)
+        case "csv":
+            data.sink_csv(file_path)
@@ -0,0 +1,137 @@
+"""Module used to read Oracle LOBs inline or by chunks.
+
+LOBs fetched as locators cost a round trip per read, small ones included. The first read fetches up to the size threshold plus one: a LOB
+that fits is returned whole, a larger one is streamed from where that read stopped, so the size of the LOB is never asked for. A stream
+reads through the cursor it was fetched by, so it is only valid until that cursor is closed.
+
+Typical usage example:
+    for rows in database.select_iter("select id, body from documents", fetch_lobs=True):
+        for document_id, document in rows:
+            if isinstance(document, LobStream):
+                document.write_to(Path(f"/app/output/{document_id}.txt"))
+"""
+
+# Standard Library
+from collections.abc import Iterator
+from pathlib import Path
+
+# Third-party
+import oracledb
+from oracledb import LOB
+
+# Size of the pieces a large LOB is read by, rounded down to a multiple of the LOB chunk size, expressed in bytes or characters
+LOB_READ_SIZE = 1048576
+
+
+class LobStream:
+    """Class reading a LOB by chunks, so that it is never held in memory as a whole, until the cursor it was fetched by is closed."""
+
+    def __init__(self, lob: LOB, head: str | bytes = "") -> None:
+        """Initialize class.
+
+        Args:
+            lob (LOB): LOB locator, read on the connection it was fetched from.
+            head (str | bytes, optional): beginning of the LOB, already read. Defaults to "".
+        """
+        self.lob = lob
+        self.head = head
+        chunk_size = lob.getchunksize() or LOB_READ_SIZE
+        self.read_size = chunk_size * max(1, LOB_READ_SIZE // chunk_size)
+        self.closed = False
+
+    def check(self) -> None:
+        """Ensure the LOB can still be read.
+
+        Raises:
+            ValueError: if the cursor the LOB was fetched by is closed, and its connection possibly released to the pool.
+        """
+        if self.closed:
+            message = "LOB stream read after its cursor was closed, read it while iterating over select_iter() instead"
+            raise ValueError(message)
+
+    def close(self) -> None:
+        """Mark the LOB as no longer readable, once its cursor is closed."""
+        self.closed = True
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether the LOB is a BLOB or a BFILE, read as bytes, rather than a CLOB or NCLOB, read as str."""
+        return self.lob.type in {oracledb.DB_TYPE_BLOB, oracledb.DB_TYPE_BFILE}
+
+    def __iter__(self) -> Iterator[str | bytes]:
+        """Read the LOB by chunks, one round trip per chunk, until a chunk comes back short.
+
+        Offsets and amounts are expressed in bytes for BLOBs and in characters for CLOBs, so the offset advances by the length of the chunk
+        read, a decoded str for CLOBs, never by its encoded size.
+
+        Yields:
+            str | bytes: LOB chunk.
+        """
+        self.check()
+        if self.head:
+            yield self.head
+        offset = len(self.head) + 1
+        while True:
+            self.check()
+            data = self.lob.read(offset, self.read_size)
+            if data:
+                yield data
+            if len(data) < self.read_size:
+                break
+            offset += len(data)
+
+    def read(self) -> str | bytes:
+        """Read the whole LOB in memory.
+
+        Returns:
+            str | bytes: LOB content.
+        """
+        self.check()
+        return self.lob.read()
+
+    def write_to(self, path: Path) -> int:
+        """Write the LOB to a file, chunk by chunk, BLOBs as is and CLOBs encoded in UTF-8.
+
+        Args:
+            path (Path): output file path, parent directories are created if missing.
+
+        Returns:
+            int: number of bytes or characters written.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with path.open("wb" if self.is_binary else "w", encoding=None if self.is_binary else "utf-8") as file:
+            for data in self:
+                written += file.write(data)
+        return written
+
+
+def to_lob_value(lob: LOB, inline_size: int, streams: list[LobStream]) -> str | bytes | LobStream:
+    """Read a small LOB whole, or wrap a large one into a chunked stream, in a single round trip.
+
+    Args:
+        lob (LOB): LOB locator.
+        inline_size (int): maximum size read whole, expressed in bytes for BLOBs and characters for CLOBs.
+        streams (list[LobStream]): streams of the cursor, closed with it.
+
+    Returns:
+        str | bytes | LobStream: LOB content, or stream over it.
+    """
+    data = lob.read(1, inline_size + 1)
+    if len(data) <= inline_size:
+        return data
+    stream = LobStream(lob, data)
+    streams.append(stream)
+    return stream
+
+
+def to_materialized_rows(rows: list) -> list:
+    """Read the LOB streams of records whole, so that they outlive their cursor.
+
+    Args:
+        rows (list): records.
+
+    Returns:
+        list: records, LOB streams replaced by their content.
+    """
+    return [tuple(value.read() if isinstance(value, LobStream) else value for value in row) for row in rows]
@@ -1,19 +1,46 @@
 """Module used to interact with the Oracle database."""
 
 # Standard Library
-from collections.abc import Callable
-from functools import wraps
-from time import sleep
+from asyncio import AbstractEventLoop, new_event_loop
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial, wraps
+from inspect import isgeneratorfunction
+from itertools import chain, islice
+from pathlib import Path
+from queue import Full, Queue
+from re import IGNORECASE, match
+from threading import Event, Lock, Timer
+from time import perf_counter, sleep
 from typing import Any
+from weakref import WeakKeyDictionary
 
 # Third-party
 import oracledb
-from oracledb import Cursor, Error
+import polars as pl
+from oracledb import Connection, ConnectionPool, Cursor, DbObject, DbObjectType, Error, FetchInfo, PipelineOpResult, Var
 
 # Local Application
-from app_name.common.config import DatabaseConfig, get_config_class
+from app_name.common.config import DatabaseConfig, get_config_class, get_config_value
+from app_name.database.cache import QueryCache, to_table_names
+from app_name.database.cancel import active_calls, is_cancelled
+from app_name.database.common import ScriptError, sink_frame, to_bind_parameters, to_export_path, to_insert_statement, to_lazy_frame, to_update_statement
+from app_name.database.lob import LobStream, to_lob_value, to_materialized_rows
+from app_name.database.oracle_async import AsyncOracle
+from app_name.database.oracle_common import Pipeline, to_collection_type, to_statement_list
+from app_name.database.sizing import FetchSizer, to_observed_row_size
+from app_name.database.state import WatermarkStore
+from app_name.database.stats import query_stats, to_fetch_metrics, to_sql_hash, track_query
+from app_name.database.templates import SqlTemplates
 from app_name.event.logger.log import log
 
+# Maximum size of a VARCHAR2 bind in PL/SQL, longer statements are bound as CLOB
+PLSQL_VARCHAR_MAX_SIZE = 32767
+
+# Highest row number of a block, so that ROWID ranges cover whole blocks
+ROWID_MAX_ROW = 32767
+
 
 def to_literal(variable: Any) -> str:
     """Convert Python variable to Oracle SQL literal.
@@ -67,19 +94,53 @@ def to_literal_list(variables: list[Any]) -> str:
     return ", ".join(to_literal(variable) for variable in variables)
 
 
-def to_statement_list(query: str) -> list[str]:
-    """Split SQL query on semicolons.
+def to_collection_rows(bind: str, alias: str = "column_value") -> str:
+    """Select the elements of a collection bind variable as rows.
+
+    Unlike to_literal_list and to_cte_union_rows, the statement text does not depend on the list, and the 1000 elements IN-list limit does not
+    apply.
+
+    col in ({to_collection_rows("ids")}) -> col in (select column_value as column_value from table(:ids))
+    with names as ({to_collection_rows("names", "name")}) -> with names as (select column_value as name from table(:names))
+
+    Args:
+        bind (str): bind variable name, bound to a list.
+        alias (str, optional): column alias. Defaults to "column_value".
+
+    Returns:
+        str: SQL subquery ready to be spliced into an IN condition or a CTE body.
+    """
+    return f"select column_value as {alias} from table(:{bind})"  # noqa: S608
+
 
-    Assume semicolons terminate statements and do not appear inside string literals.
+def is_query(statement: str) -> bool:
+    """Check whether a statement returns rows.
 
     Args:
-        query(str): multi-lines SQL query.
+        statement (str): SQL statement, as returned by to_statement_list().
 
     Returns:
-        list: SQL statement list.
+        bool: whether the statement is a SELECT or WITH query.
     """
-    statements = [statement.strip() for statement in query.split(";")]
-    return [statement for statement in statements if statement]
+    return match(r"(select|with)\b", statement, IGNORECASE) is not None
+
+
+def to_script_block(size: int) -> str:
+    """Build an anonymous PL/SQL block running statements bound as :s1 to :sN.
+
+    The block text only depends on the number of statements, so it is parsed once per size. :t0 to :tN receive a timestamp before the first
+    and after every statement. On error, :failed receives the position of the failing statement and :error its message.
+
+    Args:
+        size (int): number of statements.
+
+    Returns:
+        str: anonymous PL/SQL block.
+    """
+    lines = ["declare", "    position pls_integer := 0;", "begin", "    :t0 := localtimestamp;"]
+    lines += [f"    position := {i}; execute immediate :s{i}; :t{i} := localtimestamp;" for i in range(1, size + 1)]
+    lines += ["exception", "    when others then", "        :failed := position;", "        :error := sqlerrm;", "end;"]
+    return "\n".join(lines)
 
 
 def to_cte_union_rows(values: list[str], alias: str = "name", table: str = "dual") -> str:
@@ -109,6 +170,160 @@ def to_cte_union_rows(values: list[str], alias: str = "name", table: str = "dual
     return "\n".join(rows)
 
 
+def to_merge_statement(table: str, columns: list[str], keys: list[str]) -> str:
+    """Build a MERGE statement upserting one row of positional binds.
+
+    Args:
+        table (str): target table name.
+        columns (list[str]): merged column names, keys included.
+        keys (list[str]): key column names used to match existing rows.
+
+    Returns:
+        str: MERGE statement, bound in columns order.
+    """
+    source = ", ".join(f":{i} as {column}" for i, column in enumerate(columns, start=1))
+    conditions = " and ".join(f"t.{key} = s.{key}" for key in keys)
+    statement = f"merge into {table} t using (select {source} from dual) s on ({conditions})"  # noqa: S608
+
+    updated = [column for column in columns if column not in keys]
+    if updated:
+        assignments = ", ".join(f"t.{column} = s.{column}" for column in updated)
+        statement += f" when matched then update set {assignments}"
+
+    values = ", ".join(f"s.{column}" for column in columns)
+    return f"{statement} when not matched then insert ({', '.join(columns)}) values ({values})"  # noqa: S608
+
+
+def to_chunk_rows(data: pl.DataFrame, budget: int) -> int:
+    """Compute the number of DataFrame rows fitting in a memory budget.
+
+    Args:
+        data (pl.DataFrame): DataFrame to split.
+        budget (int): memory budget of a chunk, expressed in bytes.
+
+    Returns:
+        int: number of rows per chunk, at least 1.
+    """
+    if data.height == 0:
+        return 1
+    row_size = max(1, data.estimated_size() // data.height)
+    return max(1, budget // row_size)
+
+
+def to_rowid_extents_query(owner: str | None = None) -> str:
+    """Build a query listing the extents of a table, in ROWID order, with the first and last ROWID they can hold.
+
+    Partitioned tables have one segment per partition, each with its own data object number.
+
+    Args:
+        owner (str | None, optional): table owner, read from DBA_EXTENTS, bound as :owner. Defaults to the current user, read from USER_EXTENTS.
+
+    Returns:
+        str: query bound with :table_name, returning the low ROWID, high ROWID and number of blocks of each extent.
+    """
+    views, owned = ("dba", " and o.owner = e.owner and e.owner = :owner") if owner else ("user", "")
+    return (
+        f"select dbms_rowid.rowid_create(1, o.data_object_id, e.relative_fno, e.block_id, 0), "  # noqa: S608
+        f"dbms_rowid.rowid_create(1, o.data_object_id, e.relative_fno, e.block_id + e.blocks - 1, {ROWID_MAX_ROW}), e.blocks "
+        f"from {views}_extents e join {views}_objects o on o.object_name = e.segment_name and o.object_type = e.segment_type "
+        f"and decode(o.subobject_name, e.partition_name, 1, 0) = 1{owned} "
+        "where e.segment_name = :table_name and e.segment_type like 'TABLE%' "
+        "order by o.data_object_id, e.relative_fno, e.block_id"
+    )
+
+
+def to_rowid_ranges(extents: list[tuple[str, str, int]], partitions: int) -> list[tuple[str, str]]:
+    """Group consecutive extents into ROWID ranges holding about the same number of blocks.
+
+    Extents are in ROWID order, so a range from the first ROWID of an extent to the last ROWID of a later one only covers the extents between
+    them.
+
+    Args:
+        extents (list[tuple[str, str, int]]): low ROWID, high ROWID and number of blocks of each extent, see to_rowid_extents_query().
+        partitions (int): number of ranges, fewer if the table has fewer extents.
+
+    Returns:
+        list[tuple[str, str]]: [low, high] ROWID bounds of each range.
+    """
+    total = sum(blocks for _, _, blocks in extents)
+    ranges: list[tuple[str, str]] = []
+    bucket = -1
+    before = 0
+    for low, high, blocks in extents:
+        # Bucket of the middle block of the extent, so that large extents do not all land in the bucket they start in
+        if (index := min(partitions - 1, (2 * before + blocks) * partitions // (2 * total))) != bucket:
+            ranges.append((low, high))
+            bucket = index
+        else:
+            ranges[-1] = (ranges[-1][0], high)
+        before += blocks
+    return ranges
+
+
+def to_partition_queries(
+    query: str, column: str, method: str = "hash", partitions: int = 4, ranges: list[tuple[Any, Any]] | None = None
+) -> list[tuple[str, dict]]:
+    """Split a query into partitions covering its whole result, each one with its own bind parameters.
+
+    Methods:
+      hash: ORA_HASH buckets of a column.
+      rowid: [low, high] ROWID ranges, see to_rowid_ranges(), the query must select the ROWID of the table as column.
+      range: [low, high) ranges of a column.
+
+    Args:
+        query (str): SQL query, with named bind placeholders only.
+        column (str): partitioning column, selected by the query.
+        method (str, optional): partitioning method: hash, rowid or range. Defaults to "hash".
+        partitions (int, optional): number of partitions, ignored for the rowid and range methods. Defaults to 4.
+        ranges (list[tuple[Any, Any]] | None, optional): bounds of each partition, rowid and range methods only. Defaults to None.
+
+    Returns:
+        list[tuple[str, dict]]: partition queries and their bind parameters.
+
+    Raises:
+        ValueError: if the partitioning method is unknown, or ranges are missing.
+    """
+    base = f"select * from ({query}) partitioned"  # noqa: S608
+    if method in {"rowid", "range"} and not ranges:
+        message = f"The {method} partitioning method requires ranges."
+        raise ValueError(message)
+
+    match method:
+        case "hash":
+            statement = f"{base} where ora_hash(partitioned.{column}, {partitions - 1}) = :parallel_partition"
+            return [(statement, {"parallel_partition": partition}) for partition in range(partitions)]
+        case "rowid":
+            statement = f"{base} where partitioned.{column} between chartorowid(:parallel_low) and chartorowid(:parallel_high)"
+            return [(statement, {"parallel_low": low, "parallel_high": high}) for low, high in ranges]
+        case "range":
+            statement = f"{base} where partitioned.{column} >= :parallel_low and partitioned.{column} < :parallel_high"
+            return [(statement, {"parallel_low": low, "parallel_high": high}) for low, high in ranges]
+        case _:
+            message = f"Unsupported partitioning method: {method}"
+            raise ValueError(message)
+
+
+def offer(queue: Queue, item: Any, stop: Event) -> bool:
+    """Put an item in a bounded queue, unless the consumer has stopped.
+
+    Args:
+        queue (Queue): bounded queue.
+        item (Any): item to put.
+        stop (Event): set by the consumer when it stops reading.
+
+    Returns:
+        bool: whether the item was put.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=1)
+        except Full:
+            continue
+        else:
+            return True
+    return False
+
+
 class Oracle:
     """Class specifying attributes and methods related to the Oracle database."""
 
@@ -119,10 +334,65 @@ class Oracle:
         self.extra = {"database_type": self.config.type, "database_mode": self.config.mode}
 
         self.connection = None
+        self.pool = None
+        # Collection types looked up per connection, to bind lists
+        self.collection_types: WeakKeyDictionary[Connection, dict[str, DbObjectType]] = WeakKeyDictionary()
+        # LOB streams per cursor identity, closed with their cursor
+        self.lob_streams: dict[int, list[LobStream]] = {}
+        self.cache = self.create_cache() if self.config.cache else None
+        self.watermarks: WatermarkStore | None = None
+        self.templates: SqlTemplates | None = None
+        self.fetch_sizer = FetchSizer(self.config.fetch_target_size, self.config.arraysize, self.config.prefetchrows, self.config.batch_size)
+
+        # Pipelining is only available on asyncio connections, run by an asyncio client sharing the configuration, driven by a private event loop
+        self.loop: AbstractEventLoop | None = None
+        self.async_database: AsyncOracle | None = None
+        self.loop_lock = Lock()
 
         if self.config.mode == "thick":
             self.init_client()
 
+    def create_cache(self) -> QueryCache:
+        """Create the query result cache, stored under the output directory unless configured otherwise.
+
+        Returns:
+            QueryCache: query result cache.
+        """
+        path = None
+        if self.config.cache_disk:
+            path = self.config.cache_path or get_config_value("app", "output_path").joinpath("cache")
+        return QueryCache(self.config.cache_max_size, self.config.cache_ttl, path, self.config.cache_disk_max_size)
+
+    def create_watermark_store(self) -> WatermarkStore:
+        """Create the incremental extraction state, stored under the output directory unless configured otherwise.
+
+        Returns:
+            WatermarkStore: watermarks of incremental queries.
+        """
+        return WatermarkStore(self.config.state_path or get_config_value("app", "output_path").joinpath("state"))
+
+    def create_templates(self) -> SqlTemplates:
+        """Create the SQL template registry, loaded from the sql directory of the configuration path.
+
+        Returns:
+            SqlTemplates: SQL templates.
+        """
+        return SqlTemplates(get_config_value("app", "config_path").joinpath("sql"))
+
+    def resolve(self, query: str, binds: list | tuple | dict | None) -> str:
+        """Resolve a SQL template name into its statement, after checking its bind parameters, see SqlTemplates.resolve().
+
+        Args:
+            query (str): SQL text or template name.
+            binds (list | tuple | dict | None): positional or named bind parameters.
+
+        Returns:
+            str: SQL text.
+        """
+        if self.templates is None:
+            self.templates = self.create_templates()
+        return self.templates.resolve(query, binds)
+
     def init_client(self) -> None:
         """Initialize Oracle client, optionally using a tnsnames.ora configuration file."""
         config_dir = None
@@ -131,10 +401,10 @@ class Oracle:
             tns_path = self.config.tns_path
             tns_file_path = tns_path.joinpath("tnsnames.ora")
 
-            if not tns_path.is_dir:
+            if not tns_path.is_dir():
                 message = f"No such file or directory: {tns_path}"
                 raise FileNotFoundError(message)
-            if not tns_file_path.is_file:
+            if not tns_file_path.is_file():
                 message = f"No such file or directory: {tns_file_path}"
                 raise FileNotFoundError(message)
 
@@ -147,12 +417,20 @@ class Oracle:
             if "init_oracle_client() has already been called" not in str(exc):
                 raise
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether a standalone connection or a session pool is available."""
+        return self.connection is not None or self.pool is not None
+
     def connect(self) -> None:
-        """Connect to database."""
+        """Connect to database, using a session pool if enabled."""
         log().logger.info("Connecting to database...", extra=self.extra)
         for attempt in range(1, self.config.retry_max + 1):
             try:
-                self.connection = oracledb.connect(dsn=self.alias, user=self.config.username, password=self.config.password)
+                if self.config.pool:
+                    self.pool = self.create_pool()
+                else:
+                    self.connection = self.open_connection()
             except Error as err:
                 log().logger.error("Error connecting to database: %s", err, extra=self.extra)
             else:
@@ -165,8 +443,91 @@ class Oracle:
             log().logger.info("Attempts: %s/%s. Retrying in %s seconds...", attempt, self.config.retry_max, self.config.retry_delay, extra=self.extra)
             sleep(self.config.retry_delay)
 
+    def open_connection(self) -> Connection:
+        """Open a standalone connection.
+
+        Returns:
+            Connection: database connection.
+        """
+        return oracledb.connect(dsn=self.alias, user=self.config.username, password=self.config.password, stmtcachesize=self.config.stmt_cache_size)
+
+    def create_pool(self) -> ConnectionPool:
+        """Create a session pool and check that a session can be acquired from it.
+
+        Returns:
+            ConnectionPool: database session pool.
+        """
+        session_callback = self.init_session if self.config.pool_session_init else None
+        pool = oracledb.create_pool(
+            dsn=self.alias,
+            user=self.config.username,
+            password=self.config.password,
+            min=self.config.pool_min,
+            max=self.config.pool_max,
+            increment=self.config.pool_increment,
+            timeout=self.config.pool_timeout,
+            ping_interval=self.config.pool_ping_interval,
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            stmtcachesize=self.config.stmt_cache_size,
+            session_callback=session_callback,
+        )
+        try:
+            # Surface authentication or network errors now rather than on first query
+            pool.release(pool.acquire())
+        except Error:
+            pool.close(force=True)
+            raise
+        log().logger.debug("Session pool created: min=%s, max=%s.", pool.min, pool.max, extra=self.extra)
+        return pool
+
+    def init_session(self, connection: Connection, requested_tag: str | None) -> None:  # noqa: ARG002
+        """Initialize a newly created pooled session with the configured statements.
+
+        Args:
+            connection (Connection): new pooled database connection.
+            requested_tag (str | None): session tag requested on acquire, unused.
+        """
+        with connection.cursor() as cursor:
+            for statement in to_statement_list(self.config.pool_session_init):
+                cursor.execute(statement)
+
+    def acquire(self) -> Connection:
+        """Get a connection, from the session pool if enabled.
+
+        Returns:
+            Connection: database connection.
+        """
+        if self.pool is not None:
+            return self.pool.acquire()
+        return self.connection
+
+    def release(self, connection: Connection | None) -> None:
+        """Give a connection back to the session pool if enabled.
+
+        Args:
+            connection (Connection | None): database connection returned by acquire().
+        """
+        if self.pool is not None and connection is not None:
+            self.pool.release(connection)
+
     def disconnect(self) -> None:
         """Disconnect from database."""
+        if self.cache:
+            log().logger.info("Query cache statistics: %s", self.cache.stats(), extra=self.extra)
+
+        self.close_pipeline()
+
+        if self.pool:
+            try:
+                log().logger.info("Closing session pool...", extra=self.extra)
+                self.pool.close(force=True)
+            except Error as err:
+                log().logger.error("Error closing session pool: %s", err, extra=self.extra)
+            else:
+                log().logger.info("Successfully closed session pool.", extra=self.extra)
+            finally:
+                self.pool = None
+
         if self.connection:
             try:
                 log().logger.info("Disconnecting from database...", extra=self.extra)
@@ -178,46 +539,208 @@ class Oracle:
             finally:
                 self.connection = None
 
-    def execute_sql(self, cursor: Cursor, query: str) -> None:
-        """Execute a SQL query.
+    def to_collection(self, connection: Connection, values: Iterable[Any]) -> DbObject:
+        """Convert a Python list into a SQL collection bind value.
+
+        Args:
+            connection (Connection): database connection the value is bound on.
+            values (Iterable[Any]): input variable list.
+
+        Returns:
+            DbObject: SQL collection, usable in TABLE(:bind).
+        """
+        values = list(values)
+        type_name = to_collection_type(values)
+        types = self.collection_types.setdefault(connection, {})
+        if type_name not in types:
+            types[type_name] = connection.gettype(type_name)
+        return types[type_name].newobject(values)
+
+    def bind_collections(self, connection: Connection, parameters: list | tuple | dict | None) -> list | tuple | dict | None:
+        """Replace list and set bind values by SQL collections.
+
+        Args:
+            connection (Connection): database connection the values are bound on.
+            parameters (list | tuple | dict | None): positional or named bind parameters.
+
+        Returns:
+            list | tuple | dict | None: bind parameters ready for Cursor.execute().
+        """
+        collections = (list, set, frozenset)
+        match parameters:
+            case dict():
+                return {name: self.to_collection(connection, value) if isinstance(value, collections) else value for name, value in parameters.items()}
+            case list() | tuple():
+                return [self.to_collection(connection, value) if isinstance(value, collections) else value for value in parameters]
+            case _:
+                return parameters
+
+    def lob_type_handler(self, cursor: Cursor, metadata: FetchInfo) -> Var | None:
+        """Fetch LOB columns as locators, read whole up to DATABASE_LOB_INLINE_SIZE and streamed above it, see to_lob_value().
+
+        Reading a locator costs a round trip, whatever its size. Streams are only valid until the cursor is closed, see close_lob_streams().
+
+        Args:
+            cursor (Cursor): database cursor.
+            metadata (FetchInfo): fetched column metadata.
+
+        Returns:
+            Var | None: variable for LOB columns, None to keep the default for the others.
+        """
+        if metadata.type_code in {oracledb.DB_TYPE_BLOB, oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB}:
+            streams = self.lob_streams.setdefault(id(cursor), [])
+            converter = partial(to_lob_value, inline_size=self.config.lob_inline_size, streams=streams)
+            return cursor.var(metadata.type_code, arraysize=cursor.arraysize, outconverter=converter)
+        return None
+
+    def materialize_lobs(self, cursor: Cursor, rows: list) -> list:
+        """Read the LOB streams fetched by a cursor whole, for records handed out once the cursor is closed.
 
         Args:
             cursor (Cursor): database cursor.
-            query (str): SQL query.
+            rows (list): records fetched by the cursor.
 
         Returns:
-            list: result of the query, list of records.
+            list: records, LOB streams replaced by their content.
+        """
+        if not (streams := self.lob_streams.get(id(cursor))):
+            return rows
+        streams.clear()
+        return to_materialized_rows(rows)
+
+    def close_lob_streams(self, cursor: Cursor) -> None:
+        """Close the LOB streams fetched by a cursor, so that reading them fails clearly rather than through a released connection.
+
+        Args:
+            cursor (Cursor): database cursor, about to be closed.
         """
-        if self.connection is None:
+        for stream in self.lob_streams.pop(id(cursor), []):
+            stream.close()
+
+    def execute_sql(self, cursor: Cursor, query: str, parameters: list | tuple | dict | None = None, *, fetch_lobs: bool | None = None) -> None:
+        """Execute a SQL query.
+
+        Bind parameters keep the statement text constant, so the parsed cursor is reused from the statement cache. List and set values are bound
+        as SQL collections, see to_collection_rows().
+
+        Args:
+            cursor (Cursor): database cursor.
+            query (str): SQL query, with :1 or :name bind placeholders.
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            fetch_lobs (bool | None, optional): whether to fetch LOBs as locators, see lob_type_handler(), rather than whole with the rows,
+                whatever their size. Defaults to DATABASE_FETCH_LOBS.
+        """
+        if not self.is_connected:
             log().logger.error("No active database connection. Please connect first.", extra=self.extra)
             return
 
+        fetch_lobs = self.config.fetch_lobs if fetch_lobs is None else fetch_lobs
+        cursor.outputtypehandler = self.lob_type_handler if fetch_lobs else None
+        active_calls().label(cursor.connection, query)
         try:
-            cursor.execute(query)
+            cursor.execute(query, self.bind_collections(cursor.connection, parameters), fetch_lobs=fetch_lobs)
         except Error as err:
+            if is_cancelled(err):
+                raise
             log().logger.error("Error executing query: %s", err, extra=self.extra)
             return
 
+    @contextmanager
+    def deadline(self, connection: Connection, timeout: int | None = None, *, whole_call: bool = True) -> Iterator[None]:
+        """Bound the duration of a call, each round trip through the connection call timeout, the whole call through a timer cancelling it.
+
+        The connection is registered in active_calls() meanwhile, so that an interrupt can cancel it.
+
+        Args:
+            connection (Connection): database connection running the call.
+            timeout (int | None, optional): deadline, expressed in milliseconds, 0 to disable. Defaults to DATABASE_CALL_TIMEOUT.
+            whole_call (bool, optional): whether the deadline bounds the whole call, or each round trip only. Defaults to True.
+
+        Yields:
+            None: once the deadline is armed.
+        """
+        timeout = self.config.call_timeout if timeout is None else timeout
+        previous = connection.call_timeout
+        timer = None
+        if timeout:
+            connection.call_timeout = timeout
+            if whole_call:
+                timer = Timer(timeout / 1000, connection.cancel)
+                timer.daemon = True
+                timer.start()
+
+        active_calls().add(connection)
+        start = perf_counter()
+        try:
+            yield
+        except Error as err:
+            if is_cancelled(err):
+                sql_hash = to_sql_hash(active_calls().query(connection) or "")
+                log().logger.warning("Query %s cancelled after %.3fs: %s", sql_hash, perf_counter() - start, err, extra=self.extra | {"sql_hash": sql_hash})
+            raise
+        finally:
+            active_calls().remove(connection)
+            if timer is not None:
+                timer.cancel()
+            connection.call_timeout = previous
+
     @staticmethod
     def cursor_required(func: Callable) -> Callable:
-        """Ensure there is a cursor available to run a SQL query."""
+        """Ensure there is a cursor available to run a SQL query.
+
+        Generator functions keep their cursor, and pooled connection, until they are exhausted or closed. Decorated functions accept a timeout
+        keyword, expressed in milliseconds, see deadline(). It bounds the whole call, or each round trip for generator functions.
+        """
+        if isgeneratorfunction(func):
+
+            @wraps(func)
+            def generator_wrapper(self, *args, **kwargs) -> Iterator:  # noqa: ANN001,ANN002,ANN003
+                """."""
+                timeout = kwargs.pop("timeout", None)
+                connection = None
+                cursor = None
+                try:
+                    connection = self.acquire()
+                    cursor = connection.cursor()
+                    with self.deadline(connection, timeout, whole_call=False):
+                        yield from func(self, cursor, *args, **kwargs)
+                except Error as err:
+                    log().logger.error(err)
+                    if not self.is_connected:
+                        self.connect()
+                    raise
+                finally:
+                    if cursor:
+                        self.close_lob_streams(cursor)
+                        cursor.close()
+                    self.release(connection)
+
+            return generator_wrapper
 
         @wraps(func)
         def wrapper(self, *args, **kwargs) -> list:  # noqa: ANN001,ANN002,ANN003
             """."""
+            timeout = kwargs.pop("timeout", None)
+            connection = None
             cursor = None
             try:
-                cursor = self.connection.cursor()
-                result = func(self, cursor, *args, **kwargs)
+                connection = self.acquire()
+                cursor = connection.cursor()
+                with self.deadline(connection, timeout):
+                    result = func(self, cursor, *args, **kwargs)
                 cursor.close()
                 return result
             except Error as err:
                 log().logger.error(err)
                 if cursor:
                     cursor.close()
-                if not self.connection:
+                if not self.is_connected:
                     self.connect()
                 raise
+            finally:
+                if cursor:
+                    self.close_lob_streams(cursor)
+                self.release(connection)
 
         return wrapper
 
@@ -225,8 +748,843 @@ class Oracle:
         """."""
         return cursor.fetchall() if cursor else []
 
+    def fetch_batches(self, cursor: Cursor, batch_size: int) -> Iterator[list]:
+        """Fetch rows by batches, in as many round trips as the cursor array size requires.
+
+        Args:
+            cursor (Cursor): database cursor, with an executed query.
+            batch_size (int): number of rows per batch.
+
+        Yields:
+            list: batch of records.
+        """
+        while rows := cursor.fetchmany(batch_size):
+            yield rows
+
     @cursor_required
-    def select(self, cursor: Cursor, query: str, **params) -> list:  # noqa:ANN003
-        """."""
-        self.execute_sql(cursor, query, **params)
-        return self.fetch_all(cursor)
+    def select(
+        self,
+        cursor: Cursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        arraysize: int | None = None,
+        prefetchrows: int | None = None,
+        fetch_lobs: bool | None = None,
+        **params,  # noqa:ANN003
+    ) -> list:
+        """Run a query and fetch all its records.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            arraysize (int | None, optional): number of rows per fetch round trip. Defaults to the adaptive size, see FetchSizer.
+            prefetchrows (int | None, optional): number of rows returned with the execute round trip. Defaults to the adaptive size.
+            fetch_lobs (bool | None, optional): whether to fetch LOBs as locators, large ones read whole all the same as the cursor is closed
+                before returning, use select_iter() to stream them. Defaults to DATABASE_FETCH_LOBS.
+            **params: named bind parameters.
+
+        Returns:
+            list: list of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.fetch_sizer.prepare(cursor, query, arraysize, prefetchrows)
+            self.execute_sql(cursor, query, binds, fetch_lobs=fetch_lobs)
+            if arraysize is None:
+                self.fetch_sizer.adapt(cursor, query)
+            # LOB streams do not outlive the cursor, closed before the records are returned
+            rows = self.materialize_lobs(cursor, self.fetch_all(cursor))
+            self.fetch_sizer.observe(query, to_observed_row_size(rows), len(rows))
+            metrics.update(to_fetch_metrics(cursor, len(rows)))
+        return rows
+
+    @cursor_required
+    def select_iter(
+        self,
+        cursor: Cursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        batch_size: int | None = None,
+        *,
+        arraysize: int | None = None,
+        prefetchrows: int | None = None,
+        fetch_lobs: bool | None = None,
+        **params,  # noqa:ANN003
+    ) -> Iterator[list]:
+        """Run a query and stream its records by batches, so memory stays flat whatever the result size.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            arraysize (int | None, optional): number of rows per fetch round trip. Defaults to the adaptive size, see FetchSizer.
+            prefetchrows (int | None, optional): number of rows returned with the execute round trip. Defaults to the adaptive size.
+            fetch_lobs (bool | None, optional): whether to fetch LOBs as locators, large ones as LobStream, readable until the iterator is
+                exhausted or closed. Defaults to DATABASE_FETCH_LOBS.
+            **params: named bind parameters.
+
+        Yields:
+            list: batch of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.fetch_sizer.prepare(cursor, query, arraysize, prefetchrows)
+            self.execute_sql(cursor, query, binds, fetch_lobs=fetch_lobs)
+            if arraysize is None:
+                self.fetch_sizer.adapt(cursor, query)
+            count = 0
+            row_size = 0
+            for rows in self.fetch_batches(cursor, batch_size or self.config.batch_size):
+                row_size = row_size or to_observed_row_size(rows)
+                count += len(rows)
+                metrics.update(to_fetch_metrics(cursor, count))
+                paused = perf_counter()
+                yield rows
+                metrics["idle"] += perf_counter() - paused
+            self.fetch_sizer.observe(query, row_size, count)
+
+    @cursor_required
+    def execute(self, cursor: Cursor, query: str, parameters: list | tuple | dict | None = None, **params) -> int:  # noqa:ANN003
+        """Run a DML or DDL statement, then commit.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL statement, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            int: number of rows affected.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.execute_sql(cursor, query, binds)
+            cursor.connection.commit()
+            metrics.update(rows=cursor.rowcount, round_trips=2)
+        for table in to_table_names(query):
+            self.invalidate(table)
+        return cursor.rowcount
+
+    @cursor_required
+    def select_df(
+        self,
+        cursor: Cursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        arraysize: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> pl.DataFrame:
+        """Run a query and fetch all its records as a Polars DataFrame.
+
+        Columns are fetched in Arrow format and handed to Polars without per-value Python objects.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            arraysize (int | None, optional): number of rows per fetch round trip. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Returns:
+            pl.DataFrame: query result.
+        """
+        arraysize = arraysize or self.config.batch_size
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            binds = self.bind_collections(cursor.connection, binds)
+            data = pl.DataFrame(cursor.connection.fetch_df_all(query, binds, arraysize=arraysize))
+            metrics.update(rows=data.height, round_trips=1 + data.height // arraysize, size=data.estimated_size())
+        return data
+
+    @cursor_required
+    def select_df_iter(
+        self,
+        cursor: Cursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Iterator[pl.DataFrame]:
+        """Run a query and stream its records as Polars DataFrames, one per batch.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Yields:
+            pl.DataFrame: batch of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            binds = self.bind_collections(cursor.connection, binds)
+            batches = cursor.connection.fetch_df_batches(query, binds, size=batch_size or self.config.batch_size)
+            metrics["round_trips"] = 0
+            for batch in batches:
+                data = pl.DataFrame(batch)
+                metrics["rows"] += data.height
+                metrics["round_trips"] += 1
+                metrics["size"] += data.estimated_size()
+                paused = perf_counter()
+                yield data
+                metrics["idle"] += perf_counter() - paused
+
+    @cursor_required
+    def select_incremental(
+        self,
+        cursor: Cursor,
+        query: str,
+        column: str,
+        parameters: dict | None = None,
+        *,
+        name: str | None = None,
+        full_refresh: bool = False,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Iterator[list]:
+        """Run a query and stream, by batches, only the records above the high-water mark of its previous complete run.
+
+        The watermark column, a timestamp or a sequence, is compared to the highest value fetched by the previous run. The new high-water mark is
+        stored once all records are fetched, so that the records of an interrupted run are fetched again by the next one.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :name bind placeholders, :watermark excluded, or SQL template name, see resolve().
+            column (str): watermark column name, as selected by the query.
+            parameters (dict | None, optional): named bind parameters. Defaults to None.
+            name (str | None, optional): name the watermark is stored under. Defaults to the query hash.
+            full_refresh (bool, optional): whether to ignore the stored watermark and fetch all records. Defaults to DATABASE_FULL_REFRESH.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Yields:
+            list: batch of records.
+
+        Raises:
+            ValueError: if the query does not select the watermark column.
+        """
+        if self.watermarks is None:
+            self.watermarks = self.create_watermark_store()
+        name = name or to_sql_hash(query)
+        watermark = None if full_refresh or self.config.full_refresh else self.watermarks.get(name)
+
+        binds = to_bind_parameters(parameters, **params) or {}
+        query = self.resolve(query, binds)
+        statement = query
+        if watermark is not None:
+            statement = f"select * from ({query}) where {column} > :watermark"  # noqa: S608
+            binds |= {"watermark": watermark}
+        log().logger.info("Extracting %s above watermark %s...", name, watermark, extra=self.extra)
+
+        with track_query(statement) as metrics:
+            self.fetch_sizer.prepare(cursor, statement)
+            self.execute_sql(cursor, statement, binds)
+            if cursor.description is None:
+                return
+            self.fetch_sizer.adapt(cursor, statement)
+
+            columns = [description[0].lower() for description in cursor.description]
+            if column.lower() not in columns:
+                message = f"Watermark column {column} not selected by the query"
+                raise ValueError(message)
+            index = columns.index(column.lower())
+
+            count = 0
+            high = watermark
+            for rows in self.fetch_batches(cursor, batch_size or self.config.batch_size):
+                values = [row[index] for row in rows if row[index] is not None]
+                if values:
+                    high = max(values) if high is None else max(high, *values)
+                count += len(rows)
+                metrics.update(to_fetch_metrics(cursor, count))
+                paused = perf_counter()
+                yield rows
+                metrics["idle"] += perf_counter() - paused
+
+        if high is not None and high != watermark:
+            self.watermarks.put(name, high)
+        log().logger.info("Extracted %s rows of %s, watermark %s.", count, name, high, extra=self.extra)
+
+    def select_df_cached(self, query: str, parameters: list | tuple | dict | None = None, tables: set[str] | None = None, **params) -> pl.DataFrame:  # noqa:ANN003
+        """Run a query through the query cache, as a Polars DataFrame.
+
+        The query only reaches the database on a cache miss, or when the cache is disabled.
+
+        Args:
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            tables (set[str] | None, optional): tables the result depends on, for invalidation. Defaults to the tables found in the query.
+            **params: named bind parameters.
+
+        Returns:
+            pl.DataFrame: query result.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        if self.cache is None:
+            return self.select_df(query, binds)
+
+        key = self.cache.key(query, binds)
+        data = self.cache.get(key)
+        if data is None:
+            data = self.select_df(query, binds)
+            self.cache.put(key, data, tables or to_table_names(query))
+        return data
+
+    def select_cached(self, query: str, parameters: list | tuple | dict | None = None, tables: set[str] | None = None, **params) -> list:  # noqa:ANN003
+        """Run a query through the query cache.
+
+        Args:
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            tables (set[str] | None, optional): tables the result depends on, for invalidation. Defaults to the tables found in the query.
+            **params: named bind parameters.
+
+        Returns:
+            list: list of records.
+        """
+        return self.select_df_cached(query, parameters, tables, **params).rows()
+
+    def invalidate(self, table: str) -> None:
+        """Drop cached results depending on a table, if the query cache is enabled.
+
+        Args:
+            table (str): table name, schema included if used in queries.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(table)
+
+    def execute_many(self, cursor: Cursor, statement: str, rows: Iterable[tuple], table: str, batch_size: int | None = None) -> int:
+        """Execute a DML statement for many rows, one round trip per batch, then commit.
+
+        Rejected rows are logged and skipped, the rest of the batch is still applied.
+
+        Args:
+            cursor (Cursor): database cursor.
+            statement (str): DML statement with positional binds, or SQL template name, see resolve().
+            rows (Iterable[tuple]): bind values, one tuple per row.
+            table (str): target table name, for logging.
+            batch_size (int | None, optional): number of rows per round trip. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows affected.
+        """
+        affected = 0
+        rejected = 0
+        extra = self.extra | {"table": table}
+
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is not None:
+            # Bind parameters are checked against the first row only
+            statement = self.resolve(statement, first)
+            iterator = chain([first], iterator)
+
+        with track_query(statement) as metrics:
+            while batch := list(islice(iterator, batch_size or self.config.batch_size)):
+                cursor.executemany(statement, batch, batcherrors=True)
+                affected += cursor.rowcount
+                metrics["round_trips"] += 1
+
+                for error in cursor.getbatcherrors():
+                    rejected += 1
+                    log().logger.error("Error writing record: %s", error.message, extra=extra | {"record": str(batch[error.offset])})
+
+            cursor.connection.commit()
+            metrics["rows"] = affected
+        self.invalidate(table)
+        log().logger.info("%s rows written, %s rows rejected.", affected, rejected, extra=extra)
+        return affected
+
+    @cursor_required
+    def insert_many(self, cursor: Cursor, table: str, columns: list[str], rows: Iterable[tuple], *, batch_size: int | None = None) -> int:
+        """Insert many rows using array DML.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            columns (list[str]): inserted column names.
+            rows (Iterable[tuple]): values in columns order, one tuple per row.
+            batch_size (int | None, optional): number of rows per round trip. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows inserted.
+        """
+        return self.execute_many(cursor, to_insert_statement(table, columns), rows, table, batch_size)
+
+    @cursor_required
+    def update_many(self, cursor: Cursor, table: str, columns: list[str], keys: list[str], rows: Iterable[tuple], *, batch_size: int | None = None) -> int:
+        """Update many rows using array DML.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            columns (list[str]): updated column names.
+            keys (list[str]): key column names identifying the rows to update.
+            rows (Iterable[tuple]): values in columns then keys order, one tuple per row.
+            batch_size (int | None, optional): number of rows per round trip. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows updated.
+        """
+        return self.execute_many(cursor, to_update_statement(table, columns, keys), rows, table, batch_size)
+
+    @cursor_required
+    def merge_many(self, cursor: Cursor, table: str, columns: list[str], keys: list[str], rows: Iterable[tuple], *, batch_size: int | None = None) -> int:
+        """Insert or update many rows using array DML.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            columns (list[str]): merged column names, keys included.
+            keys (list[str]): key column names used to match existing rows.
+            rows (Iterable[tuple]): values in columns order, one tuple per row.
+            batch_size (int | None, optional): number of rows per round trip. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows merged.
+        """
+        return self.execute_many(cursor, to_merge_statement(table, columns, keys), rows, table, batch_size)
+
+    @cursor_required
+    def write_df(
+        self, cursor: Cursor, data: pl.DataFrame, table: str, mode: str = "append", *, keys: list[str] | None = None, buffer_size: int | None = None
+    ) -> int:
+        """Write a Polars DataFrame into a table, binding its Arrow column buffers without converting rows to tuples.
+
+        Modes:
+            - append: insert the rows, by direct path load in thin mode, or array DML.
+            - truncate: truncate the table, then append the rows.
+            - merge: upsert the rows on their keys, by array DML.
+
+        The DataFrame is sent in zero-copy slices sized by a memory budget, then committed.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            data (pl.DataFrame): rows to write, columns named after the table columns.
+            table (str): target table name, optionally prefixed by its schema.
+            mode (str, optional): write mode, append, truncate or merge. Defaults to "append".
+            keys (list[str] | None, optional): key column names used to match existing rows, required by the merge mode. Defaults to None.
+            buffer_size (int | None, optional): memory budget of a chunk, expressed in bytes. Defaults to DATABASE_WRITE_BUFFER_SIZE.
+
+        Returns:
+            int: number of rows written.
+
+        Raises:
+            ValueError: if the mode is unknown, or keys are missing in merge mode.
+        """
+        if mode not in {"append", "truncate", "merge"}:
+            message = f"Unknown write mode: {mode}"
+            raise ValueError(message)
+        if mode == "merge" and not keys:
+            message = "Merge mode requires key columns"
+            raise ValueError(message)
+
+        columns = data.columns
+        extra = self.extra | {"table": table}
+        if mode == "truncate":
+            cursor.execute(f"truncate table {table}")
+            log().logger.info("Table %s truncated.", table, extra=extra)
+
+        direct = mode != "merge" and self.config.direct_path and self.config.mode == "thin"
+        statement = to_merge_statement(table, columns, keys) if mode == "merge" else to_insert_statement(table, columns)
+        chunk_rows = to_chunk_rows(data, buffer_size or self.config.write_buffer_size)
+
+        written = 0
+        rejected = 0
+        start = perf_counter()
+        with track_query(statement) as metrics:
+            for chunk in data.iter_slices(n_rows=chunk_rows):
+                if direct:
+                    schema, _, name = table.rpartition(".")
+                    cursor.connection.direct_path_load(schema or cursor.connection.username, name, columns, chunk)
+                    written += chunk.height
+                else:
+                    cursor.executemany(statement, chunk, batcherrors=True)
+                    written += cursor.rowcount
+                    for error in cursor.getbatcherrors():
+                        rejected += 1
+                        log().logger.error("Error writing record: %s", error.message, extra=extra | {"record": str(chunk.row(error.offset))})
+                metrics["round_trips"] += 1
+                metrics["size"] += chunk.estimated_size()
+
+            cursor.connection.commit()
+            metrics["rows"] = written
+        self.invalidate(table)
+
+        elapsed = perf_counter() - start
+        log().logger.info(
+            "%s rows written in %.3f s (%.0f rows/s, %s), %s rows rejected.",
+            written,
+            elapsed,
+            written / elapsed if elapsed else 0,
+            "direct path" if direct else "array DML",
+            rejected,
+            extra=extra,
+        )
+        return written
+
+    def execute_block(self, cursor: Cursor, statements: list[str]) -> list[tuple[str, float]]:
+        """Execute statements in a single round trip, wrapped in an anonymous PL/SQL block.
+
+        Args:
+            cursor (Cursor): database cursor.
+            statements (list[str]): SQL statements or PL/SQL units, none returning rows.
+
+        Returns:
+            list[tuple[str, float]]: executed statements and their duration, expressed in seconds.
+
+        Raises:
+            ScriptError: if a statement fails and DATABASE_STOP_ON_ERROR is enabled, once the script is rolled back.
+        """
+        if not statements:
+            return []
+
+        binds: dict[str, Any] = {}
+        for i, statement in enumerate(statements, start=1):
+            binds[f"s{i}"] = statement
+            if len(statement.encode("utf-8")) > PLSQL_VARCHAR_MAX_SIZE:
+                binds[f"s{i}"] = cursor.var(oracledb.DB_TYPE_CLOB)
+                binds[f"s{i}"].setvalue(0, statement)
+        times = [cursor.var(oracledb.DB_TYPE_TIMESTAMP) for _ in range(len(statements) + 1)]
+        binds |= {f"t{i}": time for i, time in enumerate(times)}
+        binds |= {"failed": cursor.var(int), "error": cursor.var(str)}
+
+        cursor.execute(to_script_block(len(statements)), binds)
+
+        values = [time.getvalue() for time in times]
+        timings = [(statement, (values[i] - values[i - 1]).total_seconds()) for i, statement in enumerate(statements, start=1) if values[i] is not None]
+        for statement, duration in timings:
+            # Statements share the round trip of their block
+            query_stats().record(statement, duration, round_trips=0)
+
+        failed = binds["failed"].getvalue()
+        if failed:
+            error = binds["error"].getvalue()
+            log().logger.error("Error executing statement: %s\n%s", error, statements[failed - 1], extra=self.extra)
+            if self.config.stop_on_error:
+                # The block caught the error, only its message came back
+                self.abort_script(cursor, f"statement {failed} of the block", oracledb.DatabaseError(error))
+            timings += self.execute_block(cursor, statements[failed:])
+
+        return timings
+
+    def abort_script(self, cursor: Cursor, failed: str, error: Exception) -> None:
+        """Roll back the statements of a script run so far, then raise the error of the failed statement.
+
+        Args:
+            cursor (Cursor): database cursor running the script.
+            failed (str): failed statement, for the error message.
+            error (Exception): error of the failed statement.
+
+        Raises:
+            ScriptError: always, chained to the error.
+        """
+        cursor.connection.rollback()
+        message = f"Script aborted on {failed}, rolled back: {error}"
+        raise ScriptError(message) from error
+
+    @cursor_required
+    def execute_script(self, cursor: Cursor, script: str, batch_size: int | None = None) -> list[tuple[str, float]]:
+        """Execute a SQL script in as few round trips as possible, then commit.
+
+        Consecutive statements not returning rows are grouped into anonymous PL/SQL blocks, one round trip per block. Queries run on their own.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            script (str): SQL script, see to_statement_list() for the supported syntax.
+            batch_size (int | None, optional): maximum number of statements per block. Defaults to DATABASE_SCRIPT_BATCH_SIZE.
+
+        Returns:
+            list[tuple[str, float]]: executed statements and their duration, expressed in seconds.
+
+        Raises:
+            ScriptError: if a statement fails and DATABASE_STOP_ON_ERROR is enabled, or a query is cancelled, once the script is rolled back.
+        """
+        batch_size = batch_size or self.config.script_batch_size
+        timings = []
+        round_trips = 0
+        group: list[str] = []
+
+        for statement in to_statement_list(script):
+            if is_query(statement):
+                timings += self.execute_block(cursor, group)
+                round_trips += bool(group)
+                group = []
+
+                start = perf_counter()
+                round_trips += 1
+                try:
+                    with track_query(statement):
+                        cursor.execute(statement)
+                except Error as err:
+                    log().logger.error("Error executing statement: %s\n%s", err, statement, extra=self.extra)
+                    if self.config.stop_on_error or is_cancelled(err):
+                        self.abort_script(cursor, "query", err)
+                    continue
+                timings.append((statement, perf_counter() - start))
+                continue
+
+            group.append(statement)
+            if len(group) == batch_size:
+                timings += self.execute_block(cursor, group)
+                round_trips += 1
+                group = []
+
+        timings += self.execute_block(cursor, group)
+        round_trips += bool(group)
+        cursor.connection.commit()
+
+        for statement, duration in timings:
+            log().logger.debug("%.3fs - %s", duration, statement, extra=self.extra)
+        log().logger.info("%s statements executed in %s round trips.", len(timings), round_trips, extra=self.extra)
+        return timings
+
+    def pipeline(self) -> Pipeline:
+        """Create an empty pipeline of independent statements, see Pipeline.
+
+        Returns:
+            Pipeline: pipeline run by run_pipeline().
+        """
+        return Pipeline(self)
+
+    def close_pipeline(self) -> None:
+        """Disconnect the asyncio client and close the event loop used by pipelines, if opened."""
+        if self.loop is None:
+            return
+        try:
+            if self.async_database is not None:
+                self.loop.run_until_complete(self.async_database.disconnect())
+        finally:
+            self.async_database = None
+            self.loop.close()
+            self.loop = None
+
+    def run_pipeline(self, pipeline: Pipeline) -> list[PipelineOpResult]:
+        """Run the statements of a pipeline in a single round trip, then commit if any statement writes.
+
+        Pipelining requires an asyncio connection, so pipelines run through an AsyncOracle client, connected on first use and kept until
+        disconnect(). It uses its own session pool, or standalone connection, set up like the ones of this client, and DATABASE_CALL_TIMEOUT.
+        Pipelines therefore run on another session: they do not see the uncommitted work of this client, and commit their own. Statements
+        failing do not prevent the others from running, their error is logged and returned in place of their result.
+
+        Args:
+            pipeline (Pipeline): queued statements.
+
+        Returns:
+            list[PipelineOpResult]: one result per statement, in queue order, with either rows or an error.
+
+        Raises:
+            ValueError: if the driver runs in thick mode, or the connection of this client has uncommitted work.
+        """
+        if self.config.mode == "thick":
+            message = "Pipelining is only supported in thin mode"
+            raise ValueError(message)
+        if not pipeline:
+            return []
+        if self.connection is not None and self.connection.transaction_in_progress:
+            message = "Pipelines run on their own session, commit or roll back the work of the connection first"
+            raise ValueError(message)
+
+        start = perf_counter()
+        with self.loop_lock:
+            if self.loop is None:
+                self.loop = new_event_loop()
+            if self.async_database is None:
+                async_database = AsyncOracle()
+                self.loop.run_until_complete(async_database.connect())
+                self.async_database = async_database
+            results = self.loop.run_until_complete(self.async_database.run_pipeline(pipeline))
+
+        for table in pipeline.tables():
+            self.invalidate(table)
+        log().logger.debug("%s statements executed in a single round trip in %.3fs.", len(pipeline), perf_counter() - start, extra=self.extra)
+        return results
+
+    def extract_partition(self, statement: str, parameters: dict, batch_size: int, batches: Queue, stop: Event) -> None:
+        """Run one partition of a parallel query on its own session, and push its batches to a queue.
+
+        Args:
+            statement (str): partition query.
+            parameters (dict): named bind parameters.
+            batch_size (int): number of rows per batch.
+            batches (Queue): queue receiving batches, then the error if any, then None once done.
+            stop (Event): set by the consumer when it stops reading.
+        """
+        connection = None
+        cursor = None
+        try:
+            connection = self.pool.acquire() if self.pool is not None else self.open_connection()
+            with connection.cursor() as cursor, self.deadline(connection, whole_call=False), track_query(statement) as metrics:
+                self.fetch_sizer.prepare(cursor, statement)
+                cursor.outputtypehandler = self.lob_type_handler if self.config.fetch_lobs else None
+                cursor.execute(statement, self.bind_collections(connection, parameters), fetch_lobs=self.config.fetch_lobs)
+                self.fetch_sizer.adapt(cursor, statement)
+                count = 0
+                row_size = 0
+                for batch in self.fetch_batches(cursor, batch_size):
+                    # Batches are read by the consumer once the cursor may be closed
+                    rows = self.materialize_lobs(cursor, batch)
+                    row_size = row_size or to_observed_row_size(rows)
+                    count += len(rows)
+                    metrics.update(to_fetch_metrics(cursor, count))
+                    if not offer(batches, rows, stop):
+                        return
+                self.fetch_sizer.observe(statement, row_size, count)
+        except Exception as err:
+            # Any error is handed to the consumer, so that a failed partition is never taken for a finished one
+            log().logger.error("Error extracting partition %s: %s", parameters, err, extra=self.extra)
+            offer(batches, err, stop)
+        finally:
+            if cursor is not None:
+                self.close_lob_streams(cursor)
+            if connection is not None:
+                if self.pool is not None:
+                    self.pool.release(connection)
+                else:
+                    connection.close()
+            offer(batches, None, stop)
+
+    def rowid_ranges(self, table: str, partitions: int) -> list[tuple[str, str]]:
+        """Split a table into ROWID ranges of about the same number of blocks, read from its extents.
+
+        Reading another owner's extents requires access to DBA_EXTENTS and DBA_OBJECTS.
+
+        Args:
+            table (str): table name, as table or owner.table, in the data dictionary case.
+            partitions (int): number of ranges, fewer if the table has fewer extents.
+
+        Returns:
+            list[tuple[str, str]]: [low, high] ROWID bounds of each range, empty if the table has no extent.
+        """
+        owner, _, table_name = table.rpartition(".")
+        binds = {"table_name": table_name} | ({"owner": owner} if owner else {})
+        extents = self.select(to_rowid_extents_query(owner or None), binds)
+        ranges = to_rowid_ranges(extents, partitions)
+        log().logger.debug("%s split into %s ROWID ranges over %s extents.", table, len(ranges), len(extents), extra=self.extra)
+        return ranges
+
+    def parallel_select(
+        self,
+        query: str,
+        column: str,
+        *,
+        method: str = "hash",
+        partitions: int | None = None,
+        ranges: list[tuple[Any, Any]] | None = None,
+        table: str | None = None,
+        parameters: dict | None = None,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Iterator[list]:
+        """Run a query split into partitions, each one on its own session, and stream the merged batches as they arrive.
+
+        With the session pool enabled, DATABASE_POOL_MAX should allow one session per partition. Otherwise each partition opens a standalone
+        connection. Batches are not ordered across partitions.
+
+        Args:
+            query (str): SQL query, with named bind placeholders only, or SQL template name, see resolve().
+            column (str): partitioning column, selected by the query.
+            method (str, optional): partitioning method: hash, rowid or range, see to_partition_queries(). Defaults to "hash".
+            partitions (int | None, optional): number of partitions. Defaults to DATABASE_PARALLEL_PARTITIONS.
+            ranges (list[tuple[Any, Any]] | None, optional): bounds of each partition, rowid and range methods only. Defaults to the ROWID
+                ranges of the table for the rowid method, see rowid_ranges().
+            table (str | None, optional): table whose ROWID is selected, as table or owner.table, rowid method only. Defaults to None.
+            parameters (dict | None, optional): named bind parameters. Defaults to None.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Yields:
+            list: batch of records.
+
+        Raises:
+            ValueError: if the rowid method has neither ranges nor table.
+        """
+        binds = to_bind_parameters(parameters, **params) or {}
+        query = self.resolve(query, binds)
+        partitions = partitions or self.config.parallel_partitions
+        if method == "rowid" and not ranges:
+            if not table:
+                message = "The rowid partitioning method requires ranges or a table."
+                raise ValueError(message)
+            ranges = self.rowid_ranges(table, partitions)
+            # Table without segment, nothing to read
+            if not ranges:
+                return
+        statements = to_partition_queries(query, column, method, partitions, ranges)
+        batch_size = batch_size or self.config.batch_size
+
+        # Bounded, so that slow consumers hold at most two batches per partition in memory
+        batches: Queue = Queue(maxsize=2 * len(statements))
+        stop = Event()
+        with ThreadPoolExecutor(max_workers=len(statements), thread_name_prefix="parallel_select") as executor:
+            for statement, partition_binds in statements:
+                executor.submit(self.extract_partition, statement, binds | partition_binds, batch_size, batches, stop)
+
+            running = len(statements)
+            try:
+                while running:
+                    item = batches.get()
+                    if item is None:
+                        running -= 1
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
+
+    def export(
+        self,
+        query: str,
+        path: Path | str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        file_format: str = "parquet",
+        row_group_size: int | None = None,
+        compression: str | None = None,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Path:
+        """Stream a query result to a Parquet, Arrow IPC or CSV file, holding only a few batches in memory.
+
+        Args:
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            path (Path | str): output file path, relative to the output directory unless absolute.
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            file_format (str, optional): file format: parquet, ipc or csv. Defaults to "parquet".
+            row_group_size (int | None, optional): number of rows per Parquet row group. Defaults to DATABASE_EXPORT_ROW_GROUP_SIZE.
+            compression (str | None, optional): Parquet or Arrow IPC compression codec. Defaults to DATABASE_EXPORT_COMPRESSION.
+            batch_size (int | None, optional): number of rows per fetch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Returns:
+            Path: output file path.
+
+        Raises:
+            ValueError: if the file format is not supported.
+        """
+        file_path = to_export_path(path, file_format)
+        compression = compression or self.config.export_compression
+
+        start = perf_counter()
+        data = to_lazy_frame(self.select_df_iter(query, parameters, batch_size, **params))
+        if data is None:
+            log().logger.warning("Query returned no rows, nothing to export to %s.", file_path, extra=self.extra)
+            return file_path
+
+        sink_frame(data, file_path, file_format, compression, row_group_size or self.config.export_row_group_size)
+
+        log().logger.info("Exported query result to %s in %.3fs.", file_path, perf_counter() - start, extra=self.extra)
+        return file_path
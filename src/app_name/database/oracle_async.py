@@ -0,0 +1,444 @@
+"""Module used to interact with the Oracle database from an asyncio event loop.
+
+Typical usage example:
+    database = AsyncOracle()
+    await database.connect()
+    results = await asyncio.gather(*(database.select(query, id=i) for i in ids))
+    await database.disconnect()
+"""
+
+# Standard Library
+from asyncio import sleep
+from collections.abc import AsyncIterator, Callable
+from functools import wraps
+from inspect import isasyncgenfunction
+from time import perf_counter
+from typing import Any
+from weakref import WeakKeyDictionary
+
+# Third-party
+import oracledb
+from oracledb import AsyncConnection, AsyncConnectionPool, AsyncCursor, DbObject, DbObjectType, Error, PipelineOpResult
+
+# Local Application
+from app_name.common.config import DatabaseConfig, get_config_class, get_config_value
+from app_name.database.common import to_bind_parameters
+from app_name.database.oracle_common import Pipeline, to_collection_type, to_statement_list
+from app_name.database.sizing import FetchSizer, to_observed_row_size
+from app_name.database.stats import to_fetch_metrics, track_query
+from app_name.database.templates import SqlTemplates
+from app_name.event.logger.log import log
+
+
+class AsyncOracle:
+    """Class specifying attributes and methods related to the Oracle database, using asyncio.
+
+    python-oracledb only supports asyncio in thin mode. Use the session pool to run queries concurrently, a standalone connection runs them one
+    at a time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.config: DatabaseConfig = get_config_class("database")
+        self.alias = self.config.tns_alias if self.config.tns else self.config.alias
+        self.extra = {"database_type": self.config.type, "database_mode": self.config.mode}
+
+        self.connection = None
+        self.pool = None
+        # Collection types looked up per connection, to bind lists
+        self.collection_types: WeakKeyDictionary[AsyncConnection, dict[str, DbObjectType]] = WeakKeyDictionary()
+        self.fetch_sizer = FetchSizer(self.config.fetch_target_size, self.config.arraysize, self.config.prefetchrows, self.config.batch_size)
+        self.templates: SqlTemplates | None = None
+
+        if self.config.mode == "thick":
+            message = "asyncio is only supported in thin mode"
+            raise ValueError(message)
+
+    def create_templates(self) -> SqlTemplates:
+        """Create the SQL template registry, loaded from the sql directory of the configuration path.
+
+        Returns:
+            SqlTemplates: SQL templates.
+        """
+        return SqlTemplates(get_config_value("app", "config_path").joinpath("sql"))
+
+    def resolve(self, query: str, binds: list | tuple | dict | None) -> str:
+        """Resolve a SQL template name into its statement, after checking its bind parameters, see SqlTemplates.resolve().
+
+        Args:
+            query (str): SQL text or template name.
+            binds (list | tuple | dict | None): positional or named bind parameters.
+
+        Returns:
+            str: SQL text.
+        """
+        if self.templates is None:
+            self.templates = self.create_templates()
+        return self.templates.resolve(query, binds)
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether a standalone connection or a session pool is available."""
+        return self.connection is not None or self.pool is not None
+
+    async def connect(self) -> None:
+        """Connect to database, using a session pool if enabled."""
+        log().logger.info("Connecting to database...", extra=self.extra)
+        for attempt in range(1, self.config.retry_max + 1):
+            try:
+                if self.config.pool:
+                    self.pool = await self.create_pool()
+                else:
+                    self.connection = await oracledb.connect_async(
+                        dsn=self.alias, user=self.config.username, password=self.config.password, stmtcachesize=self.config.stmt_cache_size
+                    )
+            except Error as err:
+                log().logger.error("Error connecting to database: %s", err, extra=self.extra)
+            else:
+                log().logger.info("Successfully connected to database.", extra=self.extra)
+                break
+            if attempt == self.config.retry_max:
+                log().logger.info("Attempts: %s/%s. Aborting...", attempt, self.config.retry_max, extra=self.extra)
+                message = "Unable to establish database connection"
+                raise Exception(message)
+            log().logger.info("Attempts: %s/%s. Retrying in %s seconds...", attempt, self.config.retry_max, self.config.retry_delay, extra=self.extra)
+            await sleep(self.config.retry_delay)
+
+    async def create_pool(self) -> AsyncConnectionPool:
+        """Create a session pool and check that a session can be acquired from it.
+
+        Returns:
+            AsyncConnectionPool: database session pool.
+        """
+        session_callback = self.init_session if self.config.pool_session_init else None
+        pool = oracledb.create_pool_async(
+            dsn=self.alias,
+            user=self.config.username,
+            password=self.config.password,
+            min=self.config.pool_min,
+            max=self.config.pool_max,
+            increment=self.config.pool_increment,
+            timeout=self.config.pool_timeout,
+            ping_interval=self.config.pool_ping_interval,
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            stmtcachesize=self.config.stmt_cache_size,
+            session_callback=session_callback,
+        )
+        try:
+            # Surface authentication or network errors now rather than on first query
+            await pool.release(await pool.acquire())
+        except Error:
+            await pool.close(force=True)
+            raise
+        log().logger.debug("Session pool created: min=%s, max=%s.", pool.min, pool.max, extra=self.extra)
+        return pool
+
+    async def init_session(self, connection: AsyncConnection, requested_tag: str | None) -> None:  # noqa: ARG002
+        """Initialize a newly created pooled session with the configured statements.
+
+        Args:
+            connection (AsyncConnection): new pooled database connection.
+            requested_tag (str | None): session tag requested on acquire, unused.
+        """
+        with connection.cursor() as cursor:
+            for statement in to_statement_list(self.config.pool_session_init):
+                await cursor.execute(statement)
+
+    async def acquire(self) -> AsyncConnection:
+        """Get a connection, from the session pool if enabled.
+
+        Returns:
+            AsyncConnection: database connection.
+        """
+        if self.pool is not None:
+            return await self.pool.acquire()
+        return self.connection
+
+    async def release(self, connection: AsyncConnection | None) -> None:
+        """Give a connection back to the session pool if enabled.
+
+        Args:
+            connection (AsyncConnection | None): database connection returned by acquire().
+        """
+        if self.pool is not None and connection is not None:
+            await self.pool.release(connection)
+
+    async def disconnect(self) -> None:
+        """Disconnect from database."""
+        if self.pool:
+            try:
+                log().logger.info("Closing session pool...", extra=self.extra)
+                await self.pool.close(force=True)
+            except Error as err:
+                log().logger.error("Error closing session pool: %s", err, extra=self.extra)
+            else:
+                log().logger.info("Successfully closed session pool.", extra=self.extra)
+            finally:
+                self.pool = None
+
+        if self.connection:
+            try:
+                log().logger.info("Disconnecting from database...", extra=self.extra)
+                await self.connection.close()
+            except Error as err:
+                log().logger.error("Error disconnecting from database: %s", err, extra=self.extra)
+            else:
+                log().logger.info("Successfully disconnected from database.", extra=self.extra)
+            finally:
+                self.connection = None
+
+    async def to_collection(self, connection: AsyncConnection, values: list[Any] | set[Any]) -> DbObject:
+        """Convert a Python list into a SQL collection bind value.
+
+        Args:
+            connection (AsyncConnection): database connection the value is bound on.
+            values (list[Any] | set[Any]): input variable list.
+
+        Returns:
+            DbObject: SQL collection, usable in TABLE(:bind).
+        """
+        values = list(values)
+        type_name = to_collection_type(values)
+        types = self.collection_types.setdefault(connection, {})
+        if type_name not in types:
+            types[type_name] = await connection.gettype(type_name)
+        return types[type_name].newobject(values)
+
+    async def bind_collections(self, connection: AsyncConnection, parameters: list | tuple | dict | None) -> list | tuple | dict | None:
+        """Replace list and set bind values by SQL collections.
+
+        Args:
+            connection (AsyncConnection): database connection the values are bound on.
+            parameters (list | tuple | dict | None): positional or named bind parameters.
+
+        Returns:
+            list | tuple | dict | None: bind parameters ready for AsyncCursor.execute().
+        """
+        collections = (list, set, frozenset)
+        match parameters:
+            case dict():
+                return {name: await self.to_collection(connection, value) if isinstance(value, collections) else value for name, value in parameters.items()}
+            case list() | tuple():
+                return [await self.to_collection(connection, value) if isinstance(value, collections) else value for value in parameters]
+            case _:
+                return parameters
+
+    async def execute_sql(self, cursor: AsyncCursor, query: str, parameters: list | tuple | dict | None = None) -> None:
+        """Execute a SQL query.
+
+        LOBs are fetched inline, as str or bytes, unless DATABASE_FETCH_LOBS is enabled.
+
+        Args:
+            cursor (AsyncCursor): database cursor.
+            query (str): SQL query, with :1 or :name bind placeholders.
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+        """
+        if not self.is_connected:
+            log().logger.error("No active database connection. Please connect first.", extra=self.extra)
+            return
+
+        try:
+            await cursor.execute(query, await self.bind_collections(cursor.connection, parameters), fetch_lobs=self.config.fetch_lobs)
+        except Error as err:
+            log().logger.error("Error executing query: %s", err, extra=self.extra)
+            return
+
+    @staticmethod
+    def cursor_required(func: Callable) -> Callable:
+        """Ensure there is a cursor available to run a SQL query.
+
+        Async generator functions keep their cursor, and pooled connection, until they are exhausted or closed.
+        """
+        if isasyncgenfunction(func):
+
+            @wraps(func)
+            async def generator_wrapper(self, *args, **kwargs) -> AsyncIterator:  # noqa: ANN001,ANN002,ANN003
+                """."""
+                connection = None
+                cursor = None
+                try:
+                    connection = await self.acquire()
+                    cursor = connection.cursor()
+                    async for item in func(self, cursor, *args, **kwargs):
+                        yield item
+                except Error as err:
+                    log().logger.error(err)
+                    if not self.is_connected:
+                        await self.connect()
+                    raise
+                finally:
+                    if cursor:
+                        cursor.close()
+                    await self.release(connection)
+
+            return generator_wrapper
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs) -> list:  # noqa: ANN001,ANN002,ANN003
+            """."""
+            connection = None
+            cursor = None
+            try:
+                connection = await self.acquire()
+                cursor = connection.cursor()
+                result = await func(self, cursor, *args, **kwargs)
+                cursor.close()
+                return result
+            except Error as err:
+                log().logger.error(err)
+                if cursor:
+                    cursor.close()
+                if not self.is_connected:
+                    await self.connect()
+                raise
+            finally:
+                await self.release(connection)
+
+        return wrapper
+
+    async def fetch_batches(self, cursor: AsyncCursor, batch_size: int) -> AsyncIterator[list]:
+        """Fetch rows by batches, in as many round trips as the cursor array size requires.
+
+        Args:
+            cursor (AsyncCursor): database cursor, with an executed query.
+            batch_size (int): number of rows per batch.
+
+        Yields:
+            list: batch of records.
+        """
+        while rows := await cursor.fetchmany(batch_size):
+            yield rows
+
+    @cursor_required
+    async def select(
+        self,
+        cursor: AsyncCursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        arraysize: int | None = None,
+        prefetchrows: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> list:
+        """Run a query and fetch all its records.
+
+        Args:
+            cursor (AsyncCursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            arraysize (int | None, optional): number of rows per fetch round trip. Defaults to the adaptive size, see FetchSizer.
+            prefetchrows (int | None, optional): number of rows returned with the execute round trip. Defaults to the adaptive size.
+            **params: named bind parameters.
+
+        Returns:
+            list: list of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.fetch_sizer.prepare(cursor, query, arraysize, prefetchrows)
+            await self.execute_sql(cursor, query, binds)
+            if arraysize is None:
+                self.fetch_sizer.adapt(cursor, query)
+            rows = await cursor.fetchall()
+            self.fetch_sizer.observe(query, to_observed_row_size(rows), len(rows))
+            metrics.update(to_fetch_metrics(cursor, len(rows)))
+        return rows
+
+    @cursor_required
+    async def select_iter(
+        self,
+        cursor: AsyncCursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        batch_size: int | None = None,
+        *,
+        arraysize: int | None = None,
+        prefetchrows: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> AsyncIterator[list]:
+        """Run a query and stream its records by batches, so memory stays flat whatever the result size.
+
+        Args:
+            cursor (AsyncCursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            arraysize (int | None, optional): number of rows per fetch round trip. Defaults to the adaptive size, see FetchSizer.
+            prefetchrows (int | None, optional): number of rows returned with the execute round trip. Defaults to the adaptive size.
+            **params: named bind parameters.
+
+        Yields:
+            list: batch of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.fetch_sizer.prepare(cursor, query, arraysize, prefetchrows)
+            await self.execute_sql(cursor, query, binds)
+            if arraysize is None:
+                self.fetch_sizer.adapt(cursor, query)
+            count = 0
+            row_size = 0
+            async for rows in self.fetch_batches(cursor, batch_size or self.config.batch_size):
+                row_size = row_size or to_observed_row_size(rows)
+                count += len(rows)
+                metrics.update(to_fetch_metrics(cursor, count))
+                paused = perf_counter()
+                yield rows
+                metrics["idle"] += perf_counter() - paused
+            self.fetch_sizer.observe(query, row_size, count)
+
+    @cursor_required
+    async def execute(self, cursor: AsyncCursor, query: str, parameters: list | tuple | dict | None = None, **params) -> int:  # noqa:ANN003
+        """Run a DML or DDL statement, then commit.
+
+        Args:
+            cursor (AsyncCursor): database cursor, provided by cursor_required.
+            query (str): SQL statement, with :1 or :name bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            int: number of rows affected.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            await self.execute_sql(cursor, query, binds)
+            await cursor.connection.commit()
+            metrics.update(rows=cursor.rowcount, round_trips=2)
+        return cursor.rowcount
+
+    def pipeline(self) -> Pipeline:
+        """Create an empty pipeline of independent statements, see Pipeline.
+
+        Returns:
+            Pipeline: pipeline run by run_pipeline().
+        """
+        return Pipeline(self)
+
+    async def run_pipeline(self, pipeline: Pipeline) -> list[PipelineOpResult]:
+        """Run the statements of a pipeline in a single round trip, then commit if any statement writes.
+
+        Statements failing do not prevent the others from running, their error is logged and returned in place of their result. The round trip
+        is bounded by DATABASE_CALL_TIMEOUT.
+
+        Args:
+            pipeline (Pipeline): queued statements.
+
+        Returns:
+            list[PipelineOpResult]: one result per statement, in queue order, with either rows or an error.
+        """
+        if not pipeline:
+            return []
+
+        connection = await self.acquire()
+        previous = connection.call_timeout
+        try:
+            connection.call_timeout = self.config.call_timeout
+            results = await connection.run_pipeline(pipeline.to_pipeline(), continue_on_error=True)
+        finally:
+            connection.call_timeout = previous
+            await self.release(connection)
+        return pipeline.to_results(results, self.extra)
@@ -0,0 +1,250 @@
+"""Module holding the Oracle helpers shared by the synchronous and asyncio clients: script splitting, collection binds and pipelines.
+
+Typical usage example:
+    for statement in to_statement_list(script):
+        cursor.execute(statement)
+"""
+
+# Standard Library
+from datetime import date
+from decimal import Decimal
+from re import IGNORECASE, match
+from typing import Any
+
+# Third-party
+import oracledb
+from oracledb import PipelineOpResult
+
+# Local Application
+from app_name.database.cache import to_table_names
+from app_name.database.common import to_bind_parameters
+from app_name.event.logger.log import log
+
+# Statements holding semicolons, terminated by a slash alone on its line
+PLSQL_PATTERN = r"(begin|declare|create\s+(or\s+replace\s+)?((editionable|noneditionable)\s+)?(function|procedure|package|trigger|type|library))\b"
+
+
+def to_collection_type(values: list[Any]) -> str:
+    """Get the built-in SQL collection type matching a Python list, to bind it as a single value.
+
+    ['A', 'B'] -> SYS.ODCIVARCHAR2LIST
+    [1, 2, 3] -> SYS.ODCINUMBERLIST
+
+    Note: empty lists are bound as empty SYS.ODCIVARCHAR2LIST, which match nothing.
+
+    Args:
+        values (list[Any]): input variable list.
+
+    Returns:
+        str: SQL collection type name.
+    """
+    sample = next((value for value in values if value is not None), None)
+    match sample:
+        case str() | None:
+            return "SYS.ODCIVARCHAR2LIST"
+        case bool() | int() | float() | Decimal():
+            return "SYS.ODCINUMBERLIST"
+        case date():
+            return "SYS.ODCIDATELIST"
+        case _:
+            message = f"Unsupported collection element type: {type(sample).__name__} -> {sample!r}"
+            raise TypeError(message)
+
+
+def skip_literal(query: str, start: int) -> int:
+    """Find the end of a comment, string literal or quoted identifier.
+
+    Args:
+        query (str): SQL text.
+        start (int): index of the opening token.
+
+    Returns:
+        int: index right after the closing token, or the end of the text if unterminated.
+    """
+    end = -1
+    if query.startswith("--", start):
+        end = query.find("\n", start)
+    elif query.startswith("/*", start):
+        end = query.find("*/", start + 2)
+        end = end + 2 if end != -1 else -1
+    elif query[start] in "qQ":
+        # Alternative quoting: q'[...]', q'{...}', q'<...>', q'(...)' or q'!...!'
+        if start + 2 >= len(query):
+            return len(query)
+        delimiter = query[start + 2]
+        closing = {"[": "]", "{": "}", "(": ")", "<": ">"}.get(delimiter, delimiter)
+        end = query.find(f"{closing}'", start + 3)
+        end = end + 2 if end != -1 else -1
+    else:
+        # Quotes are escaped by doubling them
+        quote = query[start]
+        end = start + 1
+        while (end := query.find(quote, end)) != -1 and query.startswith(quote, end + 1):
+            end += 2
+        end = end + 1 if end != -1 else -1
+    return len(query) if end == -1 else end
+
+
+def is_slash_line(query: str, index: int) -> bool:
+    """Check whether a slash stands alone on its line, the SQL*Plus terminator of PL/SQL units.
+
+    Args:
+        query (str): SQL text.
+        index (int): index of the slash.
+
+    Returns:
+        bool: whether the line only holds the slash.
+    """
+    line_start = query.rfind("\n", 0, index) + 1
+    line_end = query.find("\n", index)
+    line_end = len(query) if line_end == -1 else line_end
+    return not query[line_start:index].strip() and not query[index + 1 : line_end].strip()
+
+
+def to_statement_list(query: str) -> list[str]:
+    """Split a SQL script into statements.
+
+    Semicolons terminate SQL statements, except inside comments, string literals (q-quoted included) and quoted identifiers. PL/SQL units
+    (BEGIN, DECLARE, CREATE PROCEDURE...) contain semicolons, so they end with a slash alone on its line, or at the end of the script.
+
+    Args:
+        query(str): multi-lines SQL query.
+
+    Returns:
+        list: SQL statement list, without terminators except the one ending PL/SQL units.
+    """
+    statements = []
+    code_start = None
+    plsql = False
+    index = 0
+
+    while index < len(query):
+        char = query[index]
+        if query.startswith(("--", "/*"), index):
+            index = skip_literal(query, index)
+            continue
+
+        if code_start is None and not char.isspace():
+            code_start = index
+            plsql = match(PLSQL_PATTERN, query[index:], IGNORECASE) is not None
+
+        # A q-quote only starts a literal when the q is not the end of an identifier
+        previous = query[index - 1] if index else " "
+        if char in "'\"" or (char in "qQ" and query.startswith("'", index + 1) and not previous.isalnum() and previous not in "_$#"):
+            index = skip_literal(query, index)
+            continue
+
+        if (char == ";" and not plsql) or (char == "/" and is_slash_line(query, index)):
+            if code_start is not None:
+                statements.append(query[code_start:index].strip())
+            code_start = None
+            plsql = False
+        index += 1
+
+    if code_start is not None:
+        statements.append(query[code_start:].strip())
+
+    return statements
+
+
+class Pipeline:
+    """Class queuing independent statements, to run them in a single round trip.
+
+    Typical usage example:
+        pipeline = database.pipeline()
+        pipeline.select("select name from users where id = :id", id=1)
+        pipeline.execute("update users set seen = sysdate where id = :id", id=1)
+        users, _ = pipeline.run()
+    """
+
+    def __init__(self, database: Any) -> None:
+        """Initialize class.
+
+        Args:
+            database (Any): Oracle or AsyncOracle instance running the pipeline.
+        """
+        self.database = database
+        self.operations: list[tuple[str, str, list | tuple | dict | None]] = []
+
+    def __len__(self) -> int:
+        """Number of queued statements."""
+        return len(self.operations)
+
+    def select(self, query: str, parameters: list | tuple | dict | None = None, **params) -> int:  # noqa:ANN003
+        """Queue a query, all its records are fetched.
+
+        Args:
+            query (str): SQL query, with :1 or :name bind placeholders, bound to scalar values only, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            int: position of the statement result.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        self.operations.append(("select", self.database.resolve(query, binds), binds))
+        return len(self.operations) - 1
+
+    def execute(self, statement: str, parameters: list | tuple | dict | None = None, **params) -> int:  # noqa:ANN003
+        """Queue a DML statement, committed with the other statements at the end of the pipeline.
+
+        Args:
+            statement (str): SQL statement, with :1 or :name bind placeholders, bound to scalar values only, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            int: position of the statement result.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        self.operations.append(("execute", self.database.resolve(statement, binds), binds))
+        return len(self.operations) - 1
+
+    def tables(self) -> set[str]:
+        """Tables written by the queued statements.
+
+        Returns:
+            set[str]: table names.
+        """
+        return {table for kind, statement, _ in self.operations if kind == "execute" for table in to_table_names(statement)}
+
+    def to_pipeline(self) -> oracledb.Pipeline:
+        """Build the driver pipeline, with a final commit if any statement writes.
+
+        Returns:
+            oracledb.Pipeline: driver pipeline.
+        """
+        pipeline = oracledb.create_pipeline()
+        for kind, statement, parameters in self.operations:
+            if kind == "select":
+                pipeline.add_fetchall(statement, parameters, fetch_lobs=self.database.config.fetch_lobs)
+            else:
+                pipeline.add_execute(statement, parameters)
+        if any(kind == "execute" for kind, _, _ in self.operations):
+            pipeline.add_commit()
+        return pipeline
+
+    def to_results(self, results: list[PipelineOpResult], extra: dict) -> list[PipelineOpResult]:
+        """Log failed statements and drop the result of the final commit.
+
+        Args:
+            results (list[PipelineOpResult]): driver results, in queue order.
+            extra (dict): log extra fields.
+
+        Returns:
+            list[PipelineOpResult]: one result per queued statement, holding either its rows or its error.
+        """
+        for (_, statement, _), result in zip(self.operations, results, strict=False):
+            if result.error is not None:
+                log().logger.error("Error executing pipelined statement: %s\n%s", result.error, statement, extra=extra)
+        if len(results) > len(self.operations) and results[-1].error is not None:
+            log().logger.error("Error committing pipeline: %s", results[-1].error, extra=extra)
+        return results[: len(self.operations)]
+
+    def run(self) -> Any:
+        """Run the queued statements in a single round trip, a failed statement does not prevent the others from running.
+
+        Returns:
+            Any: list of results, awaitable with AsyncOracle, see to_results().
+        """
+        return self.database.run_pipeline(self)
@@ -0,0 +1,848 @@
+"""Module used to interact with the PostgreSQL database.
+
+The PostgreSQL client covers queries, streaming, caching, SQL templates, array DML, COPY loads and unloads, scripts and exports. Parallel and
+incremental extraction, DataFrame writes and pipelines are only provided by the Oracle client.
+"""
+
+# Standard Library
+from collections.abc import Callable, Iterable, Iterator
+from functools import wraps
+from inspect import isgeneratorfunction
+from itertools import chain, count, islice
+from pathlib import Path
+from re import match
+from time import perf_counter, sleep
+
+# Third-party
+import polars as pl
+import psycopg
+from psycopg import Connection, Cursor, Error, ServerCursor
+
+# Local Application
+from app_name.common.config import DatabaseConfig, get_config_class, get_config_value
+from app_name.database.cache import QueryCache, to_table_names
+from app_name.database.common import ScriptError, sink_frame, to_bind_parameters, to_export_path, to_insert_statement, to_lazy_frame, to_update_statement
+from app_name.database.stats import query_stats, to_fetch_metrics, track_query
+from app_name.database.templates import SqlTemplates
+from app_name.event.logger.log import log
+
+# Size of the chunks read from files sent through COPY, expressed in bytes
+COPY_CHUNK_SIZE = 1048576
+
+# Query returning the server clock, run between the statements of a script to time them
+CLOCK_QUERY = "select clock_timestamp()"
+
+# Dollar-quoted string opening tag, $$ or $tag$
+DOLLAR_QUOTE_PATTERN = r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$"
+
+# Polars data types of the common PostgreSQL types, the others are inferred from the values
+POLARS_TYPES = {
+    "bool": pl.Boolean,
+    "int2": pl.Int16,
+    "int4": pl.Int32,
+    "int8": pl.Int64,
+    "float4": pl.Float32,
+    "float8": pl.Float64,
+    "bpchar": pl.String,
+    "varchar": pl.String,
+    "text": pl.String,
+    "date": pl.Date,
+    "time": pl.Time,
+    "timestamp": pl.Datetime("us"),
+    "timestamptz": pl.Datetime("us", "UTC"),
+    "bytea": pl.Binary,
+}
+
+
+def to_copy_statement(table: str, columns: list[str] | None = None, file_format: str = "text") -> str:
+    """Build a COPY statement loading rows sent by the client.
+
+    Args:
+        table (str): target table name.
+        columns (list[str] | None, optional): loaded column names. Defaults to all columns, in table order.
+        file_format (str, optional): COPY format: text, csv or binary. Defaults to "text".
+
+    Returns:
+        str: COPY FROM STDIN statement.
+    """
+    target = f"{table} ({', '.join(columns)})" if columns else table
+    options = "format csv, header" if file_format == "csv" else f"format {file_format}"
+    return f"copy {target} from stdin with ({options})"
+
+
+def skip_block_comment(query: str, start: int) -> int:
+    """Find the end of the block comment starting at an index, block comments nest.
+
+    Args:
+        query (str): SQL script.
+        start (int): index of the opening /*.
+
+    Returns:
+        int: index following the matching */, or the script length if it is not terminated.
+    """
+    depth = 0
+    index = start
+    while index < len(query):
+        if query.startswith("/*", index):
+            depth += 1
+            index += 2
+        elif query.startswith("*/", index):
+            depth -= 1
+            index += 2
+            if not depth:
+                return index
+        else:
+            index += 1
+    return len(query)
+
+
+def skip_literal(query: str, start: int) -> int:
+    """Find the end of the comment, string literal or quoted identifier starting at an index.
+
+    Args:
+        query (str): SQL script.
+        start (int): index of the opening characters.
+
+    Returns:
+        int: index following the closing characters, or the script length if it is not terminated.
+    """
+    if query.startswith("--", start):
+        end = query.find("\n", start)
+        return len(query) if end < 0 else end + 1
+
+    if query.startswith("/*", start):
+        return skip_block_comment(query, start)
+
+    if tag := match(DOLLAR_QUOTE_PATTERN, query[start:]):
+        end = query.find(tag.group(), start + len(tag.group()))
+        return len(query) if end < 0 else end + len(tag.group())
+
+    # Doubled quotes escape quotes, as do backslashes in E'' strings
+    quote = query[start]
+    escapes = quote == "'" and start > 0 and query[start - 1] in "eE"
+    index = start + 1
+    while index < len(query):
+        if escapes and query[index] == "\\":
+            index += 2
+        elif query[index] == quote:
+            if not query.startswith(quote, index + 1):
+                return index + 1
+            index += 2
+        else:
+            index += 1
+    return len(query)
+
+
+def to_statement_list(query: str) -> list[str]:
+    """Split a SQL script into statements.
+
+    Semicolons terminate statements, except inside comments, string literals (dollar-quoted included, as in function bodies) and quoted
+    identifiers.
+
+    Args:
+        query (str): multi-lines SQL script.
+
+    Returns:
+        list[str]: SQL statements, without terminators.
+    """
+    statements = []
+    code_start = None
+    index = 0
+
+    while index < len(query):
+        char = query[index]
+        if code_start is None and not char.isspace() and not query.startswith(("--", "/*", ";"), index):
+            code_start = index
+
+        # A dollar sign only opens a dollar quote when it does not end an identifier or a positional parameter
+        previous = query[index - 1] if index else " "
+        dollar_quote = char == "$" and not previous.isalnum() and previous not in "_$" and match(DOLLAR_QUOTE_PATTERN, query[index:])
+        if query.startswith(("--", "/*"), index) or char in "'\"" or dollar_quote:
+            index = skip_literal(query, index)
+            continue
+
+        if char == ";":
+            if code_start is not None:
+                statements.append(query[code_start:index].strip())
+            code_start = None
+        index += 1
+
+    if code_start is not None and (statement := query[code_start:].strip()):
+        statements.append(statement)
+
+    return statements
+
+
+def to_timed_script(statements: list[str]) -> str:
+    """Build a script reading the server clock before and after every statement, so that a single round trip times each of them.
+
+    Args:
+        statements (list[str]): SQL statements, as returned by to_statement_list().
+
+    Returns:
+        str: SQL script, with one result per clock read and per statement.
+    """
+    # Statements may end with a line comment, so terminators go on their own line
+    return "\n;\n".join(chain.from_iterable((CLOCK_QUERY, statement) for statement in statements)) + f"\n;\n{CLOCK_QUERY}"
+
+
+def to_upsert_statement(table: str, columns: list[str], keys: list[str]) -> str:
+    """Build an INSERT ... ON CONFLICT statement with positional binds, in columns order.
+
+    Args:
+        table (str): target table name.
+        columns (list[str]): merged column names, keys included.
+        keys (list[str]): key column names, backed by a unique constraint.
+
+    Returns:
+        str: INSERT ... ON CONFLICT DO UPDATE statement.
+    """
+    assignments = ", ".join(f"{column} = excluded.{column}" for column in columns if column not in keys) or f"{keys[0]} = excluded.{keys[0]}"
+    return f"{to_insert_statement(table, columns, 'format')} on conflict ({', '.join(keys)}) do update set {assignments}"
+
+
+def to_data_frame(cursor: Cursor | ServerCursor, rows: list) -> pl.DataFrame:
+    """Convert fetched records into a Polars DataFrame, typed from the cursor description.
+
+    Args:
+        cursor (Cursor | ServerCursor): database cursor, with an executed query.
+        rows (list): records fetched from the cursor.
+
+    Returns:
+        pl.DataFrame: records, one column per selected column.
+    """
+    schema = []
+    for column in cursor.description or []:
+        info = cursor.adapters.types.get(column.type_code)
+        schema.append((column.name, POLARS_TYPES.get(info.name) if info else None))
+    return pl.DataFrame(rows, schema=schema, orient="row", infer_schema_length=None)
+
+
+class Postgres:
+    """Class specifying attributes and methods related to the PostgreSQL database."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.config: DatabaseConfig = get_config_class("database")
+        self.extra = {"database_type": self.config.type}
+
+        self.connection = None
+        # Server-side cursors are named, unique per connection
+        self.cursor_ids = count(1)
+        self.cache = self.create_cache() if self.config.cache else None
+        self.templates: SqlTemplates | None = None
+
+    def create_cache(self) -> QueryCache:
+        """Create the query result cache, stored under the output directory unless configured otherwise.
+
+        Returns:
+            QueryCache: query result cache.
+        """
+        path = None
+        if self.config.cache_disk:
+            path = self.config.cache_path or get_config_value("app", "output_path").joinpath("cache")
+        return QueryCache(self.config.cache_max_size, self.config.cache_ttl, path, self.config.cache_disk_max_size)
+
+    def create_templates(self) -> SqlTemplates:
+        """Create the SQL template registry, loaded from the sql directory of the configuration path.
+
+        Returns:
+            SqlTemplates: SQL templates, with %(name)s bind placeholders.
+        """
+        return SqlTemplates(get_config_value("app", "config_path").joinpath("sql"), paramstyle="pyformat")
+
+    def resolve(self, query: str, binds: list | tuple | dict | None) -> str:
+        """Resolve a SQL template name into its statement, after checking its bind parameters, see SqlTemplates.resolve().
+
+        Args:
+            query (str): SQL text or template name.
+            binds (list | tuple | dict | None): positional or named bind parameters.
+
+        Returns:
+            str: SQL text.
+        """
+        if self.templates is None:
+            self.templates = self.create_templates()
+        return self.templates.resolve(query, binds)
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether a connection is open."""
+        return self.connection is not None and not self.connection.closed
+
+    def connect(self) -> None:
+        """Connect to database."""
+        log().logger.info("Connecting to database...", extra=self.extra)
+        for attempt in range(1, self.config.retry_max + 1):
+            try:
+                self.connection = self.open_connection()
+            except Error as err:
+                log().logger.error("Error connecting to database: %s", err, extra=self.extra)
+            else:
+                log().logger.info("Successfully connected to database.", extra=self.extra)
+                break
+            if attempt == self.config.retry_max:
+                log().logger.info("Attempts: %s/%s. Aborting...", attempt, self.config.retry_max, extra=self.extra)
+                message = "Unable to establish database connection"
+                raise Exception(message)
+            log().logger.info("Attempts: %s/%s. Retrying in %s seconds...", attempt, self.config.retry_max, self.config.retry_delay, extra=self.extra)
+            sleep(self.config.retry_delay)
+
+    def open_connection(self) -> Connection:
+        """Open a connection, in autocommit mode, with the schema first in the search path, and statements cancelled after DATABASE_CALL_TIMEOUT.
+
+        Returns:
+            Connection: database connection.
+        """
+        options = []
+        if self.config.schema:
+            options.append(f"-c search_path={self.config.schema}")
+        if self.config.call_timeout:
+            options.append(f"-c statement_timeout={self.config.call_timeout}")
+        return psycopg.connect(
+            host=self.config.host,
+            port=self.config.port,
+            dbname=self.config.name,
+            user=self.config.username,
+            password=self.config.password,
+            application_name=get_config_value("app", "name"),
+            options=" ".join(options) or None,
+            autocommit=True,
+        )
+
+    def disconnect(self) -> None:
+        """Disconnect from database."""
+        if self.cache:
+            log().logger.info("Query cache statistics: %s", self.cache.stats(), extra=self.extra)
+
+        if self.connection:
+            try:
+                log().logger.info("Disconnecting from database...", extra=self.extra)
+                self.connection.close()
+            except Error as err:
+                log().logger.error("Error disconnecting from database: %s", err, extra=self.extra)
+            else:
+                log().logger.info("Successfully disconnected from database.", extra=self.extra)
+            finally:
+                self.connection = None
+
+    def execute_sql(self, cursor: Cursor | ServerCursor, query: str, parameters: list | tuple | dict | None = None) -> None:
+        """Execute a SQL query.
+
+        List values are adapted to PostgreSQL arrays, to be used with = any(%s).
+
+        Args:
+            cursor (Cursor | ServerCursor): database cursor.
+            query (str): SQL query, with %s or %(name)s bind placeholders.
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+        """
+        if not self.is_connected:
+            log().logger.error("No active database connection. Please connect first.", extra=self.extra)
+            return
+
+        try:
+            cursor.execute(query, parameters)
+        except Error as err:
+            log().logger.error("Error executing query: %s", err, extra=self.extra)
+            return
+
+    @staticmethod
+    def cursor_required(func: Callable) -> Callable:
+        """Ensure there is a cursor available to run a SQL query.
+
+        Generator functions get a server-side cursor, so that rows are fetched on demand. Its transaction stays open until they are exhausted or
+        closed.
+        """
+        if isgeneratorfunction(func):
+
+            @wraps(func)
+            def generator_wrapper(self, *args, **kwargs) -> Iterator:  # noqa: ANN001,ANN002,ANN003
+                """."""
+                try:
+                    with self.connection.transaction(), self.connection.cursor(name=f"cursor_{next(self.cursor_ids)}") as cursor:
+                        yield from func(self, cursor, *args, **kwargs)
+                except Error as err:
+                    log().logger.error(err)
+                    if not self.is_connected:
+                        self.connect()
+                    raise
+
+            return generator_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs) -> list:  # noqa: ANN001,ANN002,ANN003
+            """."""
+            try:
+                with self.connection.cursor() as cursor:
+                    return func(self, cursor, *args, **kwargs)
+            except Error as err:
+                log().logger.error(err)
+                if not self.is_connected:
+                    self.connect()
+                raise
+
+        return wrapper
+
+    def fetch_all(self, cursor: Cursor) -> list:
+        """."""
+        return cursor.fetchall() if cursor else []
+
+    def fetch_batches(self, cursor: ServerCursor, batch_size: int) -> Iterator[list]:
+        """Fetch rows by batches, one round trip per batch.
+
+        Args:
+            cursor (ServerCursor): server-side cursor, with an executed query.
+            batch_size (int): number of rows per batch.
+
+        Yields:
+            list: batch of records.
+        """
+        cursor.arraysize = batch_size
+        while rows := cursor.fetchmany(batch_size):
+            yield rows
+
+    @cursor_required
+    def select(self, cursor: Cursor, query: str, parameters: list | tuple | dict | None = None, **params) -> list:  # noqa:ANN003
+        """Run a query and fetch all its records.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            list: list of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.execute_sql(cursor, query, binds)
+            rows = self.fetch_all(cursor)
+            metrics.update(to_fetch_metrics(cursor, len(rows)), round_trips=1)
+        return rows
+
+    @cursor_required
+    def select_iter(
+        self,
+        cursor: ServerCursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Iterator[list]:
+        """Run a query and stream its records by batches, through a server-side cursor, so memory stays flat whatever the result size.
+
+        Args:
+            cursor (ServerCursor): server-side cursor, provided by cursor_required.
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Yields:
+            list: batch of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.execute_sql(cursor, query, binds)
+            fetched = 0
+            for rows in self.fetch_batches(cursor, batch_size or self.config.batch_size):
+                fetched += len(rows)
+                metrics.update(to_fetch_metrics(cursor, fetched))
+                paused = perf_counter()
+                yield rows
+                metrics["idle"] += perf_counter() - paused
+
+    @cursor_required
+    def execute(self, cursor: Cursor, query: str, parameters: list | tuple | dict | None = None, **params) -> int:  # noqa:ANN003
+        """Run a DML or DDL statement, committed on its own.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL statement, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            int: number of rows affected.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.execute_sql(cursor, query, binds)
+            # Statements not affecting rows report -1
+            metrics["rows"] = max(cursor.rowcount, 0)
+        for table in to_table_names(query):
+            self.invalidate(table)
+        return cursor.rowcount
+
+    @cursor_required
+    def select_df(self, cursor: Cursor, query: str, parameters: list | tuple | dict | None = None, **params) -> pl.DataFrame:  # noqa:ANN003
+        """Run a query and fetch all its records as a Polars DataFrame.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            **params: named bind parameters.
+
+        Returns:
+            pl.DataFrame: query result.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.execute_sql(cursor, query, binds)
+            data = to_data_frame(cursor, self.fetch_all(cursor))
+            metrics.update(rows=data.height, size=data.estimated_size())
+        return data
+
+    @cursor_required
+    def select_df_iter(
+        self,
+        cursor: ServerCursor,
+        query: str,
+        parameters: list | tuple | dict | None = None,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Iterator[pl.DataFrame]:
+        """Run a query and stream its records as Polars DataFrames, one per batch, through a server-side cursor.
+
+        Args:
+            cursor (ServerCursor): server-side cursor, provided by cursor_required.
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            batch_size (int | None, optional): number of rows per batch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Yields:
+            pl.DataFrame: batch of records.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        with track_query(query) as metrics:
+            self.execute_sql(cursor, query, binds)
+            metrics["round_trips"] = 0
+            for rows in self.fetch_batches(cursor, batch_size or self.config.batch_size):
+                data = to_data_frame(cursor, rows)
+                metrics["rows"] += data.height
+                metrics["round_trips"] += 1
+                metrics["size"] += data.estimated_size()
+                paused = perf_counter()
+                yield data
+                metrics["idle"] += perf_counter() - paused
+
+    def select_df_cached(self, query: str, parameters: list | tuple | dict | None = None, tables: set[str] | None = None, **params) -> pl.DataFrame:  # noqa:ANN003
+        """Run a query through the query cache, as a Polars DataFrame.
+
+        The query only reaches the database on a cache miss, or when the cache is disabled.
+
+        Args:
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            tables (set[str] | None, optional): tables the result depends on, for invalidation. Defaults to the tables found in the query.
+            **params: named bind parameters.
+
+        Returns:
+            pl.DataFrame: query result.
+        """
+        binds = to_bind_parameters(parameters, **params)
+        query = self.resolve(query, binds)
+        if self.cache is None:
+            return self.select_df(query, binds)
+
+        key = self.cache.key(query, binds)
+        data = self.cache.get(key)
+        if data is None:
+            data = self.select_df(query, binds)
+            self.cache.put(key, data, tables or to_table_names(query))
+        return data
+
+    def select_cached(self, query: str, parameters: list | tuple | dict | None = None, tables: set[str] | None = None, **params) -> list:  # noqa:ANN003
+        """Run a query through the query cache.
+
+        Args:
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            tables (set[str] | None, optional): tables the result depends on, for invalidation. Defaults to the tables found in the query.
+            **params: named bind parameters.
+
+        Returns:
+            list: list of records.
+        """
+        return self.select_df_cached(query, parameters, tables, **params).rows()
+
+    def invalidate(self, table: str) -> None:
+        """Drop cached results depending on a table, if the query cache is enabled.
+
+        Args:
+            table (str): table name, schema included if used in queries.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(table)
+
+    def execute_many(self, cursor: Cursor, statement: str, rows: Iterable[tuple], table: str, batch_size: int | None = None) -> int:
+        """Execute a DML statement for many rows, one pipelined transaction per batch.
+
+        When a batch fails, it is replayed row by row: rejected rows are logged and skipped, the rest of the batch is still applied.
+
+        Args:
+            cursor (Cursor): database cursor.
+            statement (str): DML statement with positional binds, or SQL template name, see resolve().
+            rows (Iterable[tuple]): bind values, one tuple per row.
+            table (str): target table name, for logging.
+            batch_size (int | None, optional): number of rows per transaction. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows affected.
+        """
+        affected = 0
+        rejected = 0
+        extra = self.extra | {"table": table}
+
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is not None:
+            # Bind parameters are checked against the first row only
+            statement = self.resolve(statement, first)
+            iterator = chain([first], iterator)
+
+        with track_query(statement) as metrics:
+            while batch := list(islice(iterator, batch_size or self.config.batch_size)):
+                metrics["round_trips"] += 1
+                try:
+                    with cursor.connection.transaction():
+                        cursor.executemany(statement, batch)
+                        affected += cursor.rowcount
+                    continue
+                except Error:
+                    log().logger.debug("Batch rejected, replaying it row by row.", extra=extra)
+
+                for row in batch:
+                    metrics["round_trips"] += 1
+                    try:
+                        with cursor.connection.transaction():
+                            cursor.execute(statement, row)
+                            affected += cursor.rowcount
+                    except Error as err:
+                        rejected += 1
+                        log().logger.error("Error writing record: %s", err, extra=extra | {"record": str(row)})
+            metrics["rows"] = affected
+
+        self.invalidate(table)
+        log().logger.info("%s rows written, %s rows rejected.", affected, rejected, extra=extra)
+        return affected
+
+    @cursor_required
+    def insert_many(self, cursor: Cursor, table: str, columns: list[str], rows: Iterable[tuple], *, batch_size: int | None = None) -> int:
+        """Insert many rows through COPY, one streamed COPY and transaction per batch.
+
+        Unlike array DML, COPY is all or nothing: a rejected row aborts its whole batch, the batches already loaded are kept.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            columns (list[str]): inserted column names.
+            rows (Iterable[tuple]): values in columns order, one tuple per row.
+            batch_size (int | None, optional): number of rows per transaction. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows inserted.
+        """
+        statement = to_copy_statement(table, columns)
+        inserted = 0
+        iterator = iter(rows)
+        with track_query(statement) as metrics:
+            metrics["round_trips"] = 0
+            while batch := list(islice(iterator, batch_size or self.config.batch_size)):
+                with cursor.connection.transaction(), cursor.copy(statement) as copy:
+                    for row in batch:
+                        copy.write_row(row)
+                inserted += len(batch)
+                metrics["round_trips"] += 1
+            metrics["rows"] = inserted
+
+        self.invalidate(table)
+        log().logger.info("%s rows written.", inserted, extra=self.extra | {"table": table})
+        return inserted
+
+    @cursor_required
+    def update_many(self, cursor: Cursor, table: str, columns: list[str], keys: list[str], rows: Iterable[tuple], *, batch_size: int | None = None) -> int:
+        """Update many rows, pipelined by batches.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            columns (list[str]): updated column names.
+            keys (list[str]): key column names identifying the rows to update.
+            rows (Iterable[tuple]): values in columns then keys order, one tuple per row.
+            batch_size (int | None, optional): number of rows per transaction. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows updated.
+        """
+        return self.execute_many(cursor, to_update_statement(table, columns, keys, "format"), rows, table, batch_size)
+
+    @cursor_required
+    def merge_many(self, cursor: Cursor, table: str, columns: list[str], keys: list[str], rows: Iterable[tuple], *, batch_size: int | None = None) -> int:
+        """Insert or update many rows, pipelined by batches.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            columns (list[str]): merged column names, keys included.
+            keys (list[str]): key column names, backed by a unique constraint.
+            rows (Iterable[tuple]): values in columns order, one tuple per row.
+            batch_size (int | None, optional): number of rows per transaction. Defaults to DATABASE_BATCH_SIZE.
+
+        Returns:
+            int: number of rows merged.
+        """
+        return self.execute_many(cursor, to_upsert_statement(table, columns, keys), rows, table, batch_size)
+
+    @cursor_required
+    def execute_script(self, cursor: Cursor, script: str) -> list[tuple[str, float]]:
+        """Execute a SQL script in a single round trip and a single transaction.
+
+        Statements are sent together through the simple query protocol, so the script cannot hold bind placeholders. The server clock is read
+        between statements, so that each of them is timed without a round trip of its own.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            script (str): SQL script, see to_statement_list() for the supported syntax.
+
+        Returns:
+            list[tuple[str, float]]: executed statements and their duration, expressed in seconds, empty if the script was rolled back.
+
+        Raises:
+            ScriptError: if a statement fails and DATABASE_STOP_ON_ERROR is enabled, once the script is rolled back.
+        """
+        statements = to_statement_list(script)
+        if not statements:
+            return []
+
+        try:
+            with track_query(script), cursor.connection.transaction():
+                cursor.execute(to_timed_script(statements))
+                # Clock reads and statement results alternate
+                times = [cursor.fetchone()[0]]
+                while cursor.nextset() and cursor.nextset():
+                    times.append(cursor.fetchone()[0])
+        except Error as err:
+            log().logger.error("Error executing script, rolled back: %s", err, extra=self.extra)
+            if self.config.stop_on_error:
+                message = f"Script aborted, rolled back: {err}"
+                raise ScriptError(message) from err
+            return []
+
+        timings = [(statement, (times[i] - times[i - 1]).total_seconds()) for i, statement in enumerate(statements, start=1)]
+        for statement, duration in timings:
+            # Statements share the round trip of the script
+            query_stats().record(statement, duration, round_trips=0)
+            log().logger.debug("%.3fs - %s", duration, statement, extra=self.extra)
+        log().logger.info("%s statements executed in 1 round trip.", len(timings), extra=self.extra)
+        return timings
+
+    @cursor_required
+    def load(self, cursor: Cursor, table: str, path: Path | str, columns: list[str] | None = None) -> int:
+        """Load a CSV file with a header line into a table through COPY, streamed in a single transaction.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            table (str): target table name.
+            path (Path | str): input file path, relative to the input directory unless absolute.
+            columns (list[str] | None, optional): loaded column names, in file order. Defaults to all columns, in table order.
+
+        Returns:
+            int: number of rows loaded.
+        """
+        file_path = get_config_value("app", "input_path").joinpath(path)
+        statement = to_copy_statement(table, columns, "csv")
+
+        start = perf_counter()
+        with track_query(statement) as metrics, cursor.connection.transaction():
+            with cursor.copy(statement) as copy, file_path.open("rb") as file:
+                while chunk := file.read(COPY_CHUNK_SIZE):
+                    copy.write(chunk)
+            metrics.update(rows=cursor.rowcount, size=file_path.stat().st_size)
+
+        self.invalidate(table)
+        log().logger.info("Loaded %s rows from %s in %.3fs.", cursor.rowcount, file_path, perf_counter() - start, extra=self.extra | {"table": table})
+        return cursor.rowcount
+
+    @cursor_required
+    def unload(self, cursor: Cursor, query: str, file_path: Path, parameters: list | tuple | dict | None = None) -> int:
+        """Stream a query result to a CSV file with a header line, through COPY.
+
+        Args:
+            cursor (Cursor): database cursor, provided by cursor_required.
+            query (str): SQL query, with %s or %(name)s bind placeholders, merged client-side, or SQL template name, see resolve().
+            file_path (Path): output file path.
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+
+        Returns:
+            int: number of rows unloaded.
+        """
+        query = self.resolve(query, parameters)
+        statement = f"copy ({query}) to stdout with (format csv, header)"
+        with track_query(query) as metrics:
+            with cursor.copy(statement, parameters) as copy, file_path.open("wb") as file:
+                for data in copy:
+                    file.write(data)
+                    metrics["size"] += len(data)
+            # The row count is only known once the copy is over
+            metrics["rows"] = cursor.rowcount
+        return cursor.rowcount
+
+    def export(
+        self,
+        query: str,
+        path: Path | str,
+        parameters: list | tuple | dict | None = None,
+        *,
+        file_format: str = "parquet",
+        row_group_size: int | None = None,
+        compression: str | None = None,
+        batch_size: int | None = None,
+        **params,  # noqa:ANN003
+    ) -> Path:
+        """Stream a query result to a Parquet, Arrow IPC or CSV file, holding only a few batches in memory.
+
+        CSV files are written by the server through COPY, the other formats are fed by a server-side cursor.
+
+        Args:
+            query (str): SQL query, with %s or %(name)s bind placeholders, or SQL template name, see resolve().
+            path (Path | str): output file path, relative to the output directory unless absolute.
+            parameters (list | tuple | dict | None, optional): positional or named bind parameters. Defaults to None.
+            file_format (str, optional): file format: parquet, ipc or csv. Defaults to "parquet".
+            row_group_size (int | None, optional): number of rows per Parquet row group. Defaults to DATABASE_EXPORT_ROW_GROUP_SIZE.
+            compression (str | None, optional): Parquet or Arrow IPC compression codec. Defaults to DATABASE_EXPORT_COMPRESSION.
+            batch_size (int | None, optional): number of rows per fetch. Defaults to DATABASE_BATCH_SIZE.
+            **params: named bind parameters.
+
+        Returns:
+            Path: output file path.
+
+        Raises:
+            ValueError: if the file format is not supported.
+        """
+        file_path = to_export_path(path, file_format)
+        compression = compression or self.config.export_compression
+
+        start = perf_counter()
+        if file_format == "csv":
+            self.unload(query, file_path, to_bind_parameters(parameters, **params))
+            log().logger.info("Exported query result to %s in %.3fs.", file_path, perf_counter() - start, extra=self.extra)
+            return file_path
+
+        data = to_lazy_frame(self.select_df_iter(query, parameters, batch_size, **params))
+        if data is None:
+            log().logger.warning("Query returned no rows, nothing to export to %s.", file_path, extra=self.extra)
+            return file_path
+
+        sink_frame(data, file_path, file_format, compression, row_group_size or self.config.export_row_group_size)
+
+        log().logger.info("Exported query result to %s in %.3fs.", file_path, perf_counter() - start, extra=self.extra)
+        return file_path
@@ -0,0 +1,145 @@
+"""Module used to size fetch round trips per query.
+
+Typical usage example:
+    sizer = FetchSizer(target_size=1048576, arraysize=100, prefetchrows=2, max_arraysize=10000)
+    sizer.prepare(cursor, query)
+    cursor.execute(query)
+    sizer.adapt(cursor, query)
+    rows = cursor.fetchall()
+    sizer.observe(query, to_observed_row_size(rows), len(rows))
+"""
+
+# Standard Library
+from threading import Lock
+from typing import Any
+
+# Local Application
+from app_name.database.stats import DEFAULT_COLUMN_SIZE, to_row_size, to_sql_hash
+
+# Number of rows sampled to measure the size of fetched rows
+SAMPLE_SIZE = 100
+
+
+def to_value_size(value: Any) -> int:
+    """Estimate the size of a fetched value on the wire.
+
+    Args:
+        value (Any): fetched value.
+
+    Returns:
+        int: size, expressed in bytes.
+    """
+    match value:
+        case None:
+            return 1
+        case str():
+            return len(value.encode("utf-8"))
+        case bytes():
+            return len(value)
+        case _:
+            return DEFAULT_COLUMN_SIZE
+
+
+def to_observed_row_size(rows: list) -> int:
+    """Measure the average size of fetched rows, from a sample.
+
+    Args:
+        rows (list): fetched records.
+
+    Returns:
+        int: average row size, expressed in bytes, 0 without rows.
+    """
+    sample = rows[:SAMPLE_SIZE]
+    if not sample:
+        return 0
+    return sum(to_value_size(value) for row in sample for value in row) // len(sample)
+
+
+class FetchSizer:
+    """Class sizing cursor fetches so that each round trip carries about the same number of bytes.
+
+    The array size starts from its configured default, is refined from the described column widths once the query is executed, then from the
+    row size and row count observed on the previous runs of the same statement. Queries known to return fewer rows than a round trip can hold
+    get all of them prefetched, with the execute call.
+    """
+
+    def __init__(self, target_size: int, arraysize: int, prefetchrows: int, max_arraysize: int) -> None:
+        """Initialize class.
+
+        Args:
+            target_size (int): target size of a fetch round trip, expressed in bytes.
+            arraysize (int): default number of rows per fetch round trip.
+            prefetchrows (int): default number of rows returned with the execute round trip.
+            max_arraysize (int): maximum number of rows per fetch round trip.
+        """
+        self.target_size = target_size
+        self.arraysize = arraysize
+        self.prefetchrows = prefetchrows
+        self.max_arraysize = max_arraysize
+
+        # Row size and row count observed on the last run, per statement hash
+        self.history: dict[str, tuple[int, int]] = {}
+        self.lock = Lock()
+
+    def to_arraysize(self, row_size: int) -> int:
+        """Compute the number of rows fitting in a fetch round trip.
+
+        Args:
+            row_size (int): row size, expressed in bytes.
+
+        Returns:
+            int: number of rows per fetch round trip.
+        """
+        if row_size <= 0:
+            return self.arraysize
+        return max(1, min(self.target_size // row_size, self.max_arraysize))
+
+    def prepare(self, cursor: Any, query: str, arraysize: int | None = None, prefetchrows: int | None = None) -> None:
+        """Size a cursor before executing a query, from overrides, history or defaults.
+
+        Args:
+            cursor (Any): database cursor.
+            query (str): SQL query about to be executed.
+            arraysize (int | None, optional): number of rows per fetch round trip. Defaults to the adaptive size.
+            prefetchrows (int | None, optional): number of rows returned with the execute round trip. Defaults to the adaptive size.
+        """
+        with self.lock:
+            observed = self.history.get(to_sql_hash(query))
+
+        size = self.arraysize
+        prefetch = self.prefetchrows
+        if observed is not None:
+            row_size, rows = observed
+            size = self.to_arraysize(row_size)
+            if rows < size:
+                # One more row than expected, so that the end of the result is detected without another round trip
+                prefetch = rows + 1
+
+        cursor.arraysize = arraysize or size
+        cursor.prefetchrows = prefetchrows if prefetchrows is not None else prefetch
+
+    def adapt(self, cursor: Any, query: str) -> None:
+        """Resize a cursor from the described column widths, for statements without history.
+
+        Args:
+            cursor (Any): database cursor, with an executed query.
+            query (str): SQL query executed.
+        """
+        with self.lock:
+            if to_sql_hash(query) in self.history:
+                return
+        if cursor.description:
+            cursor.arraysize = self.to_arraysize(to_row_size(cursor.description))
+
+    def observe(self, query: str, row_size: int, rows: int) -> None:
+        """Record the row size and row count of a fully fetched query, to size its next runs.
+
+        Args:
+            query (str): SQL query executed.
+            row_size (int): average row size, expressed in bytes.
+            rows (int): number of rows fetched.
+        """
+        if row_size <= 0 and rows:
+            return
+        with self.lock:
+            self.history[to_sql_hash(query)] = (row_size, rows)
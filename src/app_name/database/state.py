@@ -0,0 +1,144 @@
+"""Module used to persist incremental extraction watermarks between runs.
+
+Typical usage example:
+    store = WatermarkStore(Path("/app/output/state"))
+    watermark = store.get("orders")
+    rows = run("select * from orders where updated_at > :watermark", watermark=watermark)
+    store.put("orders", max(row[0] for row in rows))
+"""
+
+# Standard Library
+from datetime import date, datetime
+from decimal import Decimal
+from json import JSONDecodeError, dumps, loads
+from os import fsync
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any
+
+# Local Application
+from app_name.event.logger.log import log
+
+
+def to_state_value(value: Any) -> dict[str, Any]:
+    """Convert a watermark into a JSON serializable value, tagged with its type.
+
+    Datetime, date, Decimal, float, int, and str are supported.
+
+    Args:
+        value (Any): watermark.
+
+    Returns:
+        dict[str, Any]: watermark type and value.
+
+    Raises:
+        TypeError: if the watermark type is not supported.
+    """
+    match value:
+        case datetime():
+            return {"type": "datetime", "value": value.isoformat()}
+        case date():
+            return {"type": "date", "value": value.isoformat()}
+        case Decimal():
+            return {"type": "decimal", "value": str(value)}
+        case bool():
+            message = "Unsupported watermark type: bool"
+            raise TypeError(message)
+        case float() | int() | str():
+            return {"type": type(value).__name__, "value": value}
+        case _:
+            message = f"Unsupported watermark type: {type(value).__name__}"
+            raise TypeError(message)
+
+
+def from_state_value(state: dict[str, Any]) -> Any:
+    """Convert a tagged JSON value back into a watermark.
+
+    Args:
+        state (dict[str, Any]): watermark type and value, see to_state_value().
+
+    Returns:
+        Any: watermark.
+    """
+    match state["type"]:
+        case "datetime":
+            return datetime.fromisoformat(state["value"])
+        case "date":
+            return date.fromisoformat(state["value"])
+        case "decimal":
+            return Decimal(state["value"])
+        case _:
+            return state["value"]
+
+
+class WatermarkStore:
+    """Class storing the high-water mark of incremental queries, in a JSON file replaced atomically on every update."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize class.
+
+        Args:
+            path (Path): state directory, created if missing.
+        """
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.file = self.path.joinpath("watermarks.json")
+        self.lock = Lock()
+        self.watermarks = self.load()
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Load the stored watermarks.
+
+        Returns:
+            dict[str, dict[str, Any]]: tagged watermarks, per query name.
+        """
+        try:
+            return loads(self.file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, JSONDecodeError) as err:
+            log().logger.warning("Error reading watermarks, running full extractions: %s", err)
+            return {}
+
+    def save(self) -> None:
+        """Save the watermarks atomically, so that a crash leaves either the previous or the new file."""
+        with NamedTemporaryFile("w", encoding="utf-8", dir=self.path, suffix=".tmp", delete=False) as file:
+            file.write(dumps(self.watermarks, indent=2))
+            file.flush()
+            fsync(file.fileno())
+        Path(file.name).replace(self.file)
+
+    def get(self, name: str) -> Any:
+        """Get the watermark of a query.
+
+        Args:
+            name (str): query name.
+
+        Returns:
+            Any: last high-water mark, None if the query never completed.
+        """
+        with self.lock:
+            state = self.watermarks.get(name)
+        return from_state_value(state) if state is not None else None
+
+    def put(self, name: str, value: Any) -> None:
+        """Store the watermark of a query.
+
+        Args:
+            name (str): query name.
+            value (Any): new high-water mark.
+        """
+        with self.lock:
+            self.watermarks[name] = to_state_value(value)
+            self.save()
+
+    def reset(self, name: str) -> None:
+        """Forget the watermark of a query, so that its next run is a full extraction.
+
+        Args:
+            name (str): query name.
+        """
+        with self.lock:
+            if self.watermarks.pop(name, None) is not None:
+                self.save()
@@ -0,0 +1,194 @@
+"""Module used to collect per-statement database statistics.
+
+Typical usage example:
+    with track_query(query) as metrics:
+        cursor.execute(query)
+        rows = cursor.fetchall()
+        metrics.update(to_fetch_metrics(cursor, len(rows)))
+    export_query_stats()
+"""
+
+# Standard Library
+from collections.abc import Iterator
+from contextlib import contextmanager
+from hashlib import sha256
+from json import dumps
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+# Local Application
+from app_name.common.config import get_config_value
+from app_name.event.logger.log import log
+
+# Assumed size of a column without described size, expressed in bytes
+DEFAULT_COLUMN_SIZE = 22
+
+
+def to_sql_hash(query: str) -> str:
+    """Compute a stable identifier of a SQL statement, whitespace and case insensitive.
+
+    Args:
+        query (str): SQL statement.
+
+    Returns:
+        str: 16 hexadecimal characters hash.
+    """
+    normalized = " ".join(query.split()).lower()
+    return sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def to_row_size(description: list | None) -> int:
+    """Estimate the maximum size of a row from a cursor description.
+
+    Columns without described size, such as Oracle NUMBER and DATE or PostgreSQL variable-length types, count for DEFAULT_COLUMN_SIZE bytes.
+
+    Args:
+        description (list | None): cursor description, one 7-item sequence per column.
+
+    Returns:
+        int: sum of the column internal sizes, expressed in bytes.
+    """
+    return sum(column[3] if column[3] and column[3] > 0 else DEFAULT_COLUMN_SIZE for column in description or [])
+
+
+def to_fetch_metrics(cursor: Any, rows: int) -> dict[str, int]:
+    """Estimate the cost of fetching rows from a cursor.
+
+    Args:
+        cursor (Any): database cursor, with an executed query.
+        rows (int): number of rows fetched.
+
+    Returns:
+        dict[str, int]: rows, round trips (execute included) and bytes.
+    """
+    return {"rows": rows, "round_trips": 1 + rows // max(cursor.arraysize, 1), "size": rows * to_row_size(cursor.description)}
+
+
+class QueryStats:
+    """Class specifying attributes and methods related to per-statement database statistics.
+
+    Statements are aggregated by SQL hash. Round trips and bytes are estimates derived from fetch sizes and column sizes, the driver does
+    not expose network counters.
+    """
+
+    def __init__(self, slow_threshold: int) -> None:
+        """Initialize class.
+
+        Args:
+            slow_threshold (int): duration above which a call is logged as slow, expressed in milliseconds. 0 to disable.
+        """
+        self.slow_threshold = slow_threshold / 1000
+        self._lock = Lock()
+        self._statements: dict[str, dict[str, Any]] = {}
+
+    def record(self, query: str, duration: float, rows: int = 0, round_trips: int = 1, size: int = 0) -> None:
+        """Record one call of a statement.
+
+        Args:
+            query (str): SQL statement.
+            duration (float): wall time, expressed in seconds.
+            rows (int, optional): number of rows fetched or affected. Defaults to 0.
+            round_trips (int, optional): number of network round trips. Defaults to 1.
+            size (int, optional): number of bytes fetched. Defaults to 0.
+        """
+        sql_hash = to_sql_hash(query)
+        with self._lock:
+            statement = self._statements.setdefault(
+                sql_hash,
+                {"sql_hash": sql_hash, "sql": " ".join(query.split())[:200], "calls": 0, "time": 0.0, "max_time": 0.0, "rows": 0, "round_trips": 0, "bytes": 0},
+            )
+            statement["calls"] += 1
+            statement["time"] += duration
+            statement["max_time"] = max(statement["max_time"], duration)
+            statement["rows"] += rows
+            statement["round_trips"] += round_trips
+            statement["bytes"] += size
+
+        if self.slow_threshold and duration > self.slow_threshold:
+            log().logger.warning(
+                "Slow query: %.3fs, %s rows, %s round trips. %s", duration, rows, round_trips, statement["sql"], extra={"sql_hash": sql_hash, "rows": rows}
+            )
+
+    def statements(self) -> list[dict[str, Any]]:
+        """Get per-statement aggregates, slowest first.
+
+        Returns:
+            list[dict[str, Any]]: aggregates: SQL hash and text, calls, total and max time, rows, round trips and bytes.
+        """
+        with self._lock:
+            return sorted((statement.copy() for statement in self._statements.values()), key=lambda statement: statement["time"], reverse=True)
+
+    def export(self) -> Path | None:
+        """Export per-statement aggregates to a JSON file in the output directory.
+
+        Returns:
+            Path | None: export file path, None if no statement was recorded.
+        """
+        statements = self.statements()
+        if not statements:
+            return None
+
+        output_path = get_config_value("app", "output_path")
+        name = get_config_value("app", "name")
+        run_date = get_config_value("app", "run_date")
+        export_file_path = output_path.joinpath(f"{run_date.strftime('%Y-%m-%dT%H%M%S')}_{name}_queries.json")
+        export_file_path.write_text(dumps(statements, indent=2), encoding="utf-8")
+
+        total = sum(statement["time"] for statement in statements)
+        log().logger.info("Database time: %.3fs over %s statements, statistics exported to %s", total, len(statements), export_file_path)
+        return export_file_path
+
+
+@contextmanager
+def track_query(query: str) -> Iterator[dict[str, Any]]:
+    """Record the wall time and metrics of one call of a statement.
+
+    The caller fills in rows, round_trips and size. Generators add the time spent outside of them, waiting for their consumer, to idle.
+
+    Args:
+        query (str): SQL statement.
+
+    Yields:
+        dict[str, Any]: call metrics.
+    """
+    metrics: dict[str, Any] = {"rows": 0, "round_trips": 1, "size": 0, "idle": 0.0}
+    start = perf_counter()
+    try:
+        yield metrics
+    finally:
+        idle = metrics.pop("idle")
+        query_stats().record(query, perf_counter() - start - idle, **metrics)
+
+
+# Global
+_query_stats_instance = None
+
+
+def set_query_stats(query_stats_instance: QueryStats) -> None:
+    """Set global instance.
+
+    Args:
+        query_stats_instance (QueryStats): query statistics instance.
+    """
+    global _query_stats_instance
+    _query_stats_instance = query_stats_instance
+
+
+def query_stats() -> QueryStats:
+    """Get global instance, instantiate it if None.
+
+    Returns:
+        QueryStats: query statistics instance.
+    """
+    global _query_stats_instance
+    if _query_stats_instance is None:
+        _query_stats_instance = QueryStats(get_config_value("database", "slow_query_threshold", 0))
+    return _query_stats_instance
+
+
+def export_query_stats() -> None:
+    """Export query statistics, if any query ran."""
+    if _query_stats_instance is not None:
+        _query_stats_instance.export()
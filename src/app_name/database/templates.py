@@ -0,0 +1,213 @@
+"""Module used to load named SQL templates from .sql files, parsed once and reloaded when modified.
+
+Typical usage example:
+    # /app/input/config/sql/orders/by_customer.sql
+    # select id, amount from orders where customer_id = :customer_id
+    templates = SqlTemplates(Path("/app/input/config/sql"))
+    template = templates.get("orders.by_customer")
+    template.check({"customer_id": 42})
+    cursor.execute(template.text, customer_id=42)
+    cursor.execute(templates.resolve("orders.by_customer", {"customer_id": 42}), customer_id=42)
+"""
+
+# Standard Library
+from pathlib import Path
+from re import DOTALL, IGNORECASE, finditer, fullmatch, search
+from threading import Lock
+from time import monotonic
+
+# Local Application
+from app_name.event.logger.log import log
+
+# Comments, string literals and quoted identifiers are matched first, so that only binds outside them are captured
+SKIP_PATTERN = r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\"[^\"]*\""
+
+# Named bind placeholders, per DB-API paramstyle: oracledb named (:name) and psycopg pyformat (%(name)s)
+BIND_PATTERNS = {"named": rf"{SKIP_PATTERN}|(?<![\w:]):([A-Za-z][\w$#]*)", "pyformat": rf"{SKIP_PATTERN}|%\((\w+)\)s"}
+
+# Template names are file paths relative to the template directory, dot separated and without the .sql suffix
+NAME_PATTERN = r"[A-Za-z_][\w$#]*(\.[A-Za-z_][\w$#]*)*"
+
+# Minimum delay between two scans of the template directory for names not registered yet, expressed in seconds
+RESCAN_INTERVAL = 5
+
+
+def to_bind_names(query: str, paramstyle: str = "named") -> list[str]:
+    """Find the named bind placeholders of a SQL statement.
+
+    Args:
+        query (str): SQL statement.
+        paramstyle (str, optional): DB-API paramstyle: named (:name) or pyformat (%(name)s). Defaults to "named".
+
+    Returns:
+        list[str]: bind names, lower case, in order of first appearance.
+    """
+    names = [found.group(1).lower() for found in finditer(BIND_PATTERNS[paramstyle], query, DOTALL) if found.group(1)]
+    return list(dict.fromkeys(names))
+
+
+def is_template_name(query: str) -> bool:
+    """Check whether a query is a template name rather than SQL text.
+
+    Args:
+        query (str): SQL text or template name.
+
+    Returns:
+        bool: whether the query is shaped like a template name.
+    """
+    return fullmatch(NAME_PATTERN, query) is not None
+
+
+class SqlTemplate:
+    """Class holding a SQL statement read from a file, and the bind parameters it declares."""
+
+    def __init__(self, name: str, path: Path, paramstyle: str = "named") -> None:
+        """Initialize class.
+
+        Args:
+            name (str): template name.
+            path (Path): .sql file path, holding a single statement.
+            paramstyle (str, optional): DB-API paramstyle of the bind placeholders, see to_bind_names(). Defaults to "named".
+        """
+        self.name = name
+        self.path = path
+        self.paramstyle = paramstyle
+        self.mtime = 0
+        self.text = ""
+        self.binds: list[str] = []
+        self.load()
+
+    def load(self) -> None:
+        """Read and parse the statement, without the SQL*Plus terminator, so that its text stays stable for the server cursor cache."""
+        self.mtime = self.path.stat().st_mtime_ns
+        text = self.path.read_text(encoding="utf-8").strip()
+        # A slash ends PL/SQL units, a semicolon ends SQL statements but belongs to PL/SQL units
+        if text.endswith("/") or (text.endswith(";") and search(r"\bend(\s+\w+)?\s*;$", text, IGNORECASE) is None):
+            text = text[:-1].rstrip()
+        self.text = text
+        self.binds = to_bind_names(text, self.paramstyle)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the file was modified or removed since it was read."""
+        try:
+            return self.path.stat().st_mtime_ns != self.mtime
+        except FileNotFoundError:
+            return True
+
+    def check(self, binds: list | tuple | dict | None) -> None:
+        """Check that bind parameters match the declared ones.
+
+        Args:
+            binds (list | tuple | dict | None): positional or named bind parameters.
+
+        Raises:
+            ValueError: if a declared bind is missing, or an unknown one is given.
+        """
+        if isinstance(binds, dict):
+            names = {name.lower() for name in binds}
+            missing = [name for name in self.binds if name not in names]
+            unknown = sorted(names.difference(self.binds))
+        else:
+            count = len(binds or [])
+            missing = self.binds[count:]
+            unknown = [str(position) for position in range(len(self.binds) + 1, count + 1)]
+
+        if missing or unknown:
+            message = f"Bind parameters of SQL template {self.name} do not match, missing: {missing}, unknown: {unknown}"
+            raise ValueError(message)
+
+
+class SqlTemplates:
+    """Class registering the SQL templates of a directory, loaded once and reloaded only when their file is modified."""
+
+    def __init__(self, path: Path, paramstyle: str = "named") -> None:
+        """Initialize class.
+
+        Args:
+            path (Path): template directory, .sql files are looked up recursively.
+            paramstyle (str, optional): DB-API paramstyle of the bind placeholders, see to_bind_names(). Defaults to "named".
+        """
+        self.path = path
+        self.paramstyle = paramstyle
+        self.templates: dict[str, SqlTemplate] = {}
+        self.scanned = 0.0
+        self.lock = Lock()
+        with self.lock:
+            self.scan()
+
+    def to_name(self, file: Path) -> str:
+        """Get the name of a template file.
+
+        Args:
+            file (Path): .sql file path.
+
+        Returns:
+            str: template name, such as orders.by_customer for orders/by_customer.sql.
+        """
+        return ".".join(file.relative_to(self.path).with_suffix("").parts)
+
+    def scan(self) -> None:
+        """Register new template files and forget removed ones, the caller holds the lock."""
+        self.scanned = monotonic()
+        files = {self.to_name(file): file for file in sorted(self.path.rglob("*.sql"))} if self.path.is_dir() else {}
+        for name in self.templates.keys() - files.keys():
+            del self.templates[name]
+        for name, file in files.items():
+            if name not in self.templates:
+                self.templates[name] = SqlTemplate(name, file, self.paramstyle)
+        log().logger.debug("%s SQL templates registered from %s.", len(self.templates), self.path)
+
+    def get(self, name: str) -> SqlTemplate | None:
+        """Get a template, reloading it if its file was modified since it was read.
+
+        Names not registered yet trigger a scan of the directory, at most once every RESCAN_INTERVAL seconds.
+
+        Args:
+            name (str): template name.
+
+        Returns:
+            SqlTemplate | None: template, None if there is no such file.
+        """
+        with self.lock:
+            template = self.templates.get(name)
+            if template is None:
+                if monotonic() - self.scanned < RESCAN_INTERVAL:
+                    return None
+                self.scan()
+                return self.templates.get(name)
+
+            if template.is_stale:
+                if not template.path.is_file():
+                    del self.templates[name]
+                    return None
+                template.load()
+                log().logger.info("SQL template %s reloaded.", name)
+            return template
+
+    def resolve(self, query: str, binds: list | tuple | dict | None) -> str:
+        """Resolve a template name into its statement, after checking its bind parameters.
+
+        SQL text is returned as is. Dotted names, such as orders.by_customer, are never valid SQL text, so they must resolve to a template.
+        Single identifiers, such as commit, are returned as is when there is no such template.
+
+        Args:
+            query (str): SQL text or template name.
+            binds (list | tuple | dict | None): positional or named bind parameters.
+
+        Returns:
+            str: SQL text.
+
+        Raises:
+            ValueError: if a dotted name has no template file, or if the bind parameters do not match.
+        """
+        if not is_template_name(query):
+            return query
+        template = self.get(query)
+        if template is None:
+            if "." in query:
+                message = f"Unknown SQL template: {query}, no such file in {self.path}"
+                raise ValueError(message)
+            return query
+        template.check(binds)
+        return template.text
@@ -0,0 +1,167 @@
+"""Module used to buffer formatted log messages between the application threads and the AMQP publisher thread.
+
+Typical usage example:
+    buffer = MessageBuffer(max_size=10000, policy="drop_oldest")
+    buffer.put(record.levelno, message)
+    message = buffer.get(timeout=1)
+    buffer.task_done()
+    buffer.close()
+"""
+
+# Standard Library
+from collections import deque
+from itertools import count
+from threading import Condition
+
+# Overflow policies, applied when a message is added to a full buffer
+OVERFLOW_POLICIES = {"drop_oldest", "drop_lowest", "block"}
+
+
+class MessageBuffer:
+    """Class holding a bounded number of messages, in order, with a policy to make room when full.
+
+    Messages are kept in one queue per level, tagged with a sequence number, so that they are read in order and the oldest message of the
+    lowest level is found without scanning the buffer.
+    """
+
+    def __init__(self, max_size: int, policy: str = "drop_oldest") -> None:
+        """Initialize class.
+
+        Args:
+            max_size (int): maximum number of messages held.
+            policy (str, optional): overflow policy: drop_oldest, drop_lowest or block. Defaults to "drop_oldest".
+
+        Raises:
+            ValueError: if the overflow policy is unknown.
+        """
+        if policy not in OVERFLOW_POLICIES:
+            message = f"Unknown overflow policy: {policy}"
+            raise ValueError(message)
+
+        self.max_size = max(1, max_size)
+        self.policy = policy
+        self.condition = Condition()
+
+        # Sequence number and message, per level
+        self.queues: dict[int, deque[tuple[int, str]]] = {}
+        self.sequence = count()
+        self.size = 0
+        # Messages added and not yet processed, read ones included until task_done() is called
+        self.unfinished = 0
+        self.dropped = 0
+        self.closed = False
+
+    def __len__(self) -> int:
+        """Number of messages held."""
+        with self.condition:
+            return self.size
+
+    def pop_oldest(self, levels: list[int]) -> str:
+        """Remove the oldest message among some levels, the caller holds the condition.
+
+        Args:
+            levels (list[int]): levels with messages.
+
+        Returns:
+            str: message removed.
+        """
+        level = min(levels, key=lambda level: self.queues[level][0][0])
+        _, message = self.queues[level].popleft()
+        if not self.queues[level]:
+            del self.queues[level]
+        self.size -= 1
+        return message
+
+    def make_room(self, level: int) -> bool:
+        """Apply the overflow policy to a full buffer, the caller holds the condition.
+
+        Args:
+            level (int): level of the message to add.
+
+        Returns:
+            bool: whether the message to add can be kept, False if it is the one dropped.
+        """
+        if self.policy == "block":
+            while self.size >= self.max_size and not self.closed:
+                self.condition.wait()
+            return True
+
+        self.dropped += 1
+        if self.policy == "drop_lowest":
+            lowest = min(self.queues)
+            if level < lowest:
+                # The message to add is dropped, it was never counted as unfinished
+                return False
+            self.pop_oldest([lowest])
+        else:
+            self.pop_oldest(list(self.queues))
+        # A held message is dropped, it will never be processed
+        self.unfinished -= 1
+        return True
+
+    def put(self, level: int, message: str) -> bool:
+        """Add a message, making room first if the buffer is full.
+
+        Args:
+            level (int): message level, messages of the lowest level are dropped first with the drop_lowest policy.
+            message (str): formatted message.
+
+        Returns:
+            bool: whether the message was added, False if it was dropped or the buffer is closed.
+        """
+        with self.condition:
+            if self.closed:
+                return False
+            if self.size >= self.max_size and not self.make_room(level):
+                return False
+            if self.closed:
+                return False
+
+            self.queues.setdefault(level, deque()).append((next(self.sequence), message))
+            self.size += 1
+            self.unfinished += 1
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout: float | None = None) -> str | None:
+        """Remove the oldest message, waiting for one if the buffer is empty.
+
+        Args:
+            timeout (float | None, optional): maximum waiting time, expressed in seconds. Defaults to None, waiting until a message is added or
+                the buffer is closed.
+
+        Returns:
+            str | None: message, None if the buffer is empty once the timeout expires or the buffer is closed.
+        """
+        with self.condition:
+            if not self.size and not self.closed:
+                self.condition.wait(timeout)
+            if not self.size:
+                return None
+            message = self.pop_oldest(list(self.queues))
+            self.condition.notify_all()
+            return message
+
+    def task_done(self) -> None:
+        """Mark a message read with get() as processed."""
+        with self.condition:
+            self.unfinished -= 1
+            self.condition.notify_all()
+
+    def join(self, timeout: float) -> bool:
+        """Wait until every message has been read and processed.
+
+        Args:
+            timeout (float): maximum waiting time, expressed in seconds.
+
+        Returns:
+            bool: whether every message was processed.
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.unfinished, timeout)
+
+    def close(self) -> None:
+        """Stop accepting messages and wake up waiting threads, messages held can still be read."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
@@ -0,0 +1,385 @@
+"""Module used to publish messages to RabbitMQ with pipelined publisher confirms, keeping a window of unconfirmed messages in flight.
+
+A blocking channel in confirm mode waits for the broker to confirm each message before publishing the next one. Here the connection runs
+its own I/O loop in a background thread: messages are published without waiting, tracked by delivery tag, and retired as the broker acks
+or nacks them. Publishing only waits when the window of unconfirmed messages is full.
+
+Typical usage example:
+    connection = ConfirmedConnection(parameters, get_config_class("amqp"), extra={})
+    connection.open()
+    connection.publish(body, pika.BasicProperties())
+    connection.drain(timeout=30)
+    connection.close()
+"""
+
+# Standard Library
+from collections import deque
+from copy import copy
+from functools import partial
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from uuid import uuid4
+
+# Third-party
+import pika
+from pika.channel import Channel
+from pika.exceptions import AMQPConnectionError, ChannelClosedByClient
+from pika.frame import Method
+from pika.spec import Basic
+
+# Local Application
+from app_name.common.config import AMQPConfig
+from app_name.event.logger.amqp import log
+
+# Message body, properties and number of previous attempts
+Message = tuple[bytes, pika.BasicProperties, int]
+
+
+class ConfirmWindow:
+    """Class tracking published messages by delivery tag, until the broker acks or nacks them.
+
+    Messages nacked, or returned as unroutable then acked, are queued to be published again, up to a number of retries. Returned messages are
+    matched with their delivery by message id, so that identical bodies are never confused.
+    """
+
+    def __init__(self, size: int, retries: int) -> None:
+        """Initialize class.
+
+        Args:
+            size (int): maximum number of unconfirmed messages.
+            retries (int): maximum number of times a nacked or returned message is published again.
+        """
+        self.size = max(1, size)
+        self.retries = retries
+        self.condition = Condition()
+
+        # Unconfirmed messages, in delivery tag order, and ids of the ones returned by the broker
+        self.outstanding: dict[int, Message] = {}
+        self.returned: set[str] = set()
+        # Messages to publish again, in order
+        self.pending: deque[Message] = deque()
+        # Delivery tags are numbered from 1 on each channel
+        self.next_tag = 1
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Number of unconfirmed messages."""
+        with self.condition:
+            return len(self.outstanding)
+
+    def reserve(self, timeout: float) -> bool:
+        """Wait until the window has room for one more message.
+
+        Args:
+            timeout (float): maximum waiting time, expressed in seconds.
+
+        Returns:
+            bool: whether there is room, False if the broker did not confirm messages in time.
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: len(self.outstanding) < self.size, timeout)
+
+    def add(self, message: Message) -> int:
+        """Track a message about to be published, the caller publishes messages in the order they are added.
+
+        Args:
+            message (Message): message body, properties and number of previous attempts.
+
+        Returns:
+            int: delivery tag of the message.
+        """
+        with self.condition:
+            tag = self.next_tag
+            self.next_tag += 1
+            self.outstanding[tag] = message
+            return tag
+
+    def take(self) -> Message | None:
+        """Remove the oldest message to publish again.
+
+        Returns:
+            Message | None: message, None if there is none.
+        """
+        with self.condition:
+            return self.pending.popleft() if self.pending else None
+
+    def put_back(self, message: Message) -> None:
+        """Put back a message taken to be published again, when it could not be.
+
+        Args:
+            message (Message): message body, properties and number of previous attempts.
+        """
+        with self.condition:
+            self.pending.appendleft(message)
+
+    def on_return(self, message_id: str | None) -> None:
+        """Mark a message returned as unroutable, the broker acks it right after.
+
+        Args:
+            message_id (str | None): id of the returned message.
+        """
+        with self.condition:
+            if message_id is not None:
+                self.returned.add(message_id)
+
+    def on_confirm(self, tag: int, *, multiple: bool, ack: bool) -> tuple[int, int]:
+        """Retire confirmed messages, queuing nacked and returned ones to be published again.
+
+        Args:
+            tag (int): delivery tag.
+            multiple (bool): whether the confirm covers every message up to the delivery tag.
+            ack (bool): whether the broker acked the messages, False if it nacked them.
+
+        Returns:
+            tuple[int, int]: number of messages queued to be published again, and number of messages dropped after too many attempts.
+        """
+        retried = 0
+        dropped = 0
+        with self.condition:
+            tags = [item for item in self.outstanding if item <= tag] if multiple else [tag]
+            for item in tags:
+                if (message := self.outstanding.pop(item, None)) is None:
+                    continue
+                body, properties, attempts = message
+                returned = properties.message_id in self.returned
+                self.returned.discard(properties.message_id)
+                if ack and not returned:
+                    continue
+                if attempts >= self.retries:
+                    dropped += 1
+                    continue
+                self.pending.append((body, properties, attempts + 1))
+                retried += 1
+            self.dropped += dropped
+            self.condition.notify_all()
+        return retried, dropped
+
+    def reset(self) -> int:
+        """Queue unconfirmed messages to be published again on a new channel, where delivery tags start over.
+
+        Returns:
+            int: number of unconfirmed messages queued.
+        """
+        with self.condition:
+            count = len(self.outstanding)
+            self.pending.extendleft(reversed(self.outstanding.values()))
+            self.outstanding.clear()
+            self.returned.clear()
+            self.next_tag = 1
+            self.condition.notify_all()
+            return count
+
+    def settle(self, timeout: float) -> bool:
+        """Wait until every message is confirmed, or some must be published again.
+
+        Args:
+            timeout (float): maximum waiting time, expressed in seconds.
+
+        Returns:
+            bool: whether every message is confirmed and none is left to publish again.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: not self.outstanding or self.pending, timeout)
+            return not self.outstanding and not self.pending
+
+
+class ConfirmedConnection:
+    """Class publishing messages to a RabbitMQ exchange in confirm mode, through a connection driven by its own I/O thread."""
+
+    def __init__(self, parameters: pika.ConnectionParameters, config: AMQPConfig, extra: dict) -> None:
+        """Initialize class.
+
+        Args:
+            parameters (pika.ConnectionParameters): connection parameters.
+            config (AMQPConfig): AMQP configuration, for the exchange, routing key and confirm settings.
+            extra (dict): log extra fields.
+        """
+        self.parameters = parameters
+        self.config = config
+        self.extra = extra
+        self.window = ConfirmWindow(config.confirm_window, config.confirm_retries)
+
+        self._connection: pika.SelectConnection | None = None
+        self._channel = None
+        self._thread: Thread | None = None
+        self._ready = Event()
+        self._is_open = False
+        # Serializes delivery tag assignment with the scheduling of the publish, so that both follow the same order
+        self._lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the channel is open in confirm mode."""
+        return self._is_open
+
+    def open(self) -> bool:
+        """Open the connection, the channel, declare the exchange and turn on confirm mode, waiting for the I/O thread to do so.
+
+        Returns:
+            bool: True if the channel is ready, False otherwise.
+        """
+        self.close()
+        self._ready.clear()
+        self._connection = pika.SelectConnection(
+            self.parameters,
+            on_open_callback=self._on_connection_open,
+            on_open_error_callback=self._on_connection_error,
+            on_close_callback=self._on_connection_closed,
+        )
+        self._thread = Thread(target=self._connection.ioloop.start, name="amqp-confirms", daemon=True)
+        self._thread.start()
+
+        timeout = self.parameters.connection_attempts * (self.parameters.socket_timeout + self.parameters.retry_delay)
+        if not self._ready.wait(timeout):
+            log().logger.error("RabbitMQ connection not ready after %s seconds.", timeout, extra=self.extra)
+            self.close()
+        return self._is_open
+
+    def close(self) -> None:
+        """Close the connection and wait for the I/O thread to stop, unconfirmed messages are kept to be published again."""
+        connection = self._connection
+        if connection is not None and not (connection.is_closing or connection.is_closed):
+            connection.ioloop.add_callback_threadsafe(connection.close)
+        if self._thread is not None:
+            self._thread.join(self.parameters.socket_timeout)
+        self._connection = None
+        self._channel = None
+        self._thread = None
+        self._is_open = False
+
+    def publish(self, body: bytes, properties: pika.BasicProperties) -> None:
+        """Publish a message after the ones to publish again, waiting only if the window of unconfirmed messages is full.
+
+        Args:
+            body (bytes): message body.
+            properties (pika.BasicProperties): message properties.
+        """
+        self.flush()
+        self._send((body, properties, 0))
+
+    def flush(self) -> None:
+        """Publish again the nacked or returned messages, and the ones left unconfirmed by a closed channel."""
+        while (message := self.window.take()) is not None:
+            try:
+                self._send(message)
+            except AMQPConnectionError:
+                # Kept for the next attempt, after reconnecting
+                self.window.put_back(message)
+                raise
+
+    def drain(self, timeout: float) -> bool:
+        """Publish again the held messages and wait for every confirm, up to a number of seconds.
+
+        Args:
+            timeout (float): maximum waiting time, expressed in seconds.
+
+        Returns:
+            bool: whether every message was confirmed.
+        """
+        deadline = monotonic() + timeout
+        try:
+            while (remaining := deadline - monotonic()) > 0:
+                self.flush()
+                if self.window.settle(remaining):
+                    return True
+        except AMQPConnectionError as err:
+            log().logger.error("AMQP connection error publishing messages again: %s", err, extra=self.extra)
+
+        log().logger.warning("%s unconfirmed and %s nacked or returned messages on close.", len(self.window), len(self.window.pending), extra=self.extra)
+        return False
+
+    def _send(self, entry: Message) -> None:
+        """Track a message and schedule its publication on the I/O thread.
+
+        Args:
+            entry (Message): message body, properties and number of previous attempts.
+
+        Raises:
+            AMQPConnectionError: if the channel is closed, or the broker did not confirm messages in time to make room in the window.
+        """
+        if not self._is_open:
+            message = "Channel closed"
+            raise AMQPConnectionError(message)
+        if not self.window.reserve(self.config.confirm_timeout):
+            message = f"No publisher confirm received in {self.config.confirm_timeout} seconds"
+            raise AMQPConnectionError(message)
+
+        body, properties, attempts = entry
+        if properties.message_id is None:
+            # Unique id, so that a returned message is matched with its own delivery
+            properties = copy(properties)
+            properties.message_id = uuid4().hex
+
+        with self._lock:
+            self.window.add((body, properties, attempts))
+            self._connection.ioloop.add_callback_threadsafe(partial(self._basic_publish, body, properties))
+
+    def _basic_publish(self, body: bytes, properties: pika.BasicProperties) -> None:
+        """Publish a message on the channel, run by the I/O thread.
+
+        Args:
+            body (bytes): message body.
+            properties (pika.BasicProperties): message properties.
+        """
+        if self._channel is None or not self._channel.is_open:
+            # Already queued to be published again by the channel close
+            return
+        self._channel.basic_publish(self.config.exchange, self.config.routing_key, body, properties, mandatory=True)
+
+    def _on_connection_open(self, connection: pika.SelectConnection) -> None:
+        """Open the channel once the connection is open."""
+        connection.channel(on_open_callback=self._on_channel_open)
+
+    def _on_connection_error(self, connection: pika.SelectConnection, err: Exception) -> None:
+        """Stop the I/O thread when the connection cannot be opened."""
+        log().logger.error("Failed to connect to RabbitMQ: %s", err, extra=self.extra)
+        self._ready.set()
+        connection.ioloop.stop()
+
+    def _on_connection_closed(self, connection: pika.SelectConnection, reason: Exception) -> None:
+        """Queue unconfirmed messages to be published again, then stop the I/O thread."""
+        self._is_open = False
+        if count := self.window.reset():
+            log().logger.warning("RabbitMQ connection closed: %s, %s unconfirmed messages to publish again.", reason, count, extra=self.extra)
+        self._ready.set()
+        connection.ioloop.stop()
+
+    def _on_channel_open(self, channel: Channel) -> None:
+        """Declare the exchange once the channel is open."""
+        self._channel = channel
+        channel.add_on_return_callback(self._on_return)
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.exchange_declare(
+            exchange=self.config.exchange, exchange_type=self.config.exchange_type, durable=self.config.exchange_durable, callback=self._on_exchange_declared
+        )
+
+    def _on_exchange_declared(self, _frame: Method) -> None:
+        """Turn on confirm mode once the exchange is declared."""
+        self._channel.confirm_delivery(ack_nack_callback=self._on_confirm, callback=self._on_confirm_selected)
+
+    def _on_confirm_selected(self, _frame: Method) -> None:
+        """Mark the channel ready, delivery tags start over on it."""
+        self.window.reset()
+        self._is_open = True
+        self._ready.set()
+
+    def _on_channel_closed(self, channel: Channel, reason: Exception) -> None:
+        """Close the connection with the channel, the connection close queues unconfirmed messages to be published again."""
+        self._is_open = False
+        if not isinstance(reason, ChannelClosedByClient):
+            log().logger.warning("RabbitMQ channel %s closed: %s", channel.channel_number, reason, extra=self.extra)
+        if self._connection is not None and not (self._connection.is_closing or self._connection.is_closed):
+            self._connection.close()
+
+    def _on_return(self, _channel: Channel, _method: Basic.Return, properties: pika.BasicProperties, _body: bytes) -> None:
+        """Mark a message returned as unroutable, it is published again once the broker acks it."""
+        self.window.on_return(properties.message_id)
+
+    def _on_confirm(self, frame: Method) -> None:
+        """Retire the messages acked or nacked by the broker."""
+        method = frame.method
+        retried, dropped = self.window.on_confirm(method.delivery_tag, multiple=method.multiple, ack=isinstance(method, Basic.Ack))
+        if retried:
+            log().logger.warning("%s messages nacked or returned by the broker, publishing them again.", retried, extra=self.extra)
+        if dropped:
+            log().logger.error("%s messages nacked or returned after %s attempts, dropping them.", dropped, self.window.retries + 1, extra=self.extra)
@@ -2,11 +2,15 @@
 
 # Standard Library
 from logging import Handler, LogRecord
-from threading import Lock
+from threading import Event, Lock, Thread
+from time import monotonic
 
 # Local Application
 from app_name.common.config import get_config_value
+from app_name.event.buffer import MessageBuffer
+from app_name.event.logger.amqp import log
 from app_name.event.publisher import AMQPPublisher
+from app_name.event.spool import Spool
 
 
 class AMQPLogHandler(Handler):
@@ -14,44 +18,236 @@ class AMQPLogHandler(Handler):
 
     This handler integrates with the existing logging system and publishes
     log messages to RabbitMQ using the AMQPPublisher.
+
+    In asynchronous mode, records are formatted by the logging thread then buffered, and a background thread publishes them, so that
+    logging never waits for the broker, even while reconnecting. With batching, the background thread packs buffered records into a single
+    AMQP message, sent once it holds enough records or bytes, or once its first record has waited long enough.
+
+    With the spool, messages that cannot be published, or are skipped by the circuit breaker, are written to disk, then replayed in order by
+    another background thread once the broker is reachable again. Until the spool is drained, new messages are spooled behind the backlog
+    rather than published, so that messages reach the broker in order, at most at AMQP_SPOOL_REPLAY_RATE messages per second.
     """
 
     def __init__(self) -> None:
         """Initialize class."""
         super().__init__()
-        self._lock = Lock()  # Add thread safety
+        # Serializes publisher calls and failed message counter updates, from the logging, publisher and spool threads, as pika connections
+        # are not thread-safe
+        self._lock = Lock()
 
         self._failed_messages = 0
         self._max_failed_messages = get_config_value("amqp", "max_failed_messages")
+        # Whether the spool holds messages not yet replayed, live messages are then spooled behind them
+        self._backlog = False
 
         self.amqp = AMQPPublisher()
 
+        # Asynchronous mode, implied by batching
+        self._batching = get_config_value("amqp", "batch_format") != "none"
+        self._buffer = None
+        self._thread = None
+        if get_config_value("amqp", "asynchronous") or self._batching:
+            self._buffer = MessageBuffer(get_config_value("amqp", "queue_size"), get_config_value("amqp", "overflow_policy"))
+            self._thread = Thread(target=self._run, name="amqp-publisher", daemon=True)
+            self._thread.start()
+
+        # Spool, replayed by a background thread
+        self._spool = None
+        self._replayer = None
+        self._stopping = Event()
+        if get_config_value("amqp", "spool"):
+            self._spool = Spool(
+                get_config_value("amqp", "spool_path"), get_config_value("amqp", "spool_max_size"), get_config_value("amqp", "spool_segment_size")
+            )
+            # Messages left by a previous run are replayed first
+            self._backlog = len(self._spool) > 0
+            self._replayer = Thread(target=self._replay, name="amqp-spool", daemon=True)
+            self._replayer.start()
+
     def emit(self, record: LogRecord) -> None:
-        """Emit a log record to RabbitMQ.
+        """Emit a log record to RabbitMQ, or buffer it in asynchronous mode.
 
         Args:
             record (logging.LogRecord): log record to emit.
         """
         try:
-            with self._lock:
-                # Skip if too many consecutive failed messages (circuit breaker pattern)
-                if self._failed_messages >= self._max_failed_messages:
-                    return
+            if self._buffer is not None:
+                dropped = self._buffer.dropped
+                self._buffer.put(record.levelno, self.format(record))
+                if not dropped and self._buffer.dropped:
+                    log().logger.warning("AMQP log buffer full, applying %s overflow policy.", self._buffer.policy, extra=self.amqp.extra)
+                return
 
-                log_message = self.format(record)
-                if self.amqp.publish_message(log_message):
-                    # Reset failed message counter on success
-                    self._failed_messages = 0
-                else:
-                    self._failed_messages += 1
+            with self._lock:
+                self._publish(self.format(record))
 
         except RecursionError:
             raise
         except Exception:
-            self._failed_messages += 1
+            with self._lock:
+                self._failed_messages += 1
             self.handleError(record)
 
+    def _publish(self, log_message: str) -> None:
+        """Publish a formatted log message, unless too many consecutive messages failed, spooling it if not published.
+
+        The caller holds the lock.
+
+        Args:
+            log_message (str): formatted log message.
+        """
+        if self._backlog:
+            self._spill([log_message.encode("utf-8")])
+            return
+
+        # Skip if too many consecutive failed messages (circuit breaker pattern)
+        if self._failed_messages < self._max_failed_messages:
+            if self.amqp.publish_message(log_message):
+                # Reset failed message counter on success
+                self._failed_messages = 0
+                return
+            self._failed_messages += 1
+        self._spill([log_message.encode("utf-8")])
+
+    def _publish_batch(self, log_messages: list[bytes]) -> None:
+        """Publish encoded log messages as a single message, unless too many consecutive messages failed, spooling them if not published.
+
+        The caller holds the lock.
+
+        Args:
+            log_messages (list[bytes]): UTF-8 encoded log messages.
+        """
+        if self._backlog:
+            self._spill(log_messages)
+            return
+
+        # Skip if too many consecutive failed messages (circuit breaker pattern)
+        if self._failed_messages < self._max_failed_messages:
+            if self.amqp.publish_batch(log_messages):
+                self._failed_messages = 0
+                return
+            self._failed_messages += 1
+        self._spill(log_messages)
+
+    def _spill(self, log_messages: list[bytes]) -> None:
+        """Write unpublished log messages to the spool, if enabled, otherwise they are lost, the caller holds the lock.
+
+        Args:
+            log_messages (list[bytes]): UTF-8 encoded log messages.
+        """
+        if self._spool is not None:
+            self._spool.append(log_messages)
+            self._backlog = True
+
+    def _replay(self) -> None:
+        """Replay spooled messages in order, at most AMQP_SPOOL_REPLAY_RATE per second, so that a backlog does not flood the broker.
+
+        A successful replay closes the circuit breaker, and live messages are published directly again once the spool is drained. The
+        publisher reconnects without holding the lock, so that live messages keep being spooled meanwhile.
+        """
+        rate = max(1, get_config_value("amqp", "spool_replay_rate"))
+        count = min(rate, get_config_value("amqp", "batch_max_count")) if self._batching else 1
+        retry_delay = get_config_value("amqp", "retry_delay")
+
+        while not self._stopping.is_set():
+            with self._lock:
+                log_messages = self._spool.peek(count)
+                self._backlog = bool(log_messages)
+            if not log_messages:
+                self._stopping.wait(retry_delay)
+                continue
+
+            if not self.amqp.is_connected() and not self.amqp.connect():
+                self._stopping.wait(retry_delay)
+                continue
+
+            start = monotonic()
+            with self._lock:
+                try:
+                    if self._batching:
+                        sent = self.amqp.publish_batch(log_messages, reconnect=False)
+                    else:
+                        sent = self.amqp.publish_message(log_messages[0].decode("utf-8"), reconnect=False)
+                except Exception as err:
+                    log().logger.error("Unexpected error replaying spooled log messages: %s", err, extra=self.amqp.extra)
+                    sent = False
+                if sent:
+                    self._failed_messages = 0
+            if not sent:
+                self._stopping.wait(retry_delay)
+                continue
+
+            self._spool.commit(len(log_messages))
+            self._stopping.wait(max(0, len(log_messages) / rate - (monotonic() - start)))
+
+    def _collect(self, log_message: str) -> list[bytes]:
+        """Collect buffered messages into a batch, until it is full or its linger time expires.
+
+        Args:
+            log_message (str): first message of the batch.
+
+        Returns:
+            list[bytes]: UTF-8 encoded messages.
+        """
+        max_count = get_config_value("amqp", "batch_max_count")
+        max_bytes = get_config_value("amqp", "batch_max_bytes")
+        deadline = monotonic() + get_config_value("amqp", "batch_linger") / 1000
+
+        batch = [log_message.encode("utf-8")]
+        size = len(batch[0])
+        while len(batch) < max_count and size < max_bytes and (remaining := deadline - monotonic()) > 0:
+            if (log_message := self._buffer.get(remaining)) is None:
+                break
+            batch.append(log_message.encode("utf-8"))
+            size += len(batch[-1])
+        return batch
+
+    def _run(self) -> None:
+        """Publish buffered messages, one by one or by batches, until the buffer is closed and drained."""
+        while (log_message := self._buffer.get()) is not None:
+            done = 1
+            try:
+                if self._batching:
+                    batch = self._collect(log_message)
+                    done = len(batch)
+                    with self._lock:
+                        self._publish_batch(batch)
+                else:
+                    with self._lock:
+                        self._publish(log_message)
+            except Exception as err:
+                with self._lock:
+                    self._failed_messages += 1
+                log().logger.error("Unexpected error publishing log message: %s", err, extra=self.amqp.extra)
+            finally:
+                for _ in range(done):
+                    self._buffer.task_done()
+
+    def flush(self) -> None:
+        """Wait for buffered messages to be published, up to AMQP_CLOSE_TIMEOUT seconds, in asynchronous mode."""
+        if self._thread is not None and not self._buffer.join(get_config_value("amqp", "close_timeout")):
+            log().logger.warning("AMQP log buffer not flushed in time, %s messages pending.", len(self._buffer), extra=self.amqp.extra)
+
+    def _stop(self) -> None:
+        """Stop the publisher thread once it has published buffered messages, up to AMQP_CLOSE_TIMEOUT seconds."""
+        if self._thread is None:
+            return
+
+        self._buffer.close()
+        self._thread.join(get_config_value("amqp", "close_timeout"))
+        if self._thread.is_alive():
+            log().logger.warning("AMQP log buffer not flushed in time, %s messages lost.", len(self._buffer), extra=self.amqp.extra)
+        if self._buffer.dropped:
+            log().logger.warning("%s log messages dropped by the AMQP log buffer.", self._buffer.dropped, extra=self.amqp.extra)
+        self._thread = None
+
     def close(self) -> None:
-        """Close the handler and cleanup resources."""
+        """Close the handler and cleanup resources, after publishing or spooling buffered messages."""
+        self._stop()
+        if self._replayer is not None:
+            self._stopping.set()
+            self._replayer.join(get_config_value("amqp", "close_timeout"))
+            self._spool.close()
+            self._replayer = None
         self.amqp.close()
         super().close()
@@ -4,6 +4,7 @@ Typical usage example:
     publisher = AMQPPublisher()
     publisher.connect()
     publisher.publish_message(log_message)
+    publisher.publish_batch([log_message.encode("utf-8") for log_message in log_messages])
     publisher.close()
 """
 
@@ -17,8 +18,35 @@ from pika.exceptions import AMQPChannelError, AMQPConnectionError, ConnectionClo
 
 # Local Application
 from app_name.common.config import AMQPConfig, get_config_class
+from app_name.event.confirm import ConfirmedConnection
 from app_name.event.logger.amqp import log
 
+# Content type of the batch formats
+BATCH_CONTENT_TYPES = {"ndjson": "application/x-ndjson", "cloudevents": "application/cloudevents-batch+json"}
+
+
+def to_batch(messages: list[bytes], batch_format: str) -> tuple[bytes, str]:
+    """Pack several messages into a single message body.
+
+    Args:
+        messages (list[bytes]): UTF-8 encoded messages.
+        batch_format (str): batch format: ndjson, one message per line, or cloudevents, a JSON array of CloudEvents.
+
+    Returns:
+        tuple[bytes, str]: message body and content type.
+
+    Raises:
+        ValueError: if the batch format is not supported.
+    """
+    match batch_format:
+        case "ndjson":
+            return b"\n".join(messages), BATCH_CONTENT_TYPES[batch_format]
+        case "cloudevents":
+            return b"[" + b",".join(messages) + b"]", BATCH_CONTENT_TYPES[batch_format]
+        case _:
+            message = f"Unsupported batch format: {batch_format}"
+            raise ValueError(message)
+
 
 class AMQPPublisher:
     """AMQP Publisher class for publishing log messages to RabbitMQ.
@@ -49,6 +77,9 @@ class AMQPPublisher:
 
         self.extra = {"host": self._connection_parameters.host, "exchange": self.config.exchange}
 
+        # Publisher confirms, through a connection of its own keeping a window of unconfirmed messages, see ConfirmedConnection
+        self._confirms = ConfirmedConnection(self._connection_parameters, self.config, self.extra) if self.config.confirm else None
+
     def _get_connection_parameters(self) -> pika.ConnectionParameters:
         """Get RabbitMQ connection parameters from config.
 
@@ -74,6 +105,10 @@ class AMQPPublisher:
             bool: True if connection successful, False otherwise.
         """
         with self._lock:
+            if self._confirms is not None:
+                self._is_connected = self._confirms.is_open or self._confirms.open()
+                return self._is_connected
+
             if self._is_connected and self._connection and not self._connection.is_closed:
                 return True
 
@@ -127,10 +162,31 @@ class AMQPPublisher:
             bool: True if connected and channel is open, False otherwise.
         """
         with self._lock:
+            if self._confirms is not None:
+                return self._confirms.is_open
             return self._is_connected and self._connection and not self._connection.is_closed and self._channel and not self._channel.is_closed
 
+    def _send(self, body: bytes, properties: pika.BasicProperties) -> None:
+        """Publish a message body, the caller holds the lock.
+
+        In confirm mode, the message is tracked until the broker confirms it, and published again if nacked or returned.
+
+        Args:
+            body (bytes): message body.
+            properties (pika.BasicProperties): message properties.
+        """
+        if self._confirms is not None:
+            self._confirms.publish(body, properties)
+            return
+        self._channel.basic_publish(exchange=self.config.exchange, routing_key=self.config.routing_key, body=body, properties=properties)
+
     def _close_connection(self) -> None:
         """Close the RabbitMQ connection and channel safely."""
+        if self._confirms is not None:
+            self._confirms.close()
+            self._is_connected = False
+            return
+
         try:
             if self._channel and not self._channel.is_closed:
                 self._channel.close()
@@ -149,43 +205,72 @@ class AMQPPublisher:
             self._is_connected = False
 
     def close(self) -> None:
-        """Close the AMQP connection and cleanup resources."""
+        """Close the AMQP connection and cleanup resources, after waiting for unconfirmed messages in confirm mode."""
         with self._lock:
+            if self._confirms is not None and self._confirms.is_open:
+                self._confirms.drain(self.config.confirm_timeout)
             self._close_connection()
         log().close()
 
-    def publish_message(self, message: str) -> bool:
+    def publish_message(self, message: str, *, reconnect: bool = True) -> bool:
         """Publish a log message to RabbitMQ.
 
         Args:
             message (str): message to publish.
+            reconnect (bool, optional): whether to reconnect if disconnected, False to fail fast. Defaults to True.
+
+        Returns:
+            bool: True if message published successfully, False otherwise.
+        """
+        return self._publish(message.encode("utf-8"), self._properties, reconnect=reconnect)
+
+    def publish_batch(self, messages: list[bytes], *, reconnect: bool = True) -> bool:
+        """Publish several log messages to RabbitMQ as a single message.
+
+        The batch size is set in the batch_size header, so that consumers can unpack the body.
+
+        Args:
+            messages (list[bytes]): UTF-8 encoded messages to publish, JSON documents for the cloudevents batch format.
+            reconnect (bool, optional): whether to reconnect if disconnected, False to fail fast. Defaults to True.
+
+        Returns:
+            bool: True if the batch published successfully, False otherwise.
+        """
+        body, content_type = to_batch(messages, self.config.batch_format)
+        properties = pika.BasicProperties(delivery_mode=self._delivery_mode, content_type=content_type, headers={"batch_size": len(messages)})
+        return self._publish(body, properties, reconnect=reconnect)
+
+    def _publish(self, body: bytes, properties: pika.BasicProperties, *, reconnect: bool = True) -> bool:
+        """Publish a message body to RabbitMQ, reconnecting once on connection errors.
+
+        Args:
+            body (bytes): message body.
+            properties (pika.BasicProperties): message properties.
+            reconnect (bool, optional): whether to reconnect if disconnected, False to fail fast. Defaults to True.
 
         Returns:
             bool: True if message published successfully, False otherwise.
         """
         # Ensure we have a connection
-        if not self.is_connected() and not self.connect() and not self._reconnect():
+        if not self.is_connected() and (not reconnect or (not self.connect() and not self._reconnect())):
             return False
 
         try:
             with self._lock:
                 # Double-check connection after acquiring lock
-                if not self.is_connected() and not self.connect():
+                if not self.is_connected() and (not reconnect or not self.connect()):
                     return False
 
                 # Publish message
-                self._channel.basic_publish(
-                    exchange=self.config.exchange, routing_key=self.config.routing_key, body=message.encode("utf-8"), properties=self._properties
-                )
-
+                self._send(body, properties)
                 return True
 
         except (AMQPConnectionError, AMQPChannelError, ConnectionClosedByBroker) as err:
             log().logger.warning("AMQP connection error during publish: %s. Attempting reconnection.", err, extra=self.extra)
             self._is_connected = False
             # Try to reconnect and republish once
-            if self._reconnect():
-                return self.publish_message(message)
+            if reconnect and self._reconnect():
+                return self._publish(body, properties)
             return False
 
         except Exception as err:
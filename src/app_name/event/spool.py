@@ -0,0 +1,195 @@
+"""Module used to spool unsent AMQP messages to disk while the broker is unreachable, then read them back in order.
+
+Messages are appended to segment files as length-prefixed records. Segments are read oldest first and deleted once replayed, and the oldest
+segments are dropped when the spool exceeds its maximum size.
+
+Typical usage example:
+    spool = Spool(Path("/app/spool"), max_size=104857600, segment_size=4194304)
+    spool.append([message.encode("utf-8")])
+    if messages := spool.peek(100):
+        publish(messages)
+        spool.commit(len(messages))
+    spool.close()
+"""
+
+# Standard Library
+from collections import deque
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO
+
+# Local Application
+from app_name.event.logger.amqp import log
+
+# Size of the record header holding the message length, expressed in bytes
+HEADER_SIZE = 4
+
+SEGMENT_SUFFIX = ".spool"
+
+
+class Spool:
+    """Class storing messages in bounded, segmented append-only files, replayed in order."""
+
+    def __init__(self, path: Path, max_size: int, segment_size: int) -> None:
+        """Initialize class, segments left by a previous run are kept to be replayed.
+
+        Args:
+            path (Path): spool directory, created if missing.
+            max_size (int): maximum size of the spool on disk, expressed in bytes.
+            segment_size (int): size above which a new segment is started, expressed in bytes.
+        """
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.segment_size = segment_size
+        self.lock = Lock()
+
+        self.segments: deque[Path] = deque(sorted(self.path.glob(f"*{SEGMENT_SUFFIX}")))
+        self.size = sum(segment.stat().st_size for segment in self.segments)
+        self.sequence = int(self.segments[-1].stem) + 1 if self.segments else 0
+        self.dropped = 0
+
+        # Segment being written, a new one per run
+        self.writer: BinaryIO | None = None
+        self.writer_path: Path | None = None
+
+        # Segment being read, offset of the first message not yet committed, end offsets of the messages peeked, and whether the
+        # segment was read to its end
+        self.reader: BinaryIO | None = None
+        self.offset = 0
+        self.ends: list[int] = []
+        self.exhausted = False
+
+    def __len__(self) -> int:
+        """Number of segments held, including the one being written."""
+        with self.lock:
+            return len(self.segments)
+
+    def roll(self) -> None:
+        """Close the segment being written and start a new one, the caller holds the lock."""
+        self.close_writer()
+        self.writer_path = self.path.joinpath(f"{self.sequence:012d}{SEGMENT_SUFFIX}")
+        self.writer = self.writer_path.open("ab")
+        self.sequence += 1
+        self.segments.append(self.writer_path)
+
+    def close_writer(self) -> None:
+        """Close the segment being written, so that the next message starts a new one, the caller holds the lock."""
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = None
+        self.writer_path = None
+
+    def close_reader(self) -> None:
+        """Close the segment being read, the caller holds the lock."""
+        if self.reader is not None:
+            self.reader.close()
+        self.reader = None
+        self.offset = 0
+        self.ends = []
+        self.exhausted = False
+
+    def remove_oldest(self) -> int:
+        """Delete the oldest segment, the caller holds the lock.
+
+        Returns:
+            int: size of the segment deleted, expressed in bytes.
+        """
+        segment = self.segments.popleft()
+        if self.reader is not None and Path(self.reader.name) == segment:
+            self.close_reader()
+        if segment == self.writer_path:
+            self.close_writer()
+        size = segment.stat().st_size
+        segment.unlink(missing_ok=True)
+        self.size -= size
+        return size
+
+    def append(self, messages: list[bytes]) -> None:
+        """Append messages, dropping the oldest segments if the spool exceeds its maximum size.
+
+        Args:
+            messages (list[bytes]): messages to spool.
+        """
+        with self.lock:
+            for message in messages:
+                if self.writer is None or self.writer.tell() >= self.segment_size:
+                    self.roll()
+                self.writer.write(len(message).to_bytes(HEADER_SIZE, "big") + message)
+                self.size += HEADER_SIZE + len(message)
+            self.writer.flush()
+
+            while self.size > self.max_size and len(self.segments) > 1:
+                self.dropped += self.remove_oldest()
+                log().logger.warning("AMQP spool full, %s bytes of messages dropped so far.", self.dropped)
+
+    def peek(self, count: int) -> list[bytes]:
+        """Read the oldest messages not yet committed, without removing them.
+
+        Args:
+            count (int): maximum number of messages, fewer are returned at the end of a segment.
+
+        Returns:
+            list[bytes]: messages, in the order they were appended, empty if the spool is empty.
+        """
+        with self.lock:
+            while True:
+                if self.reader is None:
+                    if not self.segments:
+                        return []
+                    if self.segments[0] == self.writer_path:
+                        if not self.writer.tell():
+                            return []
+                        # The segment being written becomes read-only, new messages go to the next one
+                        self.close_writer()
+                    self.reader = self.segments[0].open("rb")
+
+                messages = self.read(count)
+                if messages or not self.exhausted:
+                    return messages
+                # Segment fully read and committed
+                self.close_reader()
+                self.remove_oldest()
+
+    def read(self, count: int) -> list[bytes]:
+        """Read messages from the offset of the segment being read, the caller holds the lock.
+
+        Args:
+            count (int): maximum number of messages.
+
+        Returns:
+            list[bytes]: messages.
+        """
+        messages = []
+        self.ends = []
+        self.reader.seek(self.offset)
+        while len(messages) < count:
+            header = self.reader.read(HEADER_SIZE)
+            length = int.from_bytes(header, "big")
+            message = self.reader.read(length) if len(header) == HEADER_SIZE else b""
+            # End of the segment, or a record truncated by a crash while writing
+            if len(header) < HEADER_SIZE or len(message) < length:
+                self.exhausted = True
+                break
+            messages.append(message)
+            self.ends.append(self.reader.tell())
+        return messages
+
+    def commit(self, count: int) -> None:
+        """Remove messages returned by the last peek, once they are sent, deleting segments fully read.
+
+        Args:
+            count (int): number of messages sent, from the start of the last peek.
+        """
+        with self.lock:
+            if count:
+                self.offset = self.ends[count - 1]
+            if self.reader is not None and self.exhausted and count == len(self.ends):
+                self.close_reader()
+                self.remove_oldest()
+
+    def close(self) -> None:
+        """Close the segment files, messages left are replayed by the next run."""
+        with self.lock:
+            self.close_reader()
+            self.close_writer()
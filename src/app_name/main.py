@@ -17,18 +17,24 @@ from dotenv import load_dotenv
 from app_name.common.config import Config, DevConfig, ProdConfig, set_config
 from app_name.common.debug import debug
 from app_name.common.profiler import profiler
+from app_name.database.cancel import cancel_calls
+from app_name.database.stats import export_query_stats
 from app_name.event.logger.log import log
 
 load_dotenv(".env", override=True)
 
 
 def signal_int_handler(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
-    """Handle SIGINT signal for the application execution.
+    """Handle SIGINT signal for the application execution, in-flight database calls are cancelled rather than awaited.
+
+    In thick mode the handler only runs once the blocking database call has returned, so nothing is left to cancel, calls are bounded by
+    DATABASE_CALL_TIMEOUT instead.
 
     Raises:
         KeyboardInterrupt: user pressed Ctrl + C.
     """
     log().logger.warning("You pressed Ctrl + C! Terminating gracefully...")
+    cancel_calls()
     raise KeyboardInterrupt
 
 
@@ -83,6 +89,9 @@ def main() -> None:
         log().logger.critical("A non-recoverable error occurred: %s. Aborting...", err)
 
     finally:
+        # Export per-statement database statistics
+        export_query_stats()
+
         # Print execution time
         end = perf_counter()
         log().logger.info("Execution time: %s", strftime("%H:%M:%S", gmtime(end - start)))
@@ -0,0 +1,98 @@
+"""Tests of the message buffer overflow policies and unfinished message accounting."""
+
+# Third-party
+import pytest
+
+# Local Application
+from app_name.event.buffer import MessageBuffer
+
+
+def drain(buffer: MessageBuffer) -> list[str]:
+    """Read and process every message held.
+
+    Args:
+        buffer (MessageBuffer): message buffer.
+
+    Returns:
+        list[str]: messages, in the order they were read.
+    """
+    messages = []
+    while (message := buffer.get(0)) is not None:
+        messages.append(message)
+        buffer.task_done()
+    return messages
+
+
+def test_drop_oldest() -> None:
+    """Drop the oldest held message when the buffer is full."""
+    buffer = MessageBuffer(2, "drop_oldest")
+    assert buffer.put(20, "a")
+    assert buffer.put(20, "b")
+    assert buffer.put(20, "c")
+
+    assert buffer.dropped == 1
+    assert buffer.unfinished == 2
+    assert drain(buffer) == ["b", "c"]
+    assert buffer.unfinished == 0
+    assert buffer.join(0)
+
+
+def test_drop_lowest_evicts_held_message() -> None:
+    """Drop the oldest message of the lowest level when the message to add has a higher level."""
+    buffer = MessageBuffer(2, "drop_lowest")
+    assert buffer.put(10, "debug")
+    assert buffer.put(30, "warning")
+    assert buffer.put(30, "another warning")
+
+    assert buffer.dropped == 1
+    assert buffer.unfinished == 2
+    assert drain(buffer) == ["warning", "another warning"]
+    assert buffer.unfinished == 0
+    assert buffer.join(0)
+
+
+def test_drop_lowest_refuses_new_message() -> None:
+    """Refuse the message to add when its level is lower than every held message."""
+    buffer = MessageBuffer(2, "drop_lowest")
+    assert buffer.put(30, "a")
+    assert buffer.put(30, "b")
+    assert not buffer.put(10, "debug")
+
+    assert buffer.dropped == 1
+    assert buffer.unfinished == 2
+    assert drain(buffer) == ["a", "b"]
+    assert buffer.unfinished == 0
+    assert buffer.join(0)
+
+
+def test_block_waits_for_room() -> None:
+    """Add a message once the held one is read."""
+    buffer = MessageBuffer(1, "block")
+    assert buffer.put(20, "a")
+    assert buffer.get(0) == "a"
+    assert buffer.put(20, "b")
+    buffer.task_done()
+
+    assert buffer.dropped == 0
+    assert buffer.unfinished == 1
+    assert drain(buffer) == ["b"]
+    assert buffer.unfinished == 0
+    assert buffer.join(0)
+
+
+def test_block_released_on_close() -> None:
+    """Refuse the message to add once the buffer is closed."""
+    buffer = MessageBuffer(1, "block")
+    assert buffer.put(20, "a")
+    buffer.close()
+    assert not buffer.put(20, "b")
+
+    assert buffer.unfinished == 1
+    assert drain(buffer) == ["a"]
+    assert buffer.join(0)
+
+
+def test_unknown_policy() -> None:
+    """Reject an unknown overflow policy."""
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        MessageBuffer(1, "drop_newest")
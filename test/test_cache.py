@@ -0,0 +1,122 @@
+"""Tests of the query cache: expiry in both tiers, pruning and size cap of the disk tier, and atomic writes."""
+
+# Standard Library
+from json import loads
+from logging import getLogger
+from pathlib import Path
+from types import SimpleNamespace
+
+# Third-party
+import polars as pl
+import pytest
+
+# Local Application
+from app_name.database import cache as cache_module
+from app_name.database.cache import QueryCache
+
+
+class FakeClock:
+    """Wall and monotonic clocks advanced by hand."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Clock shared by the wall and monotonic time of the cache, logging to a plain logger."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    monkeypatch.setattr(cache_module, "monotonic", clock)
+    monkeypatch.setattr(cache_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    return clock
+
+
+def to_frame(rows: int) -> pl.DataFrame:
+    """Build a query result.
+
+    Args:
+        rows (int): number of rows.
+
+    Returns:
+        pl.DataFrame: one integer column.
+    """
+    return pl.DataFrame({"id": list(range(rows))})
+
+
+def test_expiry_not_extended(clock: FakeClock, tmp_path: Path) -> None:
+    """Expire an entry ttl seconds after it was first cached, even when stored again or read back from disk."""
+    cache = QueryCache(1024**2, 10, tmp_path)
+    cache.put("a", to_frame(1), {"t"})
+    clock.now += 6
+    cache.put("a", to_frame(2), {"t"})
+    cache._entries.clear()  # noqa: SLF001
+
+    assert len(cache.get("a")) == 2
+    clock.now += 5
+    assert cache.get("a") is None
+    assert not tmp_path.joinpath("a.parquet").exists()
+    assert loads(tmp_path.joinpath("index.json").read_text(encoding="utf-8")) == {}
+
+
+def test_prune_on_load(clock: FakeClock, tmp_path: Path) -> None:
+    """Delete expired files and index entries when the disk tier is loaded."""
+    QueryCache(1024**2, 10, tmp_path).put("a", to_frame(1), {"t"})
+    clock.now += 5
+    QueryCache(1024**2, 10, tmp_path).put("b", to_frame(1), {"t"})
+    clock.now += 6
+
+    cache = QueryCache(1024**2, 10, tmp_path)
+
+    assert list(cache._index) == ["b"]  # noqa: SLF001
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["b.parquet", "index.json"]
+    assert len(cache.get("b")) == 1
+
+
+def test_disk_size_cap(clock: FakeClock, tmp_path: Path) -> None:
+    """Delete the oldest files beyond the maximum size of the disk tier."""
+    cache = QueryCache(1024**2, 10, tmp_path)
+    cache.put("a", to_frame(100), {"t"})
+    size = tmp_path.joinpath("a.parquet").stat().st_size
+    cache = QueryCache(1024**2, 10, tmp_path, max_disk_size=2 * size)
+
+    for key in ("b", "c"):
+        clock.now += 1
+        cache.put(key, to_frame(100), {"t"})
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["b.parquet", "c.parquet", "index.json"]
+    assert cache.get("a") is None
+    assert cache.evictions == 1
+
+
+@pytest.mark.usefixtures("clock")
+def test_atomic_writes(tmp_path: Path) -> None:
+    """Leave no temporary file behind, and drop entries on invalidation from both tiers."""
+    cache = QueryCache(1024**2, 10, tmp_path)
+    cache.put("a", to_frame(1), {"Schema.T"})
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["a.parquet", "index.json"]
+    assert cache.invalidate("schema.t") == 1
+    assert cache.get("a") is None
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["index.json"]
+
+
+def test_memory_tier_expiry(clock: FakeClock) -> None:
+    """Expire memory-only entries, and evict the least recently used ones beyond the maximum size."""
+    size = int(to_frame(100).estimated_size())
+    cache = QueryCache(2 * size, 10)
+    cache.put("a", to_frame(100), {"t"})
+    cache.put("b", to_frame(100), {"t"})
+    cache.get("a")
+    cache.put("c", to_frame(100), {"t"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    clock.now += 10
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,124 @@
+"""Tests of call cancellation: registration of calls in flight, cancel from a watchdog thread or a signal handler, and call deadlines."""
+
+# Standard Library
+from logging import getLogger
+from threading import Event, Thread
+from types import SimpleNamespace
+
+# Third-party
+import oracledb
+import pytest
+
+# Local Application
+from app_name.database import cancel as cancel_module
+from app_name.database import oracle as oracle_module
+from app_name.database.cancel import ActiveCalls, active_calls, cancel_calls, is_cancelled
+from app_name.database.oracle import Oracle
+
+CANCELLED = SimpleNamespace(full_code="ORA-01013", message="ORA-01013: user requested cancel of current operation")
+
+
+class FakeConnection:
+    """Connection whose call blocks until cancelled, then fails with ORA-01013."""
+
+    def __init__(self, *, failing: bool = False) -> None:
+        """Initialize class."""
+        self.call_timeout = 0
+        self.failing = failing
+        self.cancelled = Event()
+
+    def cancel(self) -> None:
+        """Interrupt the call in flight."""
+        if self.failing:
+            message = "DPI-1010: not connected"
+            raise oracledb.InterfaceError(message)
+        self.cancelled.set()
+
+    def call(self) -> None:
+        """Run a call, until cancelled."""
+        if not self.cancelled.wait(5):
+            message = "call not cancelled"
+            raise TimeoutError(message)
+        raise oracledb.DatabaseError(CANCELLED)
+
+
+@pytest.fixture(autouse=True)
+def calls(monkeypatch: pytest.MonkeyPatch) -> ActiveCalls:
+    """Fresh registry of calls in flight, logging to a plain logger."""
+    for module in (cancel_module, oracle_module):
+        monkeypatch.setattr(module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    calls = ActiveCalls()
+    monkeypatch.setattr(cancel_module, "_active_calls_instance", calls)
+    return calls
+
+
+def test_is_cancelled() -> None:
+    """Recognize errors raised by a cancelled or timed out call only."""
+    assert is_cancelled(oracledb.DatabaseError(CANCELLED))
+    assert is_cancelled(oracledb.DatabaseError(SimpleNamespace(full_code="DPY-4024")))
+    assert not is_cancelled(oracledb.DatabaseError(SimpleNamespace(full_code="ORA-00942")))
+    assert not is_cancelled(oracledb.DatabaseError())
+
+
+def test_cancel_registered_calls(calls: ActiveCalls) -> None:
+    """Cancel every registered call, unregistered ones excepted, and count those whose cancel failed."""
+    running, done, broken = FakeConnection(), FakeConnection(), FakeConnection(failing=True)
+    for connection in (running, done, broken):
+        calls.add(connection)
+    calls.label(running, "select 1 from dual")
+    calls.remove(done)
+
+    assert cancel_calls() == 2
+    assert running.cancelled.is_set()
+    assert not done.cancelled.is_set()
+    assert calls.query(running) == "select 1 from dual"
+
+
+def test_cancel_while_lock_held(calls: ActiveCalls) -> None:
+    """Cancel from a signal handler interrupting the main thread while it holds the registry lock."""
+    connection = FakeConnection()
+    calls.add(connection)
+
+    with calls.lock:
+        assert cancel_calls() == 1
+    assert connection.cancelled.is_set()
+
+
+def test_cancel_from_watchdog_thread(calls: ActiveCalls) -> None:
+    """Interrupt a call blocking the main thread from another thread."""
+    connection = FakeConnection()
+    calls.add(connection)
+    watchdog = Thread(target=cancel_calls)
+    watchdog.start()
+
+    with pytest.raises(oracledb.DatabaseError) as error:
+        connection.call()
+    watchdog.join()
+
+    assert is_cancelled(error.value)
+
+
+def test_deadline_cancels_whole_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cancel a call running past its deadline, restore the call timeout and unregister the connection."""
+    config = SimpleNamespace(
+        type="oracle",
+        mode="thin",
+        tns=False,
+        alias="db",
+        cache=False,
+        fetch_target_size=1048576,
+        arraysize=100,
+        prefetchrows=2,
+        batch_size=1000,
+        call_timeout=0,
+    )
+    monkeypatch.setattr(oracle_module, "get_config_class", lambda _class_name: config)
+    database = Oracle()
+    connection = FakeConnection()
+
+    with pytest.raises(oracledb.DatabaseError), database.deadline(connection, 50):
+        connection.call()
+
+    assert connection.cancelled.is_set()
+    assert connection.call_timeout == 0
+    assert not active_calls().calls
@@ -0,0 +1,174 @@
+"""Tests of the publisher confirm window: delivery tag tracking, retries of nacked and returned messages, and reconnections."""
+
+# Standard Library
+from logging import getLogger
+from types import SimpleNamespace
+
+# Third-party
+import pika
+import pytest
+from pika.exceptions import AMQPConnectionError
+from pika.spec import Basic
+
+# Local Application
+from app_name.event import confirm as confirm_module
+from app_name.event.confirm import ConfirmWindow, ConfirmedConnection
+
+
+class FakeChannel:
+    """Channel recording the published message bodies."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.is_open = True
+        self.published: list[tuple[bytes, pika.BasicProperties]] = []
+
+    def basic_publish(self, _exchange: str, _routing_key: str, body: bytes, properties: pika.BasicProperties, *, mandatory: bool) -> None:
+        """Record a published message."""
+        assert mandatory
+        self.published.append((body, properties))
+
+
+@pytest.fixture(autouse=True)
+def logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Log to a plain logger, so that the tests do not depend on the application configuration."""
+    monkeypatch.setattr(confirm_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+
+
+@pytest.fixture
+def connection() -> ConfirmedConnection:
+    """Open confirmed connection, running I/O callbacks inline on a fake channel, with a window of 2 messages and 1 retry."""
+    config = SimpleNamespace(exchange="logs", routing_key="#", confirm_window=2, confirm_retries=1, confirm_timeout=0.05)
+    connection = ConfirmedConnection(pika.ConnectionParameters(), config, {})
+    connection._connection = SimpleNamespace(ioloop=SimpleNamespace(add_callback_threadsafe=lambda callback: callback()))  # noqa: SLF001
+    connection._channel = FakeChannel()  # noqa: SLF001
+    connection._is_open = True  # noqa: SLF001
+    return connection
+
+
+def to_frame(method: Basic.Ack | Basic.Nack) -> SimpleNamespace:
+    """Wrap a confirm method as received by the ack/nack callback.
+
+    Args:
+        method (Basic.Ack | Basic.Nack): confirm method.
+
+    Returns:
+        SimpleNamespace: method frame.
+    """
+    return SimpleNamespace(method=method)
+
+
+def message(body: bytes, message_id: str | None = None, attempts: int = 0) -> tuple[bytes, pika.BasicProperties, int]:
+    """Build a tracked message.
+
+    Args:
+        body (bytes): message body.
+        message_id (str | None, optional): message id. Defaults to None.
+        attempts (int, optional): number of previous attempts. Defaults to 0.
+
+    Returns:
+        tuple[bytes, pika.BasicProperties, int]: message body, properties and attempts.
+    """
+    return body, pika.BasicProperties(message_id=message_id), attempts
+
+
+def test_ack_multiple() -> None:
+    """Retire every message up to the delivery tag of a multiple ack."""
+    window = ConfirmWindow(10, 3)
+    tags = [window.add(message(body)) for body in (b"a", b"b", b"c")]
+
+    assert tags == [1, 2, 3]
+    assert window.on_confirm(2, multiple=True, ack=True) == (0, 0)
+    assert list(window.outstanding) == [3]
+
+
+def test_nack_retried_then_dropped() -> None:
+    """Queue a nacked message to be published again, and drop it once out of retries."""
+    window = ConfirmWindow(10, 1)
+    window.add(message(b"a", "1"))
+    window.add(message(b"b", "2", attempts=1))
+
+    assert window.on_confirm(2, multiple=True, ack=False) == (1, 1)
+    body, properties, attempts = window.take()
+    assert (body, properties.message_id, attempts) == (b"a", "1", 1)
+    assert window.take() is None
+    assert window.dropped == 1
+
+
+def test_returned_message_retried() -> None:
+    """Publish again a message returned as unroutable, matched by message id even with identical bodies."""
+    window = ConfirmWindow(10, 3)
+    window.add(message(b"same", "1"))
+    window.add(message(b"same", "2"))
+    window.on_return("2")
+
+    assert window.on_confirm(2, multiple=True, ack=True) == (1, 0)
+    body, properties, attempts = window.take()
+    assert (body, properties.message_id, attempts) == (b"same", "2", 1)
+
+
+def test_reset_requeues_in_order() -> None:
+    """Queue unconfirmed messages ahead of the ones to publish again, and restart delivery tags."""
+    window = ConfirmWindow(10, 3)
+    window.add(message(b"a"))
+    window.add(message(b"b"))
+    window.on_confirm(1, multiple=False, ack=False)
+    window.add(message(b"c"))
+
+    assert window.reset() == 2
+    assert [window.take()[0] for _ in range(3)] == [b"b", b"c", b"a"]
+    assert window.add(message(b"d")) == 1
+
+
+def test_reserve_full_window() -> None:
+    """Wait for room only when the window is full."""
+    window = ConfirmWindow(1, 3)
+
+    assert window.reserve(0)
+    window.add(message(b"a"))
+    assert not window.reserve(0.01)
+    window.on_confirm(1, multiple=False, ack=True)
+    assert window.reserve(0)
+
+
+def test_publish_without_waiting(connection: ConfirmedConnection) -> None:
+    """Publish messages up to the window size before any confirm, then fail once no confirm frees the window."""
+    connection.publish(b"a", pika.BasicProperties())
+    connection.publish(b"b", pika.BasicProperties())
+
+    assert len(connection.window) == 2
+    with pytest.raises(AMQPConnectionError, match="No publisher confirm"):
+        connection.publish(b"c", pika.BasicProperties())
+
+
+def test_publish_nacked_again_first(connection: ConfirmedConnection) -> None:
+    """Publish a nacked message again before the next new one, under its original message id."""
+    connection.publish(b"a", pika.BasicProperties())
+    connection.publish(b"b", pika.BasicProperties())
+    connection._on_confirm(to_frame(Basic.Nack(delivery_tag=1)))  # noqa: SLF001
+    connection._on_confirm(to_frame(Basic.Ack(delivery_tag=2)))  # noqa: SLF001
+    connection.publish(b"c", pika.BasicProperties())
+
+    published = connection._channel.published  # noqa: SLF001
+    assert [body for body, _ in published] == [b"a", b"b", b"a", b"c"]
+    assert published[2][1].message_id == published[0][1].message_id
+    assert len({properties.message_id for _, properties in published}) == 3
+
+
+def test_drain(connection: ConfirmedConnection) -> None:
+    """Report whether every message was confirmed in time."""
+    connection.publish(b"a", pika.BasicProperties())
+
+    assert not connection.drain(0.01)
+    connection._on_confirm(to_frame(Basic.Ack(delivery_tag=1)))  # noqa: SLF001
+    assert connection.drain(0.01)
+
+
+def test_publish_closed(connection: ConfirmedConnection) -> None:
+    """Refuse to publish on a closed channel, keeping the messages to publish again."""
+    connection.publish(b"a", pika.BasicProperties())
+    connection._on_connection_closed(SimpleNamespace(ioloop=SimpleNamespace(stop=lambda: None)), Exception("closed"))  # noqa: SLF001
+
+    with pytest.raises(AMQPConnectionError, match="Channel closed"):
+        connection.publish(b"b", pika.BasicProperties())
+    assert [body for body, _, _ in connection.window.pending] == [b"a"]
@@ -0,0 +1,33 @@
+"""Tests of streamed exports: compression codecs checked per file format."""
+
+# Standard Library
+from pathlib import Path
+
+# Third-party
+import polars as pl
+import pytest
+
+# Local Application
+from app_name.database.common import sink_frame
+
+DATA = pl.LazyFrame({"id": [1, 2, 3]})
+
+
+@pytest.mark.parametrize(("file_format", "compression"), [("parquet", "snappy"), ("ipc", "lz4"), ("ipc", "uncompressed"), ("csv", "snappy")])
+def test_supported_compression(tmp_path: Path, file_format: str, compression: str) -> None:
+    """Write every codec a format supports, and CSV files whatever the codec."""
+    file_path = tmp_path.joinpath(f"export.{file_format}")
+
+    sink_frame(DATA, file_path, file_format, compression, 2)
+
+    read = {"parquet": pl.read_parquet, "ipc": pl.read_ipc, "csv": pl.read_csv}[file_format]
+    assert read(file_path)["id"].to_list() == [1, 2, 3]
+
+
+def test_unsupported_compression(tmp_path: Path) -> None:
+    """Refuse snappy for Arrow IPC before writing anything."""
+    file_path = tmp_path.joinpath("export.ipc")
+
+    with pytest.raises(ValueError, match="Unsupported ipc export compression: snappy, expected one of lz4, uncompressed, zstd"):
+        sink_frame(DATA, file_path, "ipc", "snappy", 2)
+    assert not file_path.exists()
@@ -0,0 +1,74 @@
+"""Tests of LOB reads: small LOBs read whole in one round trip, large ones streamed by chunks, multi-byte CLOBs included."""
+
+# Standard Library
+from pathlib import Path
+
+# Third-party
+import oracledb
+import pytest
+
+# Local Application
+from app_name.database import lob as lob_module
+from app_name.database.lob import LobStream, to_lob_value
+
+TEXT = "héllo wörld — ünïcode ✓ end"
+
+
+class FakeLob:
+    """LOB locator reading by character offsets for CLOBs and byte offsets for BLOBs, recording each read."""
+
+    def __init__(self, value: str | bytes) -> None:
+        """Initialize class."""
+        self.value = value
+        self.type = oracledb.DB_TYPE_BLOB if isinstance(value, bytes) else oracledb.DB_TYPE_CLOB
+        self.reads: list[tuple[int, int | None]] = []
+
+    def getchunksize(self) -> int:
+        """Get the LOB chunk size."""
+        return 2
+
+    def read(self, offset: int = 1, amount: int | None = None) -> str | bytes:
+        """Read from a 1-based offset."""
+        self.reads.append((offset, amount))
+        return self.value[offset - 1 : None if amount is None else offset - 1 + amount]
+
+
+@pytest.fixture(autouse=True)
+def read_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Read large LOBs by pieces of 4 characters or bytes."""
+    monkeypatch.setattr(lob_module, "LOB_READ_SIZE", 4)
+
+
+def test_small_lob_single_read() -> None:
+    """Return a LOB within the inline size whole, in one read."""
+    lob = FakeLob(TEXT)
+    streams: list[LobStream] = []
+
+    assert to_lob_value(lob, len(TEXT), streams) == TEXT
+    assert lob.reads == [(1, len(TEXT) + 1)]
+    assert streams == []
+
+
+def test_multibyte_clob_stream(tmp_path: Path) -> None:
+    """Stream a multi-byte CLOB from where the first read stopped, advancing by characters, and write it in UTF-8."""
+    lob = FakeLob(TEXT)
+    streams: list[LobStream] = []
+
+    stream = to_lob_value(lob, 5, streams)
+
+    assert streams == [stream]
+    assert "".join(stream) == TEXT
+    assert [offset for offset, _ in lob.reads] == [1, *range(7, len(TEXT) + 2, 4)]
+    assert stream.write_to(tmp_path.joinpath("clob.txt")) == len(TEXT)
+    assert tmp_path.joinpath("clob.txt").read_text(encoding="utf-8") == TEXT
+
+
+def test_blob_stream() -> None:
+    """Stream a BLOB by byte offsets, and refuse reads once its cursor is closed."""
+    value = TEXT.encode("utf-8")
+    stream = to_lob_value(FakeLob(value), 8, [])
+
+    assert b"".join(stream) == value
+    stream.close()
+    with pytest.raises(ValueError, match="cursor was closed"):
+        stream.read()
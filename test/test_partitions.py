@@ -0,0 +1,60 @@
+"""Tests of the partitioning of parallel extractions: hash buckets, value ranges and ROWID ranges built from table extents."""
+
+# Third-party
+import pytest
+
+# Local Application
+from app_name.database.oracle import to_partition_queries, to_rowid_extents_query, to_rowid_ranges
+
+
+def test_hash_partitions() -> None:
+    """Cover every ORA_HASH bucket, one partition each."""
+    statements = to_partition_queries("select id from t", "id", "hash", 3)
+
+    assert [binds for _, binds in statements] == [{"parallel_partition": 0}, {"parallel_partition": 1}, {"parallel_partition": 2}]
+    assert statements[0][0] == "select * from (select id from t) partitioned where ora_hash(partitioned.id, 2) = :parallel_partition"
+
+
+def test_rowid_partitions() -> None:
+    """Bound each partition by an inclusive ROWID range."""
+    statements = to_partition_queries("select rowid rid from t", "rid", "rowid", ranges=[("AAA", "AAB"), ("AAC", "AAD")])
+
+    assert statements == [
+        (
+            "select * from (select rowid rid from t) partitioned where partitioned.rid between chartorowid(:parallel_low) and chartorowid(:parallel_high)",
+            {"parallel_low": low, "parallel_high": high},
+        )
+        for low, high in [("AAA", "AAB"), ("AAC", "AAD")]
+    ]
+
+
+@pytest.mark.parametrize("method", ["rowid", "range"])
+def test_ranges_required(method: str) -> None:
+    """Refuse the rowid and range methods without ranges."""
+    with pytest.raises(ValueError, match=f"The {method} partitioning method requires ranges"):
+        to_partition_queries("select id from t", "id", method)
+
+
+def test_rowid_ranges_balanced() -> None:
+    """Group consecutive extents into ranges of about the same number of blocks, from the first ROWID to the last one of each group."""
+    extents = [("l1", "h1", 8), ("l2", "h2", 8), ("l3", "h3", 8), ("l4", "h4", 8), ("l5", "h5", 128), ("l6", "h6", 128)]
+
+    assert to_rowid_ranges(extents, 3) == [("l1", "h4"), ("l5", "h5"), ("l6", "h6")]
+
+
+def test_rowid_ranges_few_extents() -> None:
+    """Return fewer ranges than partitions when the table has fewer extents, and none without extent."""
+    assert to_rowid_ranges([("l1", "h1", 8), ("l2", "h2", 8)], 4) == [("l1", "h1"), ("l2", "h2")]
+    assert to_rowid_ranges([], 4) == []
+
+
+def test_rowid_extents_query() -> None:
+    """Read the extents of the current user, or of an owner from the DBA views, in ROWID order."""
+    query = to_rowid_extents_query()
+    owned = to_rowid_extents_query("hr")
+
+    assert "from user_extents e join user_objects o" in query
+    assert ":owner" not in query
+    assert "from dba_extents e join dba_objects o" in owned
+    assert "e.owner = :owner" in owned
+    assert query.endswith("order by o.data_object_id, e.relative_fno, e.block_id")
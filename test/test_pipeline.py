@@ -0,0 +1,152 @@
+"""Tests of pipelines: per-statement result mapping, session timeout, and delegation of the synchronous client to the asyncio one."""
+
+# Standard Library
+from asyncio import run
+from logging import getLogger
+from types import SimpleNamespace
+from typing import Any, ClassVar
+
+# Third-party
+import oracledb
+import pytest
+
+# Local Application
+from app_name.database import oracle as oracle_module
+from app_name.database import oracle_async as oracle_async_module
+from app_name.database import oracle_common as oracle_common_module
+from app_name.database.oracle import Oracle
+from app_name.database.oracle_async import AsyncOracle
+from app_name.database.oracle_common import Pipeline
+
+CONFIG = SimpleNamespace(
+    type="oracle",
+    mode="thin",
+    tns=False,
+    alias="db",
+    cache=False,
+    fetch_lobs=False,
+    fetch_target_size=1048576,
+    arraysize=100,
+    prefetchrows=2,
+    batch_size=1000,
+    call_timeout=5000,
+)
+
+
+class FakeAsyncConnection:
+    """Asyncio connection running pipelines, the second statement failing, and recording the call timeout it ran with."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.call_timeout = 0
+        self.runs: list[tuple[int, bool, int]] = []
+
+    async def run_pipeline(self, pipeline: oracledb.Pipeline, *, continue_on_error: bool) -> list[SimpleNamespace]:
+        """Return one result per operation, commit included."""
+        self.runs.append((len(pipeline.operations), continue_on_error, self.call_timeout))
+        results = [SimpleNamespace(rows=[(i,)], error=None) for i in range(len(pipeline.operations))]
+        results[1] = SimpleNamespace(rows=None, error="ORA-00942: table or view does not exist")
+        return results
+
+
+class FakeAsyncOracle:
+    """Asyncio client recording its connection and the pipelines it runs."""
+
+    instances: ClassVar[list["FakeAsyncOracle"]] = []
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.connected = False
+        self.pipelines: list[Pipeline] = []
+        FakeAsyncOracle.instances.append(self)
+
+    async def connect(self) -> None:
+        """Connect."""
+        self.connected = True
+
+    async def disconnect(self) -> None:
+        """Disconnect."""
+        self.connected = False
+
+    async def run_pipeline(self, pipeline: Pipeline) -> list[Any]:
+        """Run a pipeline."""
+        self.pipelines.append(pipeline)
+        return [SimpleNamespace(rows=[], error=None)] * len(pipeline)
+
+
+@pytest.fixture(autouse=True)
+def configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a fixed database configuration and a plain logger, so that the tests do not depend on the application configuration."""
+    for module in (oracle_module, oracle_async_module, oracle_common_module):
+        monkeypatch.setattr(module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    monkeypatch.setattr(oracle_module, "get_config_class", lambda _class_name: CONFIG)
+    monkeypatch.setattr(oracle_async_module, "get_config_class", lambda _class_name: CONFIG)
+
+
+def to_pipeline(database: Any) -> Pipeline:
+    """Queue a query, a failing query and an update.
+
+    Args:
+        database (Any): Oracle or AsyncOracle instance running the pipeline.
+
+    Returns:
+        Pipeline: queued statements.
+    """
+    database.resolve = lambda query, _binds: query
+    pipeline = database.pipeline()
+    pipeline.select("select 1 from dual")
+    pipeline.select("select 1 from missing")
+    pipeline.execute("update users set seen = sysdate where id = :id", id=1)
+    return pipeline
+
+
+def test_results_continue_on_error() -> None:
+    """Map one result per queued statement, errors in place of the failed ones, and drop the result of the final commit."""
+    database = SimpleNamespace(config=CONFIG)
+    database.pipeline = lambda: Pipeline(database)
+    pipeline = to_pipeline(database)
+    error = SimpleNamespace(rows=None, error="ORA-00942")
+    results = [SimpleNamespace(rows=[(1,)], error=None), error, SimpleNamespace(rows=None, error=None), SimpleNamespace(rows=None, error=None)]
+
+    assert pipeline.to_results(results, {}) == results[:3]
+    assert pipeline.tables() == {"users"}
+
+
+def test_async_run_pipeline() -> None:
+    """Run every statement then the commit in one round trip, bounded by the call timeout, and restore the session timeout."""
+    database = AsyncOracle()
+    database.connection = FakeAsyncConnection()
+
+    results = run(to_pipeline(database).run())
+
+    assert database.connection.runs == [(4, True, 5000)]
+    assert database.connection.call_timeout == 0
+    assert [result.error for result in results] == [None, "ORA-00942: table or view does not exist", None]
+
+
+def test_run_pipeline_through_async_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run pipelines through one asyncio client, connected on first use and disconnected with the pipeline loop."""
+    monkeypatch.setattr(oracle_module, "AsyncOracle", FakeAsyncOracle)
+    FakeAsyncOracle.instances.clear()
+    database = Oracle()
+    pipeline = to_pipeline(database)
+
+    assert len(database.run_pipeline(pipeline)) == 3
+    assert len(database.run_pipeline(pipeline)) == 3
+    client = FakeAsyncOracle.instances[0]
+    assert len(FakeAsyncOracle.instances) == 1
+    assert client.connected
+    assert client.pipelines == [pipeline, pipeline]
+
+    database.close_pipeline()
+    assert not client.connected
+    assert database.loop is None
+
+
+def test_run_pipeline_refuses_uncommitted_work() -> None:
+    """Refuse to run a pipeline on another session while the connection holds uncommitted work."""
+    database = Oracle()
+    database.connection = SimpleNamespace(transaction_in_progress=True)
+
+    with pytest.raises(ValueError, match="commit or roll back"):
+        database.run_pipeline(to_pipeline(database))
@@ -0,0 +1,164 @@
+"""Tests of the PostgreSQL client: statement building, bind placeholders, script splitting and timing, and batched COPY loads."""
+
+# Standard Library
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from logging import getLogger
+from types import SimpleNamespace
+from typing import Self
+
+# Third-party
+import pytest
+
+# Local Application
+from app_name.database import postgres as postgres_module
+from app_name.database.common import to_insert_statement, to_update_statement
+from app_name.database.postgres import Postgres, to_copy_statement, to_statement_list, to_timed_script, to_upsert_statement
+from app_name.database.stats import QueryStats, set_query_stats
+
+
+class FakeCopy:
+    """COPY operation recording the rows written."""
+
+    def __init__(self, loads: list[list[tuple]]) -> None:
+        """Initialize class."""
+        self.rows: list[tuple] = []
+        loads.append(self.rows)
+
+    def write_row(self, row: tuple) -> None:
+        """Record a row."""
+        self.rows.append(row)
+
+    def __enter__(self) -> Self:
+        """Start the COPY."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """End the COPY."""
+
+
+class FakeCursor:
+    """Cursor returning one result set per statement of a script, the server clock advancing by one second per read."""
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        """Initialize class."""
+        self.connection = connection
+        self.results: list[list[tuple]] = []
+
+    def execute(self, query: str, _parameters: object = None) -> None:
+        """Run a script, one result per statement."""
+        self.connection.executed.append(query)
+        clock = datetime(2026, 1, 1, tzinfo=UTC)
+        self.results = []
+        for statement in query.split("\n;\n"):
+            if statement == postgres_module.CLOCK_QUERY:
+                self.results.append([(clock,)])
+                clock += timedelta(seconds=1)
+            else:
+                self.results.append([])
+
+    def fetchone(self) -> tuple | None:
+        """Fetch the first row of the current result."""
+        return self.results[0][0] if self.results[0] else None
+
+    def nextset(self) -> bool | None:
+        """Move to the next result."""
+        self.results.pop(0)
+        return True if self.results else None
+
+    def copy(self, statement: str) -> FakeCopy:
+        """Start a COPY."""
+        self.connection.executed.append(statement)
+        return FakeCopy(self.connection.loads)
+
+    def __enter__(self) -> Self:
+        """Open the cursor."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the cursor."""
+
+
+class FakeConnection:
+    """Connection recording the statements executed and the rows loaded per transaction."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.closed = False
+        self.executed: list[str] = []
+        self.loads: list[list[tuple]] = []
+
+    def cursor(self) -> FakeCursor:
+        """Open a cursor."""
+        return FakeCursor(self)
+
+    def transaction(self) -> nullcontext:
+        """Start a transaction."""
+        return nullcontext()
+
+
+@pytest.fixture
+def database(monkeypatch: pytest.MonkeyPatch) -> Postgres:
+    """PostgreSQL client connected to a fake connection, logging to a plain logger."""
+    monkeypatch.setattr(postgres_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    config = SimpleNamespace(type="postgres", cache=False, batch_size=2, stop_on_error=True, schema="", call_timeout=0)
+    monkeypatch.setattr(postgres_module, "get_config_class", lambda _class_name: config)
+    set_query_stats(QueryStats(0))
+    database = Postgres()
+    database.connection = FakeConnection()
+    return database
+
+
+def test_statement_placeholders() -> None:
+    """Build statements with psycopg positional placeholders."""
+    assert to_insert_statement("t", ["a", "b"], "format") == "insert into t (a, b) values (%s, %s)"
+    assert to_update_statement("t", ["a"], ["id"], "format") == "update t set a = %s where id = %s"
+    assert to_upsert_statement("t", ["id", "a"], ["id"]) == "insert into t (id, a) values (%s, %s) on conflict (id) do update set a = excluded.a"
+    assert to_upsert_statement("t", ["id"], ["id"]) == "insert into t (id) values (%s) on conflict (id) do update set id = excluded.id"
+
+
+def test_copy_statement() -> None:
+    """Build COPY statements for the text and CSV formats."""
+    assert to_copy_statement("t", ["a", "b"]) == "copy t (a, b) from stdin with (format text)"
+    assert to_copy_statement("t", file_format="csv") == "copy t from stdin with (format csv, header)"
+
+
+def test_split_statements() -> None:
+    """Split on semicolons, ignoring those inside literals, quoted identifiers, nested comments and dollar quotes."""
+    script = (
+        "insert into t values ('a;b', E'c\\';d'); -- e;f\n"
+        'update t set "x;y" = 1 /* g /* h; */ i; */;\n'
+        "create function f() returns int as $body$ begin return 1; end; $body$ language plpgsql;;\n"
+        "select $1, a$b from t"
+    )
+
+    assert to_statement_list(script) == [
+        "insert into t values ('a;b', E'c\\';d')",
+        'update t set "x;y" = 1 /* g /* h; */ i; */',
+        "create function f() returns int as $body$ begin return 1; end; $body$ language plpgsql",
+        "select $1, a$b from t",
+    ]
+
+
+def test_timed_script() -> None:
+    """Read the server clock around every statement, with terminators on their own line."""
+    assert to_timed_script(["select 1 -- one", "select 2"]) == (
+        "select clock_timestamp()\n;\nselect 1 -- one\n;\nselect clock_timestamp()\n;\nselect 2\n;\nselect clock_timestamp()"
+    )
+
+
+def test_execute_script_timings(database: Postgres) -> None:
+    """Time every statement of a script sent in a single round trip."""
+    timings = database.execute_script("create table t (a int); insert into t values (1);")
+
+    assert timings == [("create table t (a int)", 1.0), ("insert into t values (1)", 1.0)]
+    assert len(database.connection.executed) == 1
+
+
+def test_insert_many_batches(database: Postgres) -> None:
+    """Load rows through one COPY per batch."""
+    inserted = database.insert_many("t", ["a"], [(i,) for i in range(5)])
+
+    assert inserted == 5
+    assert database.connection.loads == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+    assert database.connection.executed == ["copy t (a) from stdin with (format text)"] * 3
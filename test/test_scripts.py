@@ -0,0 +1,149 @@
+"""Tests of Oracle scripts: statements grouped into PL/SQL blocks, and rollback of the script when a statement fails."""
+
+# Standard Library
+from datetime import UTC, datetime, timedelta
+from logging import getLogger
+from types import SimpleNamespace
+
+# Third-party
+import oracledb
+import pytest
+
+# Local Application
+from app_name.database import oracle as oracle_module
+from app_name.database.common import ScriptError
+from app_name.database.oracle import Oracle
+from app_name.database.stats import QueryStats, set_query_stats
+
+
+class FakeVar:
+    """Bind variable."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.value = None
+
+    def getvalue(self) -> object:
+        """Get the value."""
+        return self.value
+
+    def setvalue(self, _position: int, value: object) -> None:
+        """Set the value."""
+        self.value = value
+
+
+class FakeCursor:
+    """Cursor running PL/SQL blocks statement by statement, statements naming a missing table failing."""
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        """Initialize class."""
+        self.connection = connection
+
+    def var(self, *_args: object) -> FakeVar:
+        """Create a bind variable."""
+        return FakeVar()
+
+    def execute(self, statement: str, binds: dict | None = None, **_kwargs: object) -> None:
+        """Run a query, or a PL/SQL block filling its timestamp, position and error binds."""
+        if not binds:
+            if "missing" in statement:
+                message = "ORA-00942: table or view does not exist"
+                raise oracledb.DatabaseError(message)
+            self.connection.log.append(statement)
+            return
+
+        clock = datetime(2026, 1, 1, tzinfo=UTC)
+        binds["t0"].setvalue(0, clock)
+        for i in range(1, sum(name.startswith("s") for name in binds) + 1):
+            if "missing" in binds[f"s{i}"]:
+                binds["failed"].setvalue(0, i)
+                binds["error"].setvalue(0, "ORA-00942: table or view does not exist")
+                return
+            self.connection.log.append(binds[f"s{i}"])
+            binds[f"t{i}"].setvalue(0, clock + timedelta(seconds=i))
+
+    def close(self) -> None:
+        """Close the cursor."""
+
+
+class FakeConnection:
+    """Connection recording executed statements, commits and rollbacks."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.call_timeout = 0
+        self.log: list[str] = []
+
+    def cursor(self) -> FakeCursor:
+        """Open a cursor."""
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        """Commit."""
+        self.log.append("commit")
+
+    def rollback(self) -> None:
+        """Roll back."""
+        self.log.append("rollback")
+
+
+@pytest.fixture
+def database(monkeypatch: pytest.MonkeyPatch) -> Oracle:
+    """Oracle client connected to a fake connection, stopping scripts on error, with blocks of 2 statements."""
+    monkeypatch.setattr(oracle_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    config = SimpleNamespace(
+        type="oracle",
+        mode="thin",
+        tns=False,
+        alias="db",
+        cache=False,
+        fetch_target_size=1048576,
+        arraysize=100,
+        prefetchrows=2,
+        batch_size=1000,
+        call_timeout=0,
+        script_batch_size=2,
+        stop_on_error=True,
+    )
+    monkeypatch.setattr(oracle_module, "get_config_class", lambda _class_name: config)
+    set_query_stats(QueryStats(0))
+    database = Oracle()
+    database.connection = FakeConnection()
+    return database
+
+
+def test_script_blocks(database: Oracle) -> None:
+    """Group statements into blocks, run queries on their own, time each statement, then commit."""
+    timings = database.execute_script("insert into t values (1); insert into t values (2); insert into t values (3); select 1 from dual;")
+
+    assert [statement for statement, _ in timings] == ["insert into t values (1)", "insert into t values (2)", "insert into t values (3)", "select 1 from dual"]
+    assert timings[0][1] == 1.0
+    assert database.connection.log[-1] == "commit"
+
+
+def test_script_block_failure_rolls_back(database: Oracle) -> None:
+    """Roll back then raise a script error, chained to the error of the failed statement."""
+    with pytest.raises(ScriptError, match="statement 2 of the block") as error:
+        database.execute_script("insert into t values (1); insert into missing values (2); insert into t values (3);")
+
+    assert isinstance(error.value.__cause__, oracledb.DatabaseError)
+    assert database.connection.log == ["insert into t values (1)", "rollback"]
+
+
+def test_script_query_failure_rolls_back(database: Oracle) -> None:
+    """Roll back the statements run before a failing query, instead of committing them."""
+    with pytest.raises(ScriptError, match="ORA-00942") as error:
+        database.execute_script("insert into t values (1); select 1 from missing; insert into t values (2);")
+
+    assert isinstance(error.value.__cause__, oracledb.DatabaseError)
+    assert database.connection.log == ["insert into t values (1)", "rollback"]
+
+
+def test_script_continues_on_error(database: Oracle) -> None:
+    """Skip failing statements and commit the others when scripts do not stop on error."""
+    database.config.stop_on_error = False
+
+    timings = database.execute_script("insert into missing values (1); insert into t values (2); select 1 from missing;")
+
+    assert [statement for statement, _ in timings] == ["insert into t values (2)"]
+    assert database.connection.log == ["insert into t values (2)", "commit"]
@@ -0,0 +1,80 @@
+"""Tests of fetch sizing: row size estimates, and array and prefetch sizes from column widths and previous runs."""
+
+# Standard Library
+from types import SimpleNamespace
+
+# Local Application
+from app_name.database.sizing import FetchSizer, to_observed_row_size
+from app_name.database.stats import DEFAULT_COLUMN_SIZE, to_fetch_metrics, to_row_size
+
+QUERY = "select id, name from users"
+
+
+def to_description(*sizes: int | None) -> list[tuple]:
+    """Build a cursor description.
+
+    Args:
+        *sizes (int | None): internal size of each column.
+
+    Returns:
+        list[tuple]: one 7-item sequence per column.
+    """
+    return [(f"C{i}", None, None, size, None, None, True) for i, size in enumerate(sizes)]
+
+
+def test_row_size_default() -> None:
+    """Count columns without described size, or with a negative one, for the default column size."""
+    assert to_row_size(to_description(100, None, -1)) == 100 + 2 * DEFAULT_COLUMN_SIZE
+    assert to_row_size(None) == 0
+
+
+def test_fetch_metrics() -> None:
+    """Estimate round trips from the array size, execute included, and bytes from the described row size."""
+    cursor = SimpleNamespace(arraysize=100, description=to_description(10, 20))
+
+    assert to_fetch_metrics(cursor, 250) == {"rows": 250, "round_trips": 3, "size": 7500}
+
+
+def test_observed_row_size() -> None:
+    """Average the wire size of sampled rows."""
+    assert to_observed_row_size([("abc", None), ("é", b"12")]) == (3 + 1 + 2 + 2) // 2
+    assert to_observed_row_size([]) == 0
+
+
+def test_prepare_defaults() -> None:
+    """Use the configured sizes for statements without history, unless overridden."""
+    sizer = FetchSizer(1000, 100, 2, 10000)
+    cursor = SimpleNamespace()
+
+    sizer.prepare(cursor, QUERY)
+    assert (cursor.arraysize, cursor.prefetchrows) == (100, 2)
+    sizer.prepare(cursor, QUERY, arraysize=7, prefetchrows=0)
+    assert (cursor.arraysize, cursor.prefetchrows) == (7, 0)
+
+
+def test_adapt_from_description() -> None:
+    """Fit the described row size in the target round trip size, within the maximum array size."""
+    sizer = FetchSizer(1000, 100, 2, 20)
+    cursor = SimpleNamespace(arraysize=100, description=to_description(50, 50))
+
+    sizer.adapt(cursor, QUERY)
+    assert cursor.arraysize == 10
+    cursor.description = to_description(1)
+    sizer.adapt(cursor, QUERY)
+    assert cursor.arraysize == 20
+
+
+def test_prepare_from_history() -> None:
+    """Size from the previous run, prefetching every row plus one when the result fits in a round trip, and skip described sizes."""
+    sizer = FetchSizer(1000, 100, 2, 10000)
+    sizer.observe(QUERY, 100, 5)
+    cursor = SimpleNamespace(description=to_description(500))
+
+    sizer.prepare(cursor, QUERY)
+    assert (cursor.arraysize, cursor.prefetchrows) == (10, 6)
+    sizer.adapt(cursor, QUERY)
+    assert cursor.arraysize == 10
+
+    sizer.observe(QUERY, 10, 5000)
+    sizer.prepare(cursor, QUERY)
+    assert (cursor.arraysize, cursor.prefetchrows) == (100, 2)
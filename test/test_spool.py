@@ -0,0 +1,157 @@
+"""Tests of the AMQP spool: peek and commit, segment rolls, size bound, and in-order replay by the log handler."""
+
+# Standard Library
+from logging import INFO, Formatter, LogRecord, getLogger
+from pathlib import Path
+from threading import Thread
+from time import monotonic, sleep
+from types import SimpleNamespace
+
+# Third-party
+import pytest
+
+# Local Application
+from app_name.event import spool as spool_module
+from app_name.event.handler import amqp as handler_module
+from app_name.event.handler.amqp import AMQPLogHandler
+from app_name.event.spool import Spool
+
+CONFIG = {
+    "max_failed_messages": 3,
+    "asynchronous": False,
+    "batch_format": "none",
+    "spool": False,
+    "spool_replay_rate": 1000,
+    "retry_delay": 0.01,
+    "close_timeout": 1,
+}
+
+
+class FakePublisher:
+    """Publisher recording the published messages, failing while the broker is down."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.up = False
+        self.published: list[str] = []
+        self.extra = {}
+
+    def is_connected(self) -> bool:
+        """Whether the broker is reachable."""
+        return self.up
+
+    def connect(self) -> bool:
+        """Connect, if the broker is reachable."""
+        return self.up
+
+    def publish_message(self, message: str, *, reconnect: bool = True) -> bool:  # noqa: ARG002
+        """Record a message, if the broker is reachable."""
+        if self.up:
+            self.published.append(message)
+        return self.up
+
+    def close(self) -> None:
+        """Close the connection."""
+
+
+@pytest.fixture(autouse=True)
+def logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Log to a plain logger, so that the tests do not depend on the application configuration."""
+    monkeypatch.setattr(spool_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    monkeypatch.setattr(handler_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+
+
+@pytest.fixture
+def handler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AMQPLogHandler:
+    """Synchronous log handler publishing to a fake publisher, with a spool replayed on demand."""
+    monkeypatch.setattr(handler_module, "get_config_value", lambda _class_name, attribute, default=None: CONFIG.get(attribute, default))
+    monkeypatch.setattr(handler_module, "AMQPPublisher", FakePublisher)
+    handler = AMQPLogHandler()
+    handler.setFormatter(Formatter("%(message)s"))
+    handler._spool = Spool(tmp_path, max_size=1 << 20, segment_size=1 << 10)  # noqa: SLF001
+    return handler
+
+
+def to_record(message: str) -> LogRecord:
+    """Build a log record.
+
+    Args:
+        message (str): log message.
+
+    Returns:
+        LogRecord: log record.
+    """
+    return LogRecord(__name__, INFO, __file__, 0, message, None, None)
+
+
+def test_peek_commit(tmp_path: Path) -> None:
+    """Return the same messages until they are committed, then the next ones."""
+    spool = Spool(tmp_path, max_size=1 << 20, segment_size=1 << 10)
+    spool.append([b"a", b"b", b"c"])
+
+    assert spool.peek(2) == [b"a", b"b"]
+    assert spool.peek(2) == [b"a", b"b"]
+    spool.commit(1)
+    assert spool.peek(2) == [b"b", b"c"]
+    spool.commit(2)
+    assert spool.peek(2) == []
+    assert len(spool) == 0
+
+
+def test_replay_across_segments(tmp_path: Path) -> None:
+    """Read segments oldest first, deleting each once fully committed, including messages appended while reading."""
+    spool = Spool(tmp_path, max_size=1 << 20, segment_size=8)
+    spool.append([b"first", b"second"])
+    assert spool.peek(10) == [b"first"]
+    spool.append([b"third"])
+
+    replayed = []
+    while messages := spool.peek(10):
+        replayed.extend(messages)
+        spool.commit(len(messages))
+
+    assert replayed == [b"first", b"second", b"third"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_reopen_keeps_backlog(tmp_path: Path) -> None:
+    """Replay messages left by a previous run, skipping a record truncated by a crash."""
+    spool = Spool(tmp_path, max_size=1 << 20, segment_size=1 << 10)
+    spool.append([b"kept"])
+    spool.close()
+    with next(tmp_path.iterdir()).open("ab") as segment:
+        segment.write((10).to_bytes(spool_module.HEADER_SIZE, "big") + b"trunc")
+
+    spool = Spool(tmp_path, max_size=1 << 20, segment_size=1 << 10)
+    assert spool.peek(10) == [b"kept"]
+    spool.commit(1)
+    assert spool.peek(10) == []
+
+
+def test_max_size_drops_oldest(tmp_path: Path) -> None:
+    """Drop the oldest segments once the spool exceeds its maximum size."""
+    spool = Spool(tmp_path, max_size=20, segment_size=8)
+    spool.append([b"old-1", b"old-2", b"new-1", b"new-2"])
+
+    assert spool.dropped == 18
+    assert spool.peek(10) == [b"new-1"]
+
+
+def test_live_messages_after_backlog(handler: AMQPLogHandler) -> None:
+    """Spool live messages behind the backlog until it is replayed, so that they reach the broker in order."""
+    handler.emit(to_record("a"))
+    handler.emit(to_record("b"))
+    handler.amqp.up = True
+    handler.emit(to_record("c"))
+    assert handler.amqp.published == []
+
+    replayer = Thread(target=handler._replay)  # noqa: SLF001
+    replayer.start()
+    deadline = monotonic() + 5
+    while handler._backlog and monotonic() < deadline:  # noqa: SLF001
+        sleep(0.01)
+    handler.emit(to_record("d"))
+    handler._stopping.set()  # noqa: SLF001
+    replayer.join()
+
+    assert handler.amqp.published == ["a", "b", "c", "d"]
@@ -0,0 +1,36 @@
+"""Tests of the SQL script splitting, around comments, string literals and PL/SQL units."""
+
+# Local Application
+from app_name.database.oracle_common import skip_literal, to_statement_list
+
+
+def test_split_statements() -> None:
+    """Split on semicolons, ignoring those inside literals and comments."""
+    script = "insert into t values ('a;b'); -- c;d\nupdate t set \"x;y\" = 1 /* e;f */;"
+
+    assert to_statement_list(script) == ["insert into t values ('a;b')", 'update t set "x;y" = 1 /* e;f */']
+
+
+def test_split_plsql_unit() -> None:
+    """Keep the semicolons of PL/SQL units, ended by a slash alone on its line."""
+    script = "begin\n  null;\nend;\n/\nselect 1 from dual;"
+
+    assert to_statement_list(script) == ["begin\n  null;\nend;", "select 1 from dual"]
+
+
+def test_q_quote_at_start() -> None:
+    """Recognize a q-quoted literal opening the script."""
+    assert to_statement_list("q'[it's;]'; select 1 from dual") == ["q'[it's;]'", "select 1 from dual"]
+
+
+def test_q_quote_after_identifier() -> None:
+    """Do not take an identifier ending with q for a q-quote."""
+    assert to_statement_list("select fq'[;' from dual; select 2 from dual") == ["select fq'[;' from dual", "select 2 from dual"]
+
+
+def test_unterminated_q_quote() -> None:
+    """Return the rest of the script as one statement when a q-quote is not terminated."""
+    assert to_statement_list("select 1 from dual; select q'[a;b") == ["select 1 from dual", "select q'[a;b"]
+    assert to_statement_list("select 1 from dual; q'") == ["select 1 from dual", "q'"]
+    assert skip_literal("q'", 0) == 2
+    assert skip_literal("q'[", 0) == 3
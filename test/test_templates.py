@@ -0,0 +1,72 @@
+"""Tests of the SQL template registry: name resolution, bind checks and directory rescans."""
+
+# Standard Library
+from logging import getLogger
+from pathlib import Path
+from types import SimpleNamespace
+
+# Third-party
+import pytest
+
+# Local Application
+from app_name.database import templates as templates_module
+from app_name.database.templates import SqlTemplates, to_bind_names
+
+
+@pytest.fixture(autouse=True)
+def logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Log to a plain logger, so that the tests do not depend on the application paths."""
+    monkeypatch.setattr(templates_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+
+
+def test_resolve_template(tmp_path: Path) -> None:
+    """Resolve a dotted name into the statement of its file, without terminator."""
+    tmp_path.joinpath("orders").mkdir()
+    tmp_path.joinpath("orders", "by_customer.sql").write_text("select id from orders where customer_id = :customer_id;\n")
+    templates = SqlTemplates(tmp_path)
+
+    assert templates.resolve("orders.by_customer", {"customer_id": 42}) == "select id from orders where customer_id = :customer_id"
+
+
+def test_resolve_sql_text(tmp_path: Path) -> None:
+    """Return SQL text, and single identifiers without template, as is."""
+    templates = SqlTemplates(tmp_path)
+
+    assert templates.resolve("select 1 from dual", None) == "select 1 from dual"
+    assert templates.resolve("commit", None) == "commit"
+
+
+def test_resolve_unknown_template(tmp_path: Path) -> None:
+    """Refuse a dotted name without template file, instead of sending it as SQL text."""
+    templates = SqlTemplates(tmp_path)
+
+    with pytest.raises(ValueError, match=r"Unknown SQL template: orders\.by_custmer"):
+        templates.resolve("orders.by_custmer", None)
+
+
+def test_resolve_checks_binds(tmp_path: Path) -> None:
+    """Refuse bind parameters not matching the declared ones."""
+    tmp_path.joinpath("count.sql").write_text("select count(*) from orders where status = :status")
+    templates = SqlTemplates(tmp_path)
+
+    with pytest.raises(ValueError, match="missing: \\['status'\\]"):
+        templates.resolve("count", {"state": "open"})
+
+
+def test_rescan_throttled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Scan the directory for unknown names at most once per interval."""
+    clock = [100.0]
+    monkeypatch.setattr(templates_module, "monotonic", lambda: clock[0])
+    templates = SqlTemplates(tmp_path)
+    tmp_path.joinpath("late.sql").write_text("select 1 from dual")
+
+    assert templates.get("late") is None
+    clock[0] += templates_module.RESCAN_INTERVAL
+    assert templates.get("late") is not None
+
+
+def test_bind_names_pyformat() -> None:
+    """Find %(name)s binds, outside string literals and comments."""
+    query = "select '%(skipped)s' from orders -- %(comment)s\nwhere id = %(id)s and status = %(Status)s and created::date = %(id)s"
+
+    assert to_bind_names(query, "pyformat") == ["id", "status"]
@@ -0,0 +1,137 @@
+"""Tests of DataFrame writes: chunking by memory budget, merge statements and rejected rows, and direct path loads."""
+
+# Standard Library
+from logging import getLogger
+from types import SimpleNamespace
+
+# Third-party
+import polars as pl
+import pytest
+
+# Local Application
+from app_name.database import oracle as oracle_module
+from app_name.database.oracle import Oracle, to_chunk_rows, to_merge_statement
+from app_name.database.stats import QueryStats, set_query_stats
+
+# Two Int64 columns, 16 bytes per row, so that a budget of 32 bytes makes chunks of 2 rows
+DATA = pl.DataFrame({"ID": [1, 2, 3, 4, 5], "AMOUNT": [10, 20, 30, 40, 50]})
+BUFFER_SIZE = 32
+
+
+class FakeCursor:
+    """Cursor recording array DML, the row of ID 4 being rejected."""
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        """Initialize class."""
+        self.connection = connection
+        self.rowcount = 0
+        self.errors: list[SimpleNamespace] = []
+
+    def execute(self, statement: str, *_args: object, **_kwargs: object) -> None:
+        """Run a statement."""
+        self.connection.log.append(statement)
+
+    def executemany(self, statement: str, chunk: pl.DataFrame, *, batcherrors: bool) -> None:
+        """Run a statement once per row of a chunk, collecting errors rather than failing."""
+        assert batcherrors
+        self.connection.log.append(statement)
+        self.connection.chunks.append(chunk["ID"].to_list())
+        self.errors = [SimpleNamespace(offset=i, message="ORA-00001: unique constraint violated") for i, key in enumerate(chunk["ID"]) if key == 4]
+        self.rowcount = chunk.height - len(self.errors)
+
+    def getbatcherrors(self) -> list[SimpleNamespace]:
+        """Get the errors of the last array DML."""
+        return self.errors
+
+    def close(self) -> None:
+        """Close the cursor."""
+
+
+class FakeConnection:
+    """Connection recording statements, chunks written and commits."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.call_timeout = 0
+        self.username = "APP"
+        self.log: list[str] = []
+        self.chunks: list[list[int]] = []
+
+    def cursor(self) -> FakeCursor:
+        """Open a cursor."""
+        return FakeCursor(self)
+
+    def direct_path_load(self, schema: str, table: str, columns: list[str], chunk: pl.DataFrame) -> None:
+        """Load a chunk by direct path."""
+        self.log.append(f"direct path load {schema}.{table} ({', '.join(columns)})")
+        self.chunks.append(chunk["ID"].to_list())
+
+    def commit(self) -> None:
+        """Commit."""
+        self.log.append("commit")
+
+
+@pytest.fixture
+def database(monkeypatch: pytest.MonkeyPatch) -> Oracle:
+    """Oracle client in thin mode connected to a fake connection, with direct path loads enabled."""
+    monkeypatch.setattr(oracle_module, "log", lambda: SimpleNamespace(logger=getLogger(__name__)))
+    config = SimpleNamespace(
+        type="oracle",
+        mode="thin",
+        tns=False,
+        alias="db",
+        cache=False,
+        fetch_target_size=1048576,
+        arraysize=100,
+        prefetchrows=2,
+        batch_size=1000,
+        call_timeout=0,
+        write_buffer_size=1048576,
+        direct_path=True,
+    )
+    monkeypatch.setattr(oracle_module, "get_config_class", lambda _class_name: config)
+    set_query_stats(QueryStats(0))
+    database = Oracle()
+    database.connection = FakeConnection()
+    return database
+
+
+def test_chunk_rows() -> None:
+    """Fit as many rows as the memory budget allows, at least one."""
+    assert to_chunk_rows(DATA, BUFFER_SIZE) == 2
+    assert to_chunk_rows(DATA, 1) == 1
+    assert to_chunk_rows(DATA.clear(), BUFFER_SIZE) == 1
+
+
+def test_merge_statement() -> None:
+    """Match rows on their keys, update the other columns, insert the missing rows."""
+    assert to_merge_statement("t", ["ID", "AMOUNT"], ["ID"]) == (
+        "merge into t t using (select :1 as ID, :2 as AMOUNT from dual) s on (t.ID = s.ID)"
+        " when matched then update set t.AMOUNT = s.AMOUNT when not matched then insert (ID, AMOUNT) values (s.ID, s.AMOUNT)"
+    )
+    assert "when matched" not in to_merge_statement("t", ["ID"], ["ID"])
+
+
+def test_merge_chunks(database: Oracle) -> None:
+    """Merge chunk by chunk, skip rejected rows, then commit once."""
+    written = database.write_df(DATA, "t", "merge", keys=["ID"], buffer_size=BUFFER_SIZE)
+
+    assert written == 4
+    assert database.connection.chunks == [[1, 2], [3, 4], [5]]
+    assert database.connection.log == [to_merge_statement("t", ["ID", "AMOUNT"], ["ID"])] * 3 + ["commit"]
+
+
+def test_truncate_direct_path(database: Oracle) -> None:
+    """Truncate then load chunk by chunk by direct path, into the schema of the connection unless prefixed."""
+    written = database.write_df(DATA, "t", "truncate", buffer_size=BUFFER_SIZE)
+
+    assert written == 5
+    assert database.connection.chunks == [[1, 2], [3, 4], [5]]
+    assert database.connection.log == ["truncate table t"] + ["direct path load APP.t (ID, AMOUNT)"] * 3 + ["commit"]
+
+
+@pytest.mark.parametrize(("mode", "keys", "message"), [("upsert", None, "Unknown write mode"), ("merge", None, "Merge mode requires key columns")])
+def test_write_df_arguments(database: Oracle, mode: str, keys: list[str] | None, message: str) -> None:
+    """Refuse unknown modes, and merges without keys."""
+    with pytest.raises(ValueError, match=message):
+        database.write_df(DATA, "t", mode, keys=keys)
@@ -0,0 +1,255 @@
+"""Module providing an in-process stand-in for the oracledb connection and cursor, to benchmark the database layer without a database.
+
+Every call that would reach the server counts as a round trip and sleeps for the configured latency. Queries return generated rows of a
+configured count and width, DML statements only count their rows.
+
+Typical usage example:
+    database = Oracle()
+    database.connection = Connection(latency=0.001, rows=100000, columns=10, width=20)
+    database.select("select * from orders")
+    print(database.connection.round_trips)
+"""
+
+# Standard Library
+from collections import deque
+from collections.abc import Iterator
+from re import IGNORECASE, match
+from time import sleep
+from typing import Any, Self
+
+# Third-party
+import polars as pl
+
+# Type code reported in cursor descriptions, as oracledb.DB_TYPE_VARCHAR is not needed by the database layer
+VARCHAR = "DB_TYPE_VARCHAR"
+
+
+class Connection:
+    """Class mimicking an oracledb connection, with a simulated network latency and result shape."""
+
+    def __init__(self, latency: float = 0.001, rows: int = 10000, columns: int = 10, width: int = 20) -> None:
+        """Initialize class.
+
+        Args:
+            latency (float, optional): duration of a round trip, expressed in seconds. Defaults to 0.001.
+            rows (int, optional): number of rows returned by queries. Defaults to 10000.
+            columns (int, optional): number of columns returned by queries. Defaults to 10.
+            width (int, optional): size of each value returned by queries, expressed in characters. Defaults to 20.
+        """
+        self.latency = latency
+        self.rows = rows
+        self.columns = columns
+        self.width = width
+
+        self.round_trips = 0
+        self.call_timeout = 0
+        self.stmtcachesize = 20
+        self.username = "BENCHMARK"
+        self.row = tuple("x" * width for _ in range(columns))
+
+    def round_trip(self) -> None:
+        """Simulate a round trip to the server."""
+        self.round_trips += 1
+        if self.latency:
+            sleep(self.latency)
+
+    def reset(self) -> None:
+        """Reset the round trip counter."""
+        self.round_trips = 0
+
+    @property
+    def description(self) -> list[tuple]:
+        """Cursor description of the generated result, one 7-item sequence per column."""
+        return [(f"COLUMN_{i}", VARCHAR, self.width, self.width * 4, None, None, True) for i in range(1, self.columns + 1)]
+
+    def cursor(self) -> "Cursor":
+        """Open a cursor.
+
+        Returns:
+            Cursor: database cursor.
+        """
+        return Cursor(self)
+
+    def commit(self) -> None:
+        """Commit the transaction."""
+        self.round_trip()
+
+    def rollback(self) -> None:
+        """Roll back the transaction."""
+        self.round_trip()
+
+    def cancel(self) -> None:
+        """Cancel the running call, a no-op as calls run synchronously."""
+
+    def close(self) -> None:
+        """Close the connection."""
+
+    def to_frame(self, rows: int) -> pl.DataFrame:
+        """Generate a result as a Polars DataFrame.
+
+        Args:
+            rows (int): number of rows.
+
+        Returns:
+            pl.DataFrame: generated result.
+        """
+        return pl.DataFrame({column[0]: pl.repeat("x" * self.width, rows, eager=True) for column in self.description})
+
+    def fetch_df_all(self, statement: str, parameters: Any = None, arraysize: int = 100) -> pl.DataFrame:  # noqa: ARG002
+        """Run a query and fetch its result in Arrow format, in as many round trips as the array size requires.
+
+        Args:
+            statement (str): SQL query.
+            parameters (Any, optional): bind parameters, ignored. Defaults to None.
+            arraysize (int, optional): number of rows per fetch round trip. Defaults to 100.
+
+        Returns:
+            pl.DataFrame: generated result.
+        """
+        for _ in range(1 + self.rows // max(arraysize, 1)):
+            self.round_trip()
+        return self.to_frame(self.rows)
+
+    def fetch_df_batches(self, statement: str, parameters: Any = None, size: int = 100) -> Iterator[pl.DataFrame]:  # noqa: ARG002
+        """Run a query and stream its result in Arrow format, one round trip per batch.
+
+        Args:
+            statement (str): SQL query.
+            parameters (Any, optional): bind parameters, ignored. Defaults to None.
+            size (int, optional): number of rows per batch. Defaults to 100.
+
+        Yields:
+            pl.DataFrame: batch of generated rows.
+        """
+        remaining = self.rows
+        while remaining > 0:
+            self.round_trip()
+            yield self.to_frame(min(size, remaining))
+            remaining -= size
+
+    def direct_path_load(self, schema_name: str, table_name: str, column_names: list[str], data: Any) -> None:  # noqa: ARG002
+        """Load rows by direct path, in one round trip.
+
+        Args:
+            schema_name (str): schema name.
+            table_name (str): table name.
+            column_names (list[str]): column names.
+            data (Any): rows, ignored.
+        """
+        self.round_trip()
+
+
+class Cursor:
+    """Class mimicking an oracledb cursor, fetching generated rows by array size."""
+
+    def __init__(self, connection: Connection) -> None:
+        """Initialize class.
+
+        Args:
+            connection (Connection): stand-in connection.
+        """
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowcount = 0
+        self.description: list[tuple] | None = None
+        self.outputtypehandler: Any = None
+
+        # Rows left on the server, and rows already transferred to the client
+        self.remaining = 0
+        self.buffer: deque[tuple] = deque()
+
+    def transfer(self, rows: int) -> None:
+        """Move rows from the server to the client buffer.
+
+        Args:
+            rows (int): number of rows.
+        """
+        rows = min(rows, self.remaining)
+        self.buffer.extend([self.connection.row] * rows)
+        self.remaining -= rows
+
+    def execute(self, statement: str, parameters: Any = None, **kwargs) -> None:  # noqa: ANN003,ARG002
+        """Execute a statement, queries return the prefetched rows with the execute round trip.
+
+        Args:
+            statement (str): SQL statement.
+            parameters (Any, optional): bind parameters, ignored. Defaults to None.
+            **kwargs: keyword bind parameters and options, ignored.
+        """
+        self.connection.round_trip()
+        self.buffer.clear()
+        if match(r"\s*(select|with)\b", statement, IGNORECASE):
+            self.description = self.connection.description
+            self.remaining = self.connection.rows
+            self.rowcount = 0
+            self.transfer(self.prefetchrows)
+        else:
+            self.description = None
+            self.remaining = 0
+            self.rowcount = 1
+
+    def executemany(self, statement: str, parameters: Any, **kwargs) -> None:  # noqa: ANN003,ARG002
+        """Execute a DML statement for many rows, in one round trip.
+
+        Args:
+            statement (str): SQL statement.
+            parameters (Any): bind values, one sequence per row, or a DataFrame.
+            **kwargs: options, ignored.
+        """
+        self.connection.round_trip()
+        self.description = None
+        self.rowcount = len(parameters)
+
+    def getbatcherrors(self) -> list:
+        """Get the errors of the last executemany call, always empty.
+
+        Returns:
+            list: batch errors.
+        """
+        return []
+
+    def fetchmany(self, size: int | None = None) -> list[tuple]:
+        """Fetch rows, one round trip per array size when the client buffer is empty.
+
+        Args:
+            size (int | None, optional): number of rows. Defaults to the array size.
+
+        Returns:
+            list[tuple]: records, empty once the result is exhausted.
+        """
+        size = size or self.arraysize
+        while len(self.buffer) < size and self.remaining > 0:
+            self.connection.round_trip()
+            self.transfer(self.arraysize)
+        rows = [self.buffer.popleft() for _ in range(min(size, len(self.buffer)))]
+        self.rowcount += len(rows)
+        return rows
+
+    def fetchall(self) -> list[tuple]:
+        """Fetch all remaining rows.
+
+        Returns:
+            list[tuple]: records.
+        """
+        return self.fetchmany(len(self.buffer) + self.remaining) if self.buffer or self.remaining else []
+
+    def var(self, *args, **kwargs) -> None:  # noqa: ANN002,ANN003
+        """Create a bind variable, not supported."""
+
+    def close(self) -> None:
+        """Close the cursor."""
+        self.buffer.clear()
+        self.remaining = 0
+
+    def __enter__(self) -> Self:
+        """Enter context.
+
+        Returns:
+            Cursor: this cursor.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit context, closing the cursor."""
+        self.close()
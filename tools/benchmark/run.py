@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Benchmark suite of the database layer, run against the in-process stand-in driver and compared with stored baselines.
+
+Each case reports its throughput, in rows per second, and its number of round trips. Round trips are deterministic and must match the
+baseline exactly. Throughput depends on the machine and its load, so it is only checked on request, on the machine the baselines were
+stored on, and must then stay within a tolerance of them.
+
+Typical usage example:
+    uv run python tools/benchmark/run.py
+    uv run python tools/benchmark/run.py --case select --case select_iter --repeat 10 --throughput
+    uv run python tools/benchmark/run.py --update
+"""
+
+# Standard Library
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from json import dumps, loads
+from os import environ
+from pathlib import Path
+from tempfile import mkdtemp
+from time import perf_counter
+
+# The application configuration is read from the environment, logging is kept quiet and outputs go to a temporary directory
+environ.setdefault("APP_ENV", "development")
+environ.setdefault("INPUT_PATH", mkdtemp(prefix="benchmark-"))
+environ.setdefault("OUTPUT_PATH", environ["INPUT_PATH"])
+environ.setdefault("DATABASE_TNS", "false")
+environ.setdefault("DATABASE_MODE", "thin")
+environ.setdefault("LOG_LEVEL", "WARNING")
+environ.setdefault("LOG_CLOUDEVENTS", "false")
+
+# Stand-in driver
+from driver import Connection
+
+# Local Application
+from app_name.common.config import DevConfig, set_config
+from app_name.database.oracle import Oracle, to_cte_union_rows, to_literal_list
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Shape of the generated results and simulated network latency, changing them invalidates the baselines
+LATENCY = 0.0005
+ROWS = 20000
+COLUMNS = 10
+WIDTH = 20
+LITERALS = 1000
+# Number of renderings of the literal values per run, so that a run of a pure Python case lasts long enough to be measured steadily
+RENDERS = 50
+
+
+def to_database() -> Oracle:
+    """Create an Oracle client connected to a stand-in connection.
+
+    Returns:
+        Oracle: database client.
+    """
+    database = Oracle()
+    database.connection = Connection(latency=LATENCY, rows=ROWS, columns=COLUMNS, width=WIDTH)
+    return database
+
+
+def bench_select(database: Oracle) -> int:
+    """Fetch a whole result at once.
+
+    Args:
+        database (Oracle): database client.
+
+    Returns:
+        int: number of rows processed.
+    """
+    return len(database.select("select * from benchmark"))
+
+
+def bench_select_iter(database: Oracle) -> int:
+    """Stream a result by batches.
+
+    Args:
+        database (Oracle): database client.
+
+    Returns:
+        int: number of rows processed.
+    """
+    return sum(len(rows) for rows in database.select_iter("select * from benchmark", batch_size=1000))
+
+
+def bench_select_df(database: Oracle) -> int:
+    """Fetch a whole result as a Polars DataFrame.
+
+    Args:
+        database (Oracle): database client.
+
+    Returns:
+        int: number of rows processed.
+    """
+    return database.select_df("select * from benchmark").height
+
+
+def bench_insert_many(database: Oracle) -> int:
+    """Insert rows by array DML.
+
+    Args:
+        database (Oracle): database client.
+
+    Returns:
+        int: number of rows processed.
+    """
+    columns = [f"COLUMN_{i}" for i in range(1, COLUMNS + 1)]
+    rows = [database.connection.row] * ROWS
+    return database.insert_many("benchmark", columns, rows, batch_size=1000)
+
+
+def bench_write_df(database: Oracle) -> int:
+    """Insert a Polars DataFrame by array DML.
+
+    Args:
+        database (Oracle): database client.
+
+    Returns:
+        int: number of rows processed.
+    """
+    return database.write_df(database.connection.to_frame(ROWS), "benchmark", buffer_size=1048576)
+
+
+def bench_to_literal_list(database: Oracle) -> int:  # noqa: ARG001
+    """Render values as a SQL literal list.
+
+    Args:
+        database (Oracle): database client, unused.
+
+    Returns:
+        int: number of values processed.
+    """
+    values = [f"value_{i}" for i in range(LITERALS)]
+    for _ in range(RENDERS):
+        to_literal_list(values)
+    return LITERALS * RENDERS
+
+
+def bench_to_cte_union_rows(database: Oracle) -> int:  # noqa: ARG001
+    """Render values as CTE rows.
+
+    Args:
+        database (Oracle): database client, unused.
+
+    Returns:
+        int: number of values processed.
+    """
+    values = [f"value_{i}" for i in range(LITERALS)]
+    for _ in range(RENDERS):
+        to_cte_union_rows(values)
+    return LITERALS * RENDERS
+
+
+CASES: dict[str, Callable[[Oracle], int]] = {
+    "select": bench_select,
+    "select_iter": bench_select_iter,
+    "select_df": bench_select_df,
+    "insert_many": bench_insert_many,
+    "write_df": bench_write_df,
+    "to_literal_list": bench_to_literal_list,
+    "to_cte_union_rows": bench_to_cte_union_rows,
+}
+
+
+def run_case(name: str, repeat: int) -> dict[str, float | int]:
+    """Run a benchmark case, once to warm up adaptive fetch sizing, then as many times as requested.
+
+    Args:
+        name (str): case name.
+        repeat (int): number of measured runs, the fastest one is kept.
+
+    Returns:
+        dict[str, float | int]: best throughput, expressed in rows per second, and round trips of a run.
+    """
+    database = to_database()
+    case = CASES[name]
+    case(database)
+
+    best = 0.0
+    round_trips = 0
+    for _ in range(repeat):
+        database.connection.reset()
+        start = perf_counter()
+        rows = case(database)
+        elapsed = perf_counter() - start
+        best = max(best, rows / elapsed if elapsed else 0)
+        round_trips = database.connection.round_trips
+    return {"rows_per_sec": round(best), "round_trips": round_trips}
+
+
+def compare(results: dict[str, dict], baselines: dict[str, dict], tolerance: float, *, throughput: bool = False) -> list[str]:
+    """Compare results with their baselines, round trips always, throughput on request.
+
+    Args:
+        results (dict[str, dict]): results, per case.
+        baselines (dict[str, dict]): stored baselines, per case.
+        tolerance (float): accepted throughput drop, as a fraction of the baseline.
+        throughput (bool, optional): whether to check throughput. Defaults to False.
+
+    Returns:
+        list[str]: regressions, empty if none.
+    """
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result["round_trips"] != baseline["round_trips"]:
+            regressions.append(f"{name}: {result['round_trips']} round trips, {baseline['round_trips']} expected")
+        if throughput and result["rows_per_sec"] < baseline["rows_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['rows_per_sec']} rows/s, {baseline['rows_per_sec']} expected")
+    return regressions
+
+
+def parse_args() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+    """
+    parser = ArgumentParser(description="Benchmark the database layer against a stand-in driver.")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="case to run, repeatable, all cases by default")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measured runs per case, the fastest one is kept")
+    parser.add_argument("--throughput", action="store_true", help="also check throughput, on the machine the baselines were stored on")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="accepted throughput drop, as a fraction of the baseline")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark cases, print their results, then update or check the baselines."""
+    args = parse_args()
+    set_config(DevConfig())
+
+    baselines = loads(BASELINE_PATH.read_text(encoding="utf-8")) if BASELINE_PATH.is_file() else {}
+    results = {name: run_case(name, args.repeat) for name in args.case or CASES}
+
+    print(f"{'case':<20}{'rows/s':>14}{'baseline':>14}{'round trips':>14}{'baseline':>10}")
+    for name, result in results.items():
+        baseline = baselines.get(name, {})
+        print(f"{name:<20}{result['rows_per_sec']:>14}{baseline.get('rows_per_sec', '-'):>14}{result['round_trips']:>14}{baseline.get('round_trips', '-'):>10}")
+
+    if args.update:
+        BASELINE_PATH.write_text(dumps(baselines | results, indent=2) + "\n", encoding="utf-8")
+        print(f"Baselines stored in {BASELINE_PATH}.")
+        return
+
+    if regressions := compare(results, baselines, args.tolerance, throughput=args.throughput):
+        print("Regressions:", *regressions, sep="\n- ")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()